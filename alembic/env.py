@@ -16,6 +16,9 @@ from app.models.papers import Paper
 from app.models.feature_publication import FeaturePublication
 from app.models.news import News
 from app.models.lab_gallery import LabGallery
+from app.models.image_assets import ImageAsset
+from app.models.archive import ARCHIVE_TABLES
+from app.db.migration_helpers import CHECKPOINT_TABLE_NAME
 
 
 
@@ -41,6 +44,10 @@ target_metadata = Base.metadata
 def get_url():
     return settings.DATABASE_URL
 
+def include_object(object, name, type_, reflected, compare_to):
+    # Backfill checkpoints are created on demand by app/db/migration_helpers.py
+    return not (type_ == "table" and name == CHECKPOINT_TABLE_NAME)
+
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode.
 
@@ -59,6 +66,8 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        include_object=include_object,
+        transaction_per_migration=True,
     )
 
     with context.begin_transaction():
@@ -81,8 +90,13 @@ def run_migrations_online() -> None:
     )
 
     with connectable.connect() as connection:
+        # One transaction per revision: a long data migration commits on its own instead of
+        # holding everything applied before it open, and a failure only rolls back that revision
         context.configure(
-            connection=connection, target_metadata=target_metadata
+            connection=connection,
+            target_metadata=target_metadata,
+            include_object=include_object,
+            transaction_per_migration=True,
         )
 
         with context.begin_transaction():
@@ -0,0 +1,68 @@
+"""composite list indexes
+
+Revision ID: 4c1d7e9a2b30
+Revises:
+Create Date: 2026-10-19 10:12:41.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4c1d7e9a2b30'
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (index name, table, columns) covering `WHERE is_deleted = false ORDER BY order ASC, created_at DESC`
+# and the status / job_id / subject variants used by the list endpoints.
+INDEXES = [
+    ("ix_news_list_order", "news", ["is_deleted", "order", "created_at DESC"]),
+    ("ix_team_members_list_order", "team_members", ["is_deleted", "order", "created_at DESC"]),
+    ("ix_lab_gallery_list_order", "lab_gallery", ["is_deleted", "order", "created_at DESC"]),
+    ("ix_papers_list_order", "papers", ["is_deleted", "order", "created_at DESC"]),
+    ("ix_feature_publication_list_order", "feature_publication", ["is_deleted", "order", "created_at DESC"]),
+    ("ix_jobs_list_order", "jobs", ["is_deleted", "order", "created_at DESC"]),
+    ("ix_jobs_status_list_order", "jobs", ["is_deleted", "status", "order", "created_at DESC"]),
+    ("ix_job_applicants_job_created_at", "job_applicants", ["job_id", "created_at DESC"]),
+    ("ix_job_applicants_created_at", "job_applicants", ["created_at DESC"]),
+    ("ix_contact_inquiries_list_order", "contact_inquiries", ["is_deleted", "created_at DESC"]),
+    ("ix_contact_inquiries_subject_list_order", "contact_inquiries", ["is_deleted", "subject", "created_at DESC"]),
+]
+
+
+def _columns(columns):
+    quote = op.get_bind().dialect.identifier_preparer.quote
+    result = []
+    for column in columns:
+        name, _, direction = column.partition(" ")
+        result.append(sa.text(f"{quote(name)} {direction}".strip()))
+    return result
+
+
+def _existing_indexes(inspector, table):
+    return {index["name"] for index in inspector.get_indexes(table)}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    inspector = sa.inspect(op.get_bind())
+    tables = set(inspector.get_table_names())
+    for name, table, columns in INDEXES:
+        # Tables created with `create_all` after this change already have the indexes.
+        if table not in tables or name in _existing_indexes(inspector, table):
+            continue
+        op.create_index(name, table, _columns(columns))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    inspector = sa.inspect(op.get_bind())
+    tables = set(inspector.get_table_names())
+    for name, table, _ in reversed(INDEXES):
+        if table in tables and name in _existing_indexes(inspector, table):
+            op.drop_index(name, table_name=table)
@@ -0,0 +1,54 @@
+"""archive tables
+
+Revision ID: 8e2f5a61c0d4
+Revises: 4c1d7e9a2b30
+Create Date: 2026-10-19 11:04:27.902115
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.models.archive import build_archive_table
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8e2f5a61c0d4'
+down_revision: Union[str, Sequence[str], None] = '4c1d7e9a2b30'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Hot tables that get a `<table>_archive` copy
+ARCHIVED_TABLES = [
+    "contact_inquiries",
+    "job_applicants",
+    "jobs",
+    "news",
+    "team_members",
+    "lab_gallery",
+    "papers",
+    "feature_publication",
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    bind = op.get_bind()
+    existing = set(sa.inspect(bind).get_table_names())
+    metadata = sa.MetaData()
+    for name in ARCHIVED_TABLES:
+        if name not in existing or f"{name}_archive" in existing:
+            continue
+        # Built from the live table so the archive matches the columns actually deployed
+        hot = sa.Table(name, metadata, autoload_with=bind)
+        build_archive_table(hot, metadata).create(bind)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    existing = set(sa.inspect(op.get_bind()).get_table_names())
+    for name in reversed(ARCHIVED_TABLES):
+        if f"{name}_archive" in existing:
+            op.drop_table(f"{name}_archive")
@@ -0,0 +1,48 @@
+"""image assets
+
+Revision ID: b7d3e1f09a6c
+Revises: 8e2f5a61c0d4
+Create Date: 2026-10-19 14:22:05.613804
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d3e1f09a6c'
+down_revision: Union[str, Sequence[str], None] = '8e2f5a61c0d4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if "image_assets" in sa.inspect(op.get_bind()).get_table_names():
+        return
+    op.create_table(
+        "image_assets",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("sha256", sa.String(length=64), nullable=False),
+        sa.Column("filename", sa.String(length=255), nullable=False),
+        sa.Column("stage", sa.String(length=50), nullable=True),
+        sa.Column("size", sa.Integer(), nullable=False),
+        sa.Column("ref_count", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("filename"),
+    )
+    op.create_index(op.f("ix_image_assets_id"), "image_assets", ["id"], unique=False)
+    op.create_index(op.f("ix_image_assets_sha256"), "image_assets", ["sha256"], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if "image_assets" not in sa.inspect(op.get_bind()).get_table_names():
+        return
+    op.drop_index(op.f("ix_image_assets_sha256"), table_name="image_assets")
+    op.drop_index(op.f("ix_image_assets_id"), table_name="image_assets")
+    op.drop_table("image_assets")
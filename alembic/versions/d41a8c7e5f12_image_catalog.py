@@ -0,0 +1,46 @@
+"""image catalog
+
+Revision ID: d41a8c7e5f12
+Revises: b7d3e1f09a6c
+Create Date: 2026-10-19 15:40:18.274391
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd41a8c7e5f12'
+down_revision: Union[str, Sequence[str], None] = 'b7d3e1f09a6c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _existing_indexes():
+    return {index["name"] for index in sa.inspect(op.get_bind()).get_indexes("image_assets")}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Legacy files registered by scripts/reconcile_images.py whose content is already stored
+    # under another name keep their own row with no hash
+    with op.batch_alter_table("image_assets") as batch_op:
+        batch_op.alter_column("sha256", existing_type=sa.String(length=64), nullable=True)
+    if "ix_image_assets_list_order" not in _existing_indexes():
+        op.create_index(
+            "ix_image_assets_list_order",
+            "image_assets",
+            [sa.text("created_at DESC"), sa.text("id DESC")]
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if "ix_image_assets_list_order" in _existing_indexes():
+        op.drop_index("ix_image_assets_list_order", table_name="image_assets")
+    # Catalog-only rows; reconcile_images.py registers the files again
+    op.execute("DELETE FROM image_assets WHERE sha256 IS NULL")
+    with op.batch_alter_table("image_assets") as batch_op:
+        batch_op.alter_column("sha256", existing_type=sa.String(length=64), nullable=False)
@@ -0,0 +1,36 @@
+"""image asset variants
+
+Revision ID: e8b4f2a9c613
+Revises: d41a8c7e5f12
+Create Date: 2026-10-19 18:05:42.519306
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e8b4f2a9c613'
+down_revision: Union[str, Sequence[str], None] = 'd41a8c7e5f12'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _existing_columns():
+    return {column["name"] for column in sa.inspect(op.get_bind()).get_columns("image_assets")}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Filled by new uploads; scripts/reconcile_images.py copies existing manifests from disk
+    if "variants" not in _existing_columns():
+        op.add_column("image_assets", sa.Column("variants", sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if "variants" in _existing_columns():
+        with op.batch_alter_table("image_assets") as batch_op:
+            batch_op.drop_column("variants")
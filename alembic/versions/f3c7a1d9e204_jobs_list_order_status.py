@@ -0,0 +1,64 @@
+"""jobs list order status
+
+Revision ID: f3c7a1d9e204
+Revises: e8b4f2a9c613
+Create Date: 2026-10-19 19:22:17.640381
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3c7a1d9e204'
+down_revision: Union[str, Sequence[str], None] = 'e8b4f2a9c613'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _columns(columns):
+    quote = op.get_bind().dialect.identifier_preparer.quote
+    result = []
+    for column in columns:
+        name, _, direction = column.partition(" ")
+        result.append(sa.text(f"{quote(name)} {direction}".strip()))
+    return result
+
+
+def _jobs_table_exists() -> bool:
+    return "jobs" in sa.inspect(op.get_bind()).get_table_names()
+
+
+def _list_order_columns():
+    for index in sa.inspect(op.get_bind()).get_indexes("jobs"):
+        if index["name"] == "ix_jobs_list_order":
+            return index["column_names"]
+    return None
+
+
+def _recreate_list_order(columns) -> None:
+    if _list_order_columns() is not None:
+        op.drop_index("ix_jobs_list_order", table_name="jobs")
+    op.create_index("ix_jobs_list_order", "jobs", _columns(columns))
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Tables created with `create_all` after this change already have the new index.
+    if not _jobs_table_exists():
+        return
+    # The public list filters `status IN ('open', 'closed')`, a range on ix_jobs_status_list_order
+    # that can't give the order columns sorted. Carrying status in the ordered index lets it be
+    # read in order with the status checked in the index.
+    if "status" not in (_list_order_columns() or []):
+        _recreate_list_order(["is_deleted", "order", "created_at DESC", "status"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if not _jobs_table_exists():
+        return
+    if "status" in (_list_order_columns() or []):
+        _recreate_list_order(["is_deleted", "order", "created_at DESC"])
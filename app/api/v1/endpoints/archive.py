@@ -0,0 +1,55 @@
+from typing import List, Optional
+from fastapi import APIRouter, Depends, Query
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session
+from app.core.responses import build_page_info
+from app.db.database import get_db
+from app.schemas.archive import ArchiveRunResponse, ArchiveTable
+from app.services.archive import archive_soft_deleted, list_archived, restore_item
+from app.services.auth import get_current_admin
+
+router = APIRouter()
+
+
+@router.post("/run", response_model=ArchiveRunResponse)
+async def run_archival(
+    tables: Optional[List[ArchiveTable]] = Query(None, description="Tables to archive, defaults to all"),
+    older_than_days: Optional[int] = Query(None, ge=0, description="Defaults to ARCHIVE_AFTER_DAYS"),
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_admin)
+):
+    """
+    Move rows soft-deleted longer than the retention period into the archive tables (Admin only)
+    """
+    names = [table.value for table in tables] if tables else None
+    archived = await run_in_threadpool(archive_soft_deleted, db, older_than_days, None, names)
+    return {"archived": archived}
+
+
+@router.get("/{table}")
+async def get_archived_items(
+    table: ArchiveTable,
+    page: int = Query(1, ge=1, description="Page number"),
+    size: int = Query(10, ge=1, le=100, description="Max number of items to return"),
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_admin)
+):
+    """
+    List archived rows of a table, most recently archived first (Admin only)
+    """
+    items, total = await run_in_threadpool(list_archived, db, table.value, page, size)
+    return {"items": items, "page_info": build_page_info(total, page, size)}
+
+
+@router.post("/{table}/{item_id}/restore")
+async def restore_archived_item(
+    table: ArchiveTable,
+    item_id: int,
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_admin)
+):
+    """
+    Undelete an item, moving it back into the live table if it was archived (Admin only)
+    """
+    await run_in_threadpool(restore_item, db, table.value, item_id)
+    return {"message": "Item restored successfully"}
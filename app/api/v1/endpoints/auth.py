@@ -5,7 +5,7 @@ from sqlalchemy.orm import Session
 from app.db.database import get_db
 from app.models.user import User
 from app.services.auth import (
-    verify_password,
+    verify_password_async,
     create_access_token,
     get_current_user,
     get_current_active_user,
@@ -22,7 +22,7 @@ async def login(
     db: Session = Depends(get_db)
 ):
     user = db.query(User).filter(User.primary_email == form_data.username).first()
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    if not user or not await verify_password_async(form_data.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -1,7 +1,6 @@
 from datetime import datetime, timezone
 from typing import Optional
-from math import ceil
-from fastapi import APIRouter, Depends, HTTPException, status, Query, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, status, Query, BackgroundTasks, Request
 from sqlalchemy.orm import Session
 from sqlalchemy import and_
 from app.db.database import get_db
@@ -14,9 +13,10 @@ from app.schemas.contact import (
     ContactInfoResponse,
     ContactSubjectEnum
 )
-from app.schemas.pagination import PaginationParams, PageInfo
+from app.core.responses import paginated_response
 from app.services.auth import get_current_admin
 from app.services.email import send_contact_inquiry_notification
+from app.services.rate_limit import enforce_rate_limit
 from app.core.config import settings
 from app.core.logging_config import setup_logging
 
@@ -27,12 +27,16 @@ router = APIRouter()
 async def submit_contact_form(
     contact_data: ContactFormCreate,
     background_tasks: BackgroundTasks,
+    request: Request,
     db: Session = Depends(get_db)
 ):
     """
     Submit a new contact inquiry (Public endpoint)
     Sends email notification to admin if ADMIN_NOTIFICATION_EMAIL is configured.
+    Rate limited per client IP and email (RATE_LIMITS["contact_submit"]).
     """
+    await enforce_rate_limit(request, "contact_submit", email=contact_data.email)
+
     try:
         # Create new contact inquiry
         contact_inquiry = ContactInquiry(
@@ -105,29 +109,10 @@ async def get_all_inquiries(
         # Get total count
         total_items = query.count()
         
-        # Calculate total pages
-        total_pages = ceil(total_items / size)
-        
         # Apply pagination
         inquiries = query.offset((page - 1) * size).limit(size).all()
         
-        # Convert to response models
-        items = [ContactInquiryResponse.model_validate(inquiry) for inquiry in inquiries]
-        
-        # Create page info
-        page_info = PageInfo(
-            total=total_items,
-            page=page,
-            size=size,
-            total_pages=total_pages,
-            has_next=page < total_pages,
-            has_previous=page > 1
-        )
-        
-        return ContactInquiryListResponse(
-            items=items,
-            page_info=page_info
-        )
+        return paginated_response(ContactInquiryResponse, inquiries, total_items, page, size)
     
     except Exception as e:
         db.rollback()
@@ -1,34 +1,71 @@
 from datetime import datetime, timezone
 from typing import Optional
-from math import ceil
 from pathlib import Path
+import logging
 import os
-from app.services.image_upload import upload_image
-from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile, File,Form
+from app.services.image_upload import release_image, upload_image
+from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile, File,Form, BackgroundTasks
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import and_, select, func
 from app.db.database import get_db
+from app.db.replicas import get_async_read_db
 from app.models.feature_publication import FeaturePublication
 from app.schemas.feature_publication import (
     DOIFeaturePublicationCreate,
     ManualFeaturePublicationCreate,
     FeaturePublicationUpdate,
     FeaturePublicationResponse,
-    PubmedFeaturePublicationCreate
+    PubmedFeaturePublicationCreate,
+    ReorderFeaturePublicationRequest
 )
-from app.schemas.pagination import PageInfo, PaginatedResponse
+from app.schemas.pagination import PaginatedResponse
+from app.core.responses import paginated_response
 from app.services.auth import get_current_active_user
 from app.models.user import User
 from app.services.papers import doi_fetch, e_fetch
-from app.services.reorder import reorder_item
+from app.schemas.ordering import ApplyOrderingRequest
+from app.services.image_catalog import with_image_variants
+from app.services.reorder import add_ordered_item, apply_ordering, reorder_item, with_order_position
 from app.core.config import settings
 
 router = APIRouter()
+logger = logging.getLogger("fastapi")
 
 
+@router.put("/reorder")
+async def apply_feature_publication_ordering(
+    payload: ApplyOrderingRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Set the order of all feature publications at once from the full list of ids (Authenticated users only).
+    """
+    await run_in_threadpool(apply_ordering, db, FeaturePublication, payload.ids)
+    await run_in_threadpool(db.commit)
+    return {"message": "Feature publications reordered successfully"}
+
+@router.put("/reorder/{publication_id}")
+async def reorder_feature_publication(
+    publication_id: int,
+    request: ReorderFeaturePublicationRequest,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Move a feature publication to a new position (Authenticated users only).
+    """
+    reorder_item(db, FeaturePublication, publication_id, request.order, background_tasks)
+    db.commit()
+    return {"message": "Feature publication reordered successfully"}
+
 @router.post("/add/manual")
 async def add_feature_publication_manual(
     publication_data: ManualFeaturePublicationCreate,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
@@ -40,7 +77,7 @@ async def add_feature_publication_manual(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="DOI or PubMED ID is required"
         )
-    if publication_data.order < 1:
+    if publication_data.order is not None and publication_data.order < 1:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Order must be greater than 0"
@@ -57,12 +94,11 @@ async def add_feature_publication_manual(
             nct_number=publication_data.nct_number,
             doi=publication_data.doi,
             is_presentation=publication_data.is_presentation,
-            order=publication_data.order,
             is_open=publication_data.is_open,
             image_url=publication_data.image_url if publication_data.image_url else None,
         )
 
-        db.add(feature_publication)
+        add_ordered_item(db, FeaturePublication, feature_publication, publication_data.order, background_tasks)
         db.commit()
         db.refresh(feature_publication)
 
@@ -81,6 +117,7 @@ async def add_feature_publication_manual(
 @router.post("/add/doi")
 async def add_feature_publication_by_doi(
     paper: DOIFeaturePublicationCreate,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
@@ -108,7 +145,7 @@ async def add_feature_publication_by_doi(
         comma_separated_authors = res[0]['authors'].replace(';', ',')
         publish_date2 = res[0]['pub_date']
 
-        if paper.order < 1:
+        if paper.order is not None and paper.order < 1:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Order must be greater than 0"
@@ -124,12 +161,11 @@ async def add_feature_publication_by_doi(
             journal=res[0]['journal'],
             doi=paper.doi,
             is_presentation=paper.is_presentation,
-            order=paper.order,
             is_open=paper.is_open,
             image_url=paper.image_url if paper.image_url else None,
         )
 
-        db.add(db_publication)
+        add_ordered_item(db, FeaturePublication, db_publication, paper.order, background_tasks)
         db.commit()
         db.refresh(db_publication)
 
@@ -150,6 +186,7 @@ async def add_feature_publication_by_doi(
 @router.post("/add/pubmed")
 async def add_feature_publication_by_pubmed_id(
     paper: PubmedFeaturePublicationCreate,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
@@ -168,7 +205,7 @@ async def add_feature_publication_by_pubmed_id(
         publish_date2 = paper_data['date_pub']
         authers2 = ", ".join(author['name'] for author in paper_data['authors'])
 
-        if paper.order < 1:
+        if paper.order is not None and paper.order < 1:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Order must be greater than 0"
@@ -182,12 +219,11 @@ async def add_feature_publication_by_pubmed_id(
             authers=authers2,
             pubmed_id=paper.pm_id,
             is_presentation=paper.is_presentation,
-            order=paper.order,
             is_open=paper.is_open,
             image_url=paper.image_url if paper.image_url else None,
         )
 
-        db.add(db_publication)
+        add_ordered_item(db, FeaturePublication, db_publication, paper.order, background_tasks)
         db.commit()
         db.refresh(db_publication)
 
@@ -210,49 +246,35 @@ async def list_feature_publications(
     page: int = Query(1, description="Page number"),
     size: int = Query(10, description="Max number of items to return"),
     search: Optional[str] = Query(None, description="Search by title"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     """
     List all feature publications with pagination (Public endpoint)
     """
     try:
         # Build query with soft delete filter
-        query = db.query(FeaturePublication).filter(
+        query = select(FeaturePublication).where(
             FeaturePublication.is_deleted == False
         )
         
         # Apply search filter if provided
         if search:
-            query = query.filter(
+            query = query.where(
                 FeaturePublication.title.ilike(f"%{search}%")
             )
         
-        # Order by order field
-        query = query.order_by(FeaturePublication.order.asc(), FeaturePublication.created_at.desc())
-        
         # Get total count
-        total_items = query.count()
+        total_items = await db.scalar(select(func.count()).select_from(query.subquery()))
         
-        # Calculate total pages
-        total_pages = ceil(total_items / size) if total_items > 0 else 0
+        # Order by order field
+        query = query.order_by(FeaturePublication.order.asc(), FeaturePublication.created_at.desc())
         
         # Apply pagination
-        publications = query.offset((page - 1) * size).limit(size).all()
-        
-        # Create page info
-        page_info = PageInfo(
-            total=total_items,
-            page=page,
-            size=size,
-            total_pages=total_pages,
-            has_next=page < total_pages,
-            has_previous=page > 1
-        )
+        publications = (await db.scalars(
+            query.options(with_order_position(FeaturePublication), with_image_variants(FeaturePublication)).offset((page - 1) * size).limit(size)
+        )).all()
         
-        return PaginatedResponse(
-            items=publications,
-            page_info=page_info
-        )
+        return paginated_response(FeaturePublicationResponse, publications, total_items, page, size)
     
     except Exception as e:
         raise HTTPException(
@@ -264,15 +286,17 @@ async def list_feature_publications(
 @router.get("/{publication_id}/get", response_model=FeaturePublicationResponse)
 async def get_feature_publication(
     publication_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     """
     Get a feature publication by ID (Public endpoint)
     """
-    publication = db.query(FeaturePublication).filter(
-        FeaturePublication.id == publication_id,
-        FeaturePublication.is_deleted == False
-    ).first()
+    publication = await db.scalar(
+        select(FeaturePublication).where(
+            FeaturePublication.id == publication_id,
+            FeaturePublication.is_deleted == False
+        ).options(with_order_position(FeaturePublication), with_image_variants(FeaturePublication))
+    )
     
     if not publication:
         raise HTTPException(
@@ -287,6 +311,7 @@ async def get_feature_publication(
 async def update_feature_publication(
     publication_id: int,
     publication_data: FeaturePublicationUpdate,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
@@ -334,7 +359,7 @@ async def update_feature_publication(
     if publication_data.image_url is not None:
         publication.image_url = publication_data.image_url
     if publication_data.order is not None:
-        publication.order = publication_data.order
+        reorder_item(db, FeaturePublication, publication_id, publication_data.order, background_tasks)
     
     publication.updated_at = datetime.now(timezone.utc)
     db.commit()
@@ -402,13 +427,11 @@ async def delete_image(
     
     try:
         image_path = publication.image_url
-        file_to_delete = Path(image_path)
         
-        if file_to_delete.exists():
-            try:
-                file_to_delete.unlink()
-            except Exception as e:
-                print(f"Warning: unable to delete file {image_path}: {e}")
+        try:
+            await run_in_threadpool(release_image, db, image_path)
+        except Exception:
+            logger.exception(f"Failed to release image {image_path}")
         
         # Clear image_url in database
         publication.image_url = ""
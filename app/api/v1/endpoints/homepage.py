@@ -0,0 +1,44 @@
+from typing import List, Optional
+from fastapi import APIRouter, HTTPException, status, Query
+from app.core.config import settings
+from app.core.responses import model_response
+from app.schemas.homepage import HomepageResponse, HomepageSection
+from app.services.homepage import get_homepage_sections
+
+router = APIRouter()
+
+
+@router.get("", response_model=HomepageResponse)
+async def get_homepage(
+    sections: Optional[List[HomepageSection]] = Query(None, description="Sections to include. Defaults to HOMEPAGE_SECTIONS"),
+    limit: Optional[int] = Query(None, ge=1, le=50, description="Number of items per section"),
+    news_limit: Optional[int] = Query(None, ge=1, le=50, description="Override the number of news items"),
+    feature_publication_limit: Optional[int] = Query(None, ge=1, le=50, description="Override the number of feature publications"),
+    team_limit: Optional[int] = Query(None, ge=1, le=50, description="Override the number of team members"),
+    lab_gallery_limit: Optional[int] = Query(None, ge=1, le=50, description="Override the number of lab gallery items"),
+):
+    """
+    Get the first items of every landing page section in one response (public endpoint).
+    Sections are fetched concurrently and cached for HOMEPAGE_CACHE_TTL_SECONDS.
+    """
+    if sections is None:
+        try:
+            sections = [HomepageSection(section) for section in settings.HOMEPAGE_SECTIONS]
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Invalid HOMEPAGE_SECTIONS. Must be a subset of: {[s.value for s in HomepageSection]}"
+            )
+
+    default_limit = limit or settings.HOMEPAGE_SECTION_LIMIT
+    overrides = {
+        HomepageSection.NEWS: news_limit,
+        HomepageSection.FEATURE_PUBLICATION: feature_publication_limit,
+        HomepageSection.TEAM: team_limit,
+        HomepageSection.LAB_GALLERY: lab_gallery_limit,
+    }
+    limits = {section: overrides[section] or default_limit for section in dict.fromkeys(sections)}
+
+    results = await get_homepage_sections(limits)
+    unrequested = set(HomepageResponse.model_fields) - set(results)
+    return model_response(HomepageResponse.model_construct(**results), exclude=unrequested)
@@ -1,15 +1,16 @@
 from datetime import datetime, timezone
-import os
 from typing import Optional
-from math import ceil
 import uuid
 from app.core.config import settings
-from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile, File, Form, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile, File, Form, BackgroundTasks, Request
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import and_, select, func
 from email_validator import validate_email, EmailNotValidError
 
 from app.db.database import get_db
+from app.db.replicas import get_async_read_db
 from app.models.jobs import Job
 from app.models.job_applicants import JobApplicant
 from app.schemas.jobs import (
@@ -20,24 +21,59 @@ from app.schemas.jobs import (
     JobStatusEnum,
     ReorderJobRequest
 )
-from app.schemas.pagination import PageInfo, PaginatedResponse
+from app.schemas.pagination import PaginatedResponse
+from app.core.responses import paginated_response
+from app.schemas.bulk import BulkRequest, BulkResponse
+from app.services.bulk import BulkResource, apply_bulk_operations
 from app.services.auth import get_current_admin
+from app.services.cv_downloads import cv_download_url, cv_file_response, verify_cv_download_token
 from app.services.file_upload import save_cv_file
-from app.services.reorder import reorder_item
+from app.schemas.ordering import ApplyOrderingRequest
+from app.services.reorder import add_ordered_item, apply_ordering, reorder_item, with_order_position
 from app.services.email import send_job_application_notification
+from app.services.rate_limit import enforce_rate_limit
+from app.services.uploads import stream_upload_to_path, validate_extension
 
 router = APIRouter()
 
+JOBS_BULK = BulkResource(model=Job, create_schema=JobCreate, update_schema=JobUpdate)
+
+
+@router.post("/bulk", response_model=BulkResponse)
+async def bulk_jobs(
+    payload: BulkRequest,
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_admin)
+):
+    """
+    Apply create / update / delete operations to many job postings (admin only).
+    """
+    return await run_in_threadpool(apply_bulk_operations, db, JOBS_BULK, payload.operations)
+
+@router.put("/reorder")
+async def apply_jobs_ordering(
+    payload: ApplyOrderingRequest,
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_admin)
+):
+    """
+    Set the order of all job postings at once from the full list of ids (admin only).
+    """
+    await run_in_threadpool(apply_ordering, db, Job, payload.ids)
+    await run_in_threadpool(db.commit)
+    return {"message": "Jobs reordered successfully"}
+
 @router.post("/create_job")
 async def create_job(
     job_data: JobCreate,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user = Depends(get_current_admin)
 ):
     """
     Create a new job posting (admin only).
     """
-    if job_data.order < 1:
+    if job_data.order is not None and job_data.order < 1:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Order must be greater than 0"
@@ -52,11 +88,10 @@ async def create_job(
         visa_type=job_data.visa_type,
         job_tenure=job_data.job_tenure,
         required_qualifications=job_data.required_qualifications,
-        preferred_qualifications=job_data.preferred_qualifications,
-        order=job_data.order
+        preferred_qualifications=job_data.preferred_qualifications
     )
-    
-    db.add(job)
+
+    add_ordered_item(db, Job, job, job_data.order, background_tasks)
     db.commit()
     db.refresh(job)
     
@@ -68,40 +103,34 @@ async def list_jobs(
     size: int = Query(10, ge=1, le=100, description="Number of items per page"),
     is_public: bool = Query(True, description="Whether to return all (open,closed,draft) jobs or only open and closed jobs"),
     status_filter: Optional[JobStatusEnum] = Query(None, description="Filter by job status"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     """
     List all open jobs (public endpoint).
     Returns only jobs with status='open' and is_deleted=False.
     """
-    query = db.query(Job).filter(
+    query = select(Job).where(
         Job.is_deleted == False
     )
     
     if is_public:
-        query = query.filter(Job.status.in_([JobStatusEnum.open, JobStatusEnum.closed]))
+        query = query.where(Job.status.in_([JobStatusEnum.open, JobStatusEnum.closed]))
     else:
-        query = query.filter(Job.status.in_([JobStatusEnum.open, JobStatusEnum.closed, JobStatusEnum.draft]))
+        query = query.where(Job.status.in_([JobStatusEnum.open, JobStatusEnum.closed, JobStatusEnum.draft]))
 
 
     if status_filter:
-        query = query.filter(Job.status == status_filter)
+        query = query.where(Job.status == status_filter)
 
-    total_items = query.count()
-    total_pages = ceil(total_items / size) if total_items > 0 else 0
+    total_items = await db.scalar(select(func.count()).select_from(query.subquery()))
 
-    items = query.order_by(Job.order.asc(), Job.created_at.desc()).offset((page - 1) * size).limit(size).all()
+    items = (await db.scalars(
+        query.order_by(Job.order.asc(), Job.created_at.desc())
+        .options(with_order_position(Job))
+        .offset((page - 1) * size).limit(size)
+    )).all()
     
-    page_info = PageInfo(
-        total=total_items,
-        page=page,
-        size=size,
-        total_pages=total_pages,
-        has_next=page < total_pages,
-        has_previous=page > 1
-    )
-    
-    return PaginatedResponse(items=items, page_info=page_info)
+    return paginated_response(JobResponse, items, total_items, page, size)
 
 
 @router.get("/applications", response_model=PaginatedResponse[JobApplicationResponse])
@@ -134,35 +163,56 @@ async def list_job_applications(
 
     # Get total count
     total_items = query.count()
-    total_pages = ceil(total_items / size) if total_items > 0 else 0
 
     # Apply pagination
     items = query.order_by(JobApplicant.created_at.desc()).offset((page - 1) * size).limit(size).all()
+    for application in items:
+        # Plain (unmapped) attribute, read by JobApplicationResponse in the single validation pass
+        application.cv_download_url = cv_download_url(application.id)
 
-    page_info = PageInfo(
-        total=total_items,
-        page=page,
-        size=size,
-        total_pages=total_pages,
-        has_next=page < total_pages,
-        has_previous=page > 1
-    )
+    return paginated_response(JobApplicationResponse, items, total_items, page, size)
+
+
+@router.get("/applications/{application_id}/cv")
+async def download_application_cv(
+    application_id: int,
+    token: str = Query(..., description="Signed download token (from cv_download_url)"),
+    db: Session = Depends(get_db)
+):
+    """
+    Download an applicant's CV through a signed, expiring link (cv_download_url in the
+    application listing, or the notification email). Supports Range requests.
+    """
+    verify_cv_download_token(token, application_id)
+
+    application = db.query(JobApplicant).filter(
+        JobApplicant.id == application_id,
+        JobApplicant.is_deleted == False
+    ).first()
+
+    if not application:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Application not found"
+        )
 
-    return PaginatedResponse(items=items, page_info=page_info)
+    return cv_file_response(application)
 
 
 @router.get("/{job_id}", response_model=JobResponse)
 async def get_job(
     job_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     """
     Get a single job by ID (public endpoint).
     """
-    job = db.query(Job).filter(
-        Job.id == job_id,
-        Job.is_deleted == False
-        ).first()
+    job = await db.scalar(
+        select(Job).where(
+            Job.id == job_id,
+            Job.is_deleted == False
+        ).options(with_order_position(Job))
+    )
     
     if not job:
         raise HTTPException(
@@ -180,6 +230,7 @@ async def get_job(
 async def update_job(
     job_id: int,
     job_data: JobUpdate,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user = Depends(get_current_admin)
 ):
@@ -225,7 +276,7 @@ async def update_job(
     if job_data.preferred_qualifications is not None:
         job.preferred_qualifications = job_data.preferred_qualifications
     if job_data.order is not None:
-        job.order = job_data.order
+        reorder_item(db, Job, job_id, job_data.order, background_tasks)
     
     job.updated_at = datetime.now(timezone.utc)
     db.commit()
@@ -266,6 +317,7 @@ async def delete_job(
 async def apply_to_job(
     job_id: int,
     background_tasks: BackgroundTasks,
+    request: Request,
     full_name: str = Form(..., min_length=1, max_length=255),
     email: str = Form(...),
     phone: Optional[str] = Form(None, max_length=50),
@@ -275,7 +327,10 @@ async def apply_to_job(
 ):
     """
     Apply to a job with CV upload (public endpoint).
+    Rate limited per client IP and email (RATE_LIMITS["job_apply"]); the IP limit is applied by
+    RateLimitMiddleware before the CV is read.
     """
+    await enforce_rate_limit(request, "job_apply", email=email, by_ip=False)
 
     try:
         validate_email(email)
@@ -299,39 +354,21 @@ async def apply_to_job(
             detail="Job not found or not accepting applications"
         )
 
-    file_ext = os.path.splitext(cv.filename)[1].lower()
-
-    if file_ext not in settings.ALLOWED_CV_EXTENSIONS:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Only PDF or Word documents are allowed"
-        )
-
-    contents = await cv.read()
-
-    if len(contents) > settings.CV_MAX_FILE_SIZE:
-        raise HTTPException(
-            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-            detail="CV file is too large"
-        )
-
-    job_dir = settings.CV_UPLOAD_DIR / str(job_id)
-    job_dir.mkdir(parents=True, exist_ok=True)
+    file_ext = validate_extension(cv.filename, settings.ALLOWED_CV_EXTENSIONS, "Only PDF or Word documents are allowed")
 
     filename = f"{uuid.uuid4()}{file_ext}"
-    file_path = job_dir / filename
+    file_path = settings.CV_UPLOAD_DIR / str(job_id) / filename
 
     try:
-        with open(file_path, "wb") as f:
-            f.write(contents)
+        await stream_upload_to_path(cv, file_path, settings.CV_MAX_FILE_SIZE, too_large_detail="CV file is too large")
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to save CV file: {str(e)}"
         )
 
-    cv_public_url = f"/cv_uploads/{job_id}/{filename}"
-
     try:
         application = JobApplicant(
             job_id=job_id,
@@ -339,7 +376,7 @@ async def apply_to_job(
             email=email,
             phone=phone,
             cover_letter=cover_letter,
-            cv_file_path=cv_public_url
+            cv_file_path=file_path.as_posix()
         )
 
         db.add(application)
@@ -349,7 +386,7 @@ async def apply_to_job(
         # Notify admins in background (same list as contact inquiry)
         background_tasks.add_task(
             send_job_application_notification,
-            job_id=job_id,
+            application_id=application.id,
             job_title=job.title,
             full_name=full_name,
             email=email,
@@ -372,77 +409,17 @@ async def apply_to_job(
         )
 
 
-# @router.put("/reorder/{job_id}")
-# async def reorder_job(
-#     job_id: int,
-#     request: ReorderJobRequest,
-#     db: Session = Depends(get_db),
-#     current_user = Depends(get_current_admin)
-# ):
-#     """
-#     Reorder a job (admin only)
-#     """
-#     job = db.query(Job).filter(
-#         Job.id == job_id,
-#         Job.is_deleted == False
-#     ).first()
-    
-#     if not job:
-#         raise HTTPException(
-#             status_code=status.HTTP_404_NOT_FOUND,
-#             detail="Job not found"
-#         )
-    
-#     # Get all siblings (all non-deleted jobs)
-#     siblings = db.query(Job).filter(
-#         Job.is_deleted == False,
-#         Job.id != job_id
-#     ).order_by(Job.order).all()
-    
-#     max_order = len(siblings) + 1
-    
-#     if request.order <= 0 or request.order > max_order:
-#         raise HTTPException(
-#             status_code=status.HTTP_400_BAD_REQUEST,
-#             detail=f"Order must be between 1 and {max_order}"
-#         )
-    
-#     if request.order == job.order:
-#         return {"message": "Job is already at the desired order"}
-    
-#     try:
-#         if request.order > job.order:
-#             # Moving forward - decrease order of items between old and new position
-#             affected_items = db.query(Job).filter(
-#                 Job.is_deleted == False,
-#                 Job.id != job_id,
-#                 Job.order > job.order,
-#                 Job.order <= request.order
-#             ).order_by(Job.order).all()
-            
-#             for item in affected_items:
-#                 item.order -= 1
-#         else:
-#             # Moving backward - increase order of items between new and old position
-#             affected_items = db.query(Job).filter(
-#                 Job.is_deleted == False,
-#                 Job.id != job_id,
-#                 Job.order >= request.order,
-#                 Job.order < job.order
-#             ).order_by(Job.order).all()
-            
-#             for item in affected_items:
-#                 item.order += 1
-        
-#         job.order = request.order
-        
-#         db.commit()
-#         return {"message": "Job reordered successfully"}
-        
-#     except Exception as e:
-#         db.rollback()
-#         raise HTTPException(
-#             status_code=status.HTTP_400_BAD_REQUEST,
-#             detail=str(e)
-#         )
-
+@router.put("/reorder/{job_id}")
+async def reorder_job(
+    job_id: int,
+    request: ReorderJobRequest,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_admin)
+):
+    """
+    Move a job to a new position (admin only).
+    """
+    reorder_item(db, Job, job_id, request.order, background_tasks)
+    db.commit()
+    return {"message": "Job reordered successfully"}
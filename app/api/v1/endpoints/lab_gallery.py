@@ -1,30 +1,81 @@
 from datetime import datetime, timezone
 from typing import Optional
-from math import ceil
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, BackgroundTasks
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import select, func
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.database import get_db
+from app.db.replicas import get_async_read_db
 from app.models.lab_gallery import LabGallery
-from app.schemas.lab_gallery import LabGalleryCreate, LabGalleryUpdate, LabGalleryResponse
-from app.schemas.pagination import PageInfo, PaginatedResponse
+from app.schemas.lab_gallery import LabGalleryCreate, LabGalleryUpdate, LabGalleryResponse, ReorderLabGalleryRequest
+from app.schemas.pagination import PaginatedResponse
+from app.core.responses import paginated_response
+from app.schemas.bulk import BulkRequest, BulkResponse
+from app.services.bulk import BulkResource, apply_bulk_operations
 from app.services.auth import get_current_admin
+from app.schemas.ordering import ApplyOrderingRequest
+from app.services.image_catalog import with_image_variants
+from app.services.reorder import add_ordered_item, apply_ordering, reorder_item, with_order_position
 
 
 router = APIRouter()
 
+LAB_GALLERY_BULK = BulkResource(model=LabGallery, create_schema=LabGalleryCreate, update_schema=LabGalleryUpdate)
+
+
+@router.post("/bulk", response_model=BulkResponse)
+async def bulk_lab_gallery(
+    payload: BulkRequest,
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_admin)
+):
+    """
+    Apply create / update / delete operations to many lab gallery items (admin only).
+    """
+    return await run_in_threadpool(apply_bulk_operations, db, LAB_GALLERY_BULK, payload.operations)
+
+@router.put("/reorder")
+async def apply_lab_gallery_ordering(
+    payload: ApplyOrderingRequest,
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_admin)
+):
+    """
+    Set the order of all lab gallery items at once from the full list of ids (admin only).
+    """
+    await run_in_threadpool(apply_ordering, db, LabGallery, payload.ids)
+    await run_in_threadpool(db.commit)
+    return {"message": "Lab gallery reordered successfully"}
+
+@router.put("/reorder/{lab_gallery_id}")
+async def reorder_lab_gallery(
+    lab_gallery_id: int,
+    request: ReorderLabGalleryRequest,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_admin)
+):
+    """
+    Move a lab gallery item to a new position (admin only).
+    """
+    reorder_item(db, LabGallery, lab_gallery_id, request.order, background_tasks)
+    db.commit()
+    return {"message": "Lab gallery reordered successfully"}
 
 @router.post("/add")
 async def add_lab_gallery(
     lab_gallery_data: LabGalleryCreate,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user = Depends(get_current_admin),
 ):
     """
     Add a new lab gallery item (admin only).
     """
-    if lab_gallery_data.order < 1:
+    if lab_gallery_data.order is not None and lab_gallery_data.order < 1:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Order must be greater than 0",
@@ -34,7 +85,6 @@ async def add_lab_gallery(
         title=lab_gallery_data.title,
         content=lab_gallery_data.content,
         image_url=lab_gallery_data.image_url if lab_gallery_data.image_url else None,
-        order=lab_gallery_data.order,
         category=lab_gallery_data.category.value,
         date=lab_gallery_data.date,
         location=lab_gallery_data.location,
@@ -42,7 +92,7 @@ async def add_lab_gallery(
         status=lab_gallery_data.status.value,
     )
 
-    db.add(lab_gallery)
+    add_ordered_item(db, LabGallery, lab_gallery, lab_gallery_data.order, background_tasks)
     db.commit()
     db.refresh(lab_gallery)
 
@@ -53,6 +103,7 @@ async def add_lab_gallery(
 async def update_lab_gallery(
     lab_gallery_id: int,
     lab_gallery_data: LabGalleryUpdate,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user = Depends(get_current_admin),
 ):
@@ -82,8 +133,6 @@ async def update_lab_gallery(
         lab_gallery.content = lab_gallery_data.content
     if lab_gallery_data.image_url is not None:
         lab_gallery.image_url = lab_gallery_data.image_url
-    if lab_gallery_data.order is not None:
-        lab_gallery.order = lab_gallery_data.order
     if lab_gallery_data.category is not None:
         lab_gallery.category = lab_gallery_data.category.value
     if lab_gallery_data.date is not None:
@@ -94,6 +143,8 @@ async def update_lab_gallery(
         lab_gallery.participant = lab_gallery_data.participant
     if lab_gallery_data.status is not None:
         lab_gallery.status = lab_gallery_data.status.value
+    if lab_gallery_data.order is not None:
+        reorder_item(db, LabGallery, lab_gallery_id, lab_gallery_data.order, background_tasks)
 
     lab_gallery.updated_at = datetime.now(timezone.utc)
     db.commit()
@@ -107,39 +158,29 @@ async def list_lab_gallery(
     page: int = Query(1, ge=1, description="Page number"),
     size: int = Query(10, ge=1, le=100, description="Number of items per page"),
     search: Optional[str] = Query(None, description="Search by title or content"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_read_db),
 ):
     """
     List all lab gallery items with pagination (public endpoint).
     Returns only items with is_deleted=False.
     """
-    query = db.query(LabGallery).filter(LabGallery.is_deleted == False)
+    query = select(LabGallery).where(LabGallery.is_deleted == False)
 
     if search:
-        query = query.filter(
+        query = query.where(
             LabGallery.title.ilike(f"%{search}%") | LabGallery.content.ilike(f"%{search}%")
         )
 
-    total_items = query.count()
-    total_pages = ceil(total_items / size) if total_items > 0 else 0
+    total_items = await db.scalar(select(func.count()).select_from(query.subquery()))
 
-    items = (
+    items = (await db.scalars(
         query.order_by(LabGallery.order.asc(), LabGallery.created_at.desc())
+        .options(with_order_position(LabGallery), with_image_variants(LabGallery))
         .offset((page - 1) * size)
         .limit(size)
-        .all()
-    )
-
-    page_info = PageInfo(
-        total=total_items,
-        page=page,
-        size=size,
-        total_pages=total_pages,
-        has_next=page < total_pages,
-        has_previous=page > 1,
-    )
+    )).all()
 
-    return PaginatedResponse(items=items, page_info=page_info)
+    return paginated_response(LabGalleryResponse, items, total_items, page, size)
 
 
 @router.delete("/{lab_gallery_id}/delete")
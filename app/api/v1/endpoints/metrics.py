@@ -0,0 +1,27 @@
+from fastapi import APIRouter, Depends
+from app.db.database import engine, get_async_engine
+from app.db.pool_metrics import get_pool_stats
+from app.db.replicas import replica_router
+from app.services.auth import get_current_admin
+
+router = APIRouter()
+
+
+@router.get("/db_pool")
+async def db_pool_metrics(
+    current_user = Depends(get_current_admin)
+):
+    """
+    Database connection pool occupancy and checkout metrics (admin only).
+    """
+    stats = {"primary": get_pool_stats(engine)}
+    try:
+        stats["primary_async"] = get_pool_stats(get_async_engine())
+    except ImportError:
+        # Async driver not installed
+        pass
+    for index, replica in enumerate(replica_router.replicas):
+        for kind, replica_engine in replica.engines().items():
+            if replica_engine is not None:
+                stats[f"replica_{index}_{kind}"] = get_pool_stats(replica_engine)
+    return stats
@@ -1,34 +1,85 @@
 from datetime import datetime, timezone
 from typing import Optional
-from math import ceil
 from app.models.news import News
-from app.schemas.news import NewsResponse
-from fastapi import APIRouter, Depends, HTTPException, status, Query, Form
+from app.schemas.news import NewsCreate, NewsResponse, NewsUpdate, ReorderNewsRequest
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Form, BackgroundTasks
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import select, func
 from sqlalchemy.orm import Session
-from app.db.database import get_db  
-from app.schemas.pagination import PageInfo, PaginatedResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.db.database import get_db
+from app.db.replicas import get_async_read_db
+from app.schemas.pagination import PaginatedResponse
+from app.core.responses import paginated_response
+from app.schemas.bulk import BulkRequest, BulkResponse
+from app.services.bulk import BulkResource, apply_bulk_operations
 from app.services.auth import get_current_admin
-from app.services.reorder import reorder_item
+from app.schemas.ordering import ApplyOrderingRequest
+from app.services.image_catalog import with_image_variants
+from app.services.reorder import add_ordered_item, apply_ordering, reorder_item, with_order_position
 
 
 router = APIRouter()
 
+NEWS_BULK = BulkResource(model=News, create_schema=NewsCreate, update_schema=NewsUpdate)
+
+
+@router.post("/bulk", response_model=BulkResponse)
+async def bulk_news(
+    payload: BulkRequest,
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_admin)
+):
+    """
+    Apply create / update / delete operations to many news items (admin only).
+    """
+    return await run_in_threadpool(apply_bulk_operations, db, NEWS_BULK, payload.operations)
+
+@router.put("/reorder")
+async def apply_news_ordering(
+    payload: ApplyOrderingRequest,
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_admin)
+):
+    """
+    Set the order of all news items at once from the full list of ids (admin only).
+    """
+    await run_in_threadpool(apply_ordering, db, News, payload.ids)
+    await run_in_threadpool(db.commit)
+    return {"message": "News reordered successfully"}
+
+@router.put("/reorder/{news_id}")
+async def reorder_news(
+    news_id: int,
+    request: ReorderNewsRequest,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_admin)
+):
+    """
+    Move a news item to a new position (admin only).
+    """
+    reorder_item(db, News, news_id, request.order, background_tasks)
+    db.commit()
+    return {"message": "News reordered successfully"}
+
 @router.post("/create_news")
 async def create_news(
+    background_tasks: BackgroundTasks,
     title: str = Form(...),
     content: str = Form(...),
     hyperlink: str | None = Form(None),
     publish_date: datetime = Form(...),
     image_url: Optional[str] = Form(None),
-    order: int = Form(1),
+    order: Optional[int] = Form(None),
     is_open: bool = Form(False),
     db: Session = Depends(get_db),
     current_user = Depends(get_current_admin)
 ):
     """
-    Create a new news item with optional image upload
+    Create a new news item with optional image upload.
     """
-    if order < 1:
+    if order is not None and order < 1:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Order must be greater than 0"
@@ -39,10 +90,9 @@ async def create_news(
         hyperlink=hyperlink,
         publish_date=publish_date,
         image_url=image_url if image_url else None,
-        order=order,
         is_open=is_open
     )
-    db.add(news)
+    add_ordered_item(db, News, news, order, background_tasks)
     db.commit()
     db.refresh(news)
     return {"message": "News created successfully"}
@@ -50,6 +100,7 @@ async def create_news(
 @router.put("/update_news/{news_id}")
 async def update_news(
     news_id: int,
+    background_tasks: BackgroundTasks,
     title: Optional[str] = Form(None),
     content: Optional[str] = Form(None),
     hyperlink: Optional[str] = Form(None),
@@ -61,7 +112,7 @@ async def update_news(
     current_user = Depends(get_current_admin)
 ):
     """
-    Update a news item by ID with optional image upload
+    Update a news item by ID with optional image upload.
     """
     news = db.query(News).filter(
         News.id == news_id,
@@ -92,7 +143,7 @@ async def update_news(
     if is_open is not None:
         news.is_open = is_open
     if order is not None:
-        news.order = order
+        reorder_item(db, News, news_id, order, background_tasks)
     
     news.updated_at = datetime.now(timezone.utc)
     db.commit()
@@ -121,15 +172,17 @@ async def delete_news(
     db.refresh(news)
     return {"message": "News deleted successfully"}
 
-@router.get("/get_news/{news_id}")
+@router.get("/get_news/{news_id}", response_model=NewsResponse)
 async def get_news(
     news_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_read_db)
 ):
-    news = db.query(News).filter(
-        News.id == news_id,
-        News.is_deleted == False
-    ).first()
+    news = await db.scalar(
+        select(News).where(
+            News.id == news_id,
+            News.is_deleted == False
+        ).options(with_order_position(News), with_image_variants(News))
+    )
     if not news:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, 
@@ -142,34 +195,26 @@ async def get_all_news(
     page: int = Query(1, ge=1, description="Page number"),
     size: int = Query(10, ge=1, le=100, description="Number of items per page"),
     search: Optional[str] = Query(None, description="Search by title or content"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     """
     List all news items (public endpoint).
     Returns only news with is_deleted=False.
     """
-    query = db.query(News).filter(News.is_deleted == False)
+    query = select(News).where(News.is_deleted == False)
     if search:
-        query = query.filter(News.title.ilike(f"%{search}%") | News.content.ilike(f"%{search}%"))
+        query = query.where(News.title.ilike(f"%{search}%") | News.content.ilike(f"%{search}%"))
     
     # Get total count
-    total_items = query.count()
-    total_pages = ceil(total_items / size)
+    total_items = await db.scalar(select(func.count()).select_from(query.subquery()))
     
     # # Apply pagination
     # items = query.order_by(News.order.desc()).offset((page - 1) * size).limit(size).all()
-    items = query.order_by(News.order.asc(), News.created_at.desc()).offset((page - 1) * size).limit(size).all()
-    page_info = PageInfo(
-        total=total_items,
-        page=page,
-        size=size,
-        total_pages=total_pages,
-        has_next=page < total_pages,
-        has_previous=page > 1
-    )
+    items = (await db.scalars(
+        query.order_by(News.order.asc(), News.created_at.desc())
+        .options(with_order_position(News), with_image_variants(News))
+        .offset((page - 1) * size).limit(size)
+    )).all()
     
-    return PaginatedResponse(
-        items=items, 
-        page_info=page_info
-        )
+    return paginated_response(NewsResponse, items, total_items, page, size)
 
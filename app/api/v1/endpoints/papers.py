@@ -1,25 +1,80 @@
 
 from typing import List
-from math import ceil
 from typing import Optional
 from app.models.papers import Paper
-from app.schemas.pagination import PageInfo, PaginatedResponse
+from app.schemas.pagination import PaginatedResponse
+from app.core.responses import paginated_response
 from app.schemas.papers import Category, DOIPaperCreate, ManualPaperCreate, PaperResponse, PaperUpdate, PubmedPaperCreate, ReorderPaperRequest
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, BackgroundTasks
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
-from sqlalchemy import or_, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import or_, func, select
 from app.db.database import get_db
+from app.db.replicas import get_async_read_db
+from app.schemas.bulk import BulkRequest, BulkResponse
+from app.services.bulk import BulkResource, apply_bulk_operations
 from app.services.auth import get_current_active_user
 from app.models.user import User
-from app.services.reorder import reorder_item
+from app.schemas.ordering import ApplyOrderingRequest
+from app.services.reorder import add_ordered_item, apply_ordering, reorder_item, with_order_position
 
 from app.services.papers import doi_fetch, e_fetch
 
 router = APIRouter()
 
+PAPERS_BULK = BulkResource(
+    model=Paper,
+    create_schema=ManualPaperCreate,
+    update_schema=PaperUpdate,
+    none_defaults={"category": []},
+    validate_create=lambda paper: None if paper.doi or paper.pubmed_id else "DOI or PubMED ID is required"
+)
+
+
+@router.post("/bulk", response_model=BulkResponse)
+async def bulk_papers(
+    payload: BulkRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Apply create / update / delete operations to many papers (Authenticated users only).
+    """
+    return await run_in_threadpool(apply_bulk_operations, db, PAPERS_BULK, payload.operations)
+
+@router.put("/reorder")
+async def apply_papers_ordering(
+    payload: ApplyOrderingRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Set the order of all papers at once from the full list of ids (Authenticated users only).
+    """
+    await run_in_threadpool(apply_ordering, db, Paper, payload.ids)
+    await run_in_threadpool(db.commit)
+    return {"message": "Papers reordered successfully"}
+
+@router.put("/reorder/{paper_id}")
+async def reorder_paper(
+    paper_id: int,
+    request: ReorderPaperRequest,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Move a paper to a new position (Authenticated users only).
+    """
+    reorder_item(db, Paper, paper_id, request.order, background_tasks)
+    db.commit()
+    return {"message": "Paper reordered successfully"}
+
 @router.post("/add/doi")
 async def add_paper_by_doi(
     paper: DOIPaperCreate,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
@@ -43,7 +98,7 @@ async def add_paper_by_doi(
             )
         comma_separated_authors = res[0]['authors'].replace(';', ',')
         publish_date2 = res[0]['pub_date']
-        if paper.order < 1:
+        if paper.order is not None and paper.order < 1:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Order must be greater than 0"
@@ -59,12 +114,11 @@ async def add_paper_by_doi(
             journal = res[0]['journal'],
             category = [cat.value for cat in paper.category] if paper.category else [],
             is_presentation = paper.is_presentation,
-            order = paper.order,
             is_open=paper.is_open
 
         )
 
-        db.add(db_paper)
+        add_ordered_item(db, Paper, db_paper, paper.order, background_tasks)
         db.commit()
 
         return {"message": "The paper has been successfully added to the system."}
@@ -79,6 +133,7 @@ async def add_paper_by_doi(
 @router.post("/add/pubmed")
 async def add_paper_by_pubmed_id(
     paper: PubmedPaperCreate,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
@@ -93,7 +148,7 @@ async def add_paper_by_pubmed_id(
             )
         publish_date2 = result['result'][result['result']['uids'][0]]['date_pub']
         authers2 = ", ".join(author['name'] for author in result['result'][result['result']['uids'][0]]['authors'])
-        if paper.order < 1:
+        if paper.order is not None and paper.order < 1:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Order must be greater than 0"
@@ -108,11 +163,10 @@ async def add_paper_by_pubmed_id(
             authers = authers2,
             category = [cat.value for cat in paper.category] if paper.category else [],
             is_presentation = paper.is_presentation,
-            order = paper.order,
             is_open=paper.is_open
         )
 
-        db.add(db_paper)
+        add_ordered_item(db, Paper, db_paper, paper.order, background_tasks)
         db.commit()
 
         return {"message": "The paper has been successfully added to the system."}
@@ -127,6 +181,7 @@ async def add_paper_by_pubmed_id(
 @router.post("/add/manual")
 async def add_paper_manual(
     paper_data: ManualPaperCreate,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
@@ -139,7 +194,7 @@ async def add_paper_manual(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="DOI or PubMED ID is required"
         )
-    if paper_data.order < 1:
+    if paper_data.order is not None and paper_data.order < 1:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Order must be greater than 0"
@@ -156,11 +211,10 @@ async def add_paper_manual(
             doi=paper_data.doi,
             category=[cat.value for cat in paper_data.category] if paper_data.category else [],
             is_presentation=paper_data.is_presentation,
-            order=paper_data.order,
             is_open=paper_data.is_open
         )
 
-        db.add(db_paper)
+        add_ordered_item(db, Paper, db_paper, paper_data.order, background_tasks)
         db.commit()
         db.refresh(db_paper)
 
@@ -179,6 +233,7 @@ async def add_paper_manual(
 async def update_paper(
     paper_id: int,
     paper_data: PaperUpdate,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
@@ -220,7 +275,7 @@ async def update_paper(
         if paper_data.is_open is not None:
             paper.is_open = paper_data.is_open
         if paper_data.order is not None:
-            paper.order = paper_data.order
+            reorder_item(db, Paper, paper_id, paper_data.order, background_tasks)
         
         db.commit()
         return {"message": "The paper has been successfully updated."}
@@ -237,18 +292,18 @@ async def list_all_papers(
     size: int = Query(10, description="Max number of items to return"),
     category: Optional[Category] = Query(None, description="Search by category"),
     search: Optional[str] = Query(None, description="Search by title or abstract"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_read_db),
 ):
     """
     Get all papers with pagination
     """
     try:
         # Build query with soft delete filter
-        query = db.query(Paper).filter(Paper.is_deleted == False)
+        query = select(Paper).where(Paper.is_deleted == False)
         
         # Apply search filter if provided
         if search:
-            query = query.filter(
+            query = query.where(
                 or_(
                     Paper.title.ilike(f"%{search}%"),
                     Paper.abstract.ilike(f"%{search}%")
@@ -256,40 +311,23 @@ async def list_all_papers(
             )
 
         if category:
-            query = query.filter(
+            query = query.where(
                 func.JSON_CONTAINS(Paper.category, f'"{category.value}"')
             )
         
 
-        # Order by order field
-        query = query.order_by(Paper.order.asc(), Paper.created_at.desc())
-        
         # Get total count
-        total_items = query.count()
+        total_items = await db.scalar(select(func.count()).select_from(query.subquery()))
         
-        # Calculate total pages
-        total_pages = ceil(total_items / size)
+        # Order by order field
+        query = query.order_by(Paper.order.asc(), Paper.created_at.desc())
         
         # Apply pagination
-        papers = query.offset((page - 1) * size).limit(size).all()
-        
-        # Convert to response models
-        items = [PaperResponse.model_validate(paper) for paper in papers]
+        papers = (await db.scalars(
+            query.options(with_order_position(Paper)).offset((page - 1) * size).limit(size)
+        )).all()
         
-        # Create page info
-        page_info = PageInfo(
-            total=total_items,
-            page=page,
-            size=size,
-            total_pages=total_pages,
-            has_next=page < total_pages,
-            has_previous=page > 1
-        )
-        
-        return PaginatedResponse[PaperResponse](
-            items=items,
-            page_info=page_info
-        )
+        return paginated_response(PaperResponse, papers, total_items, page, size)
     
     except Exception as e:
         raise HTTPException(
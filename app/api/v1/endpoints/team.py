@@ -1,42 +1,98 @@
 from datetime import datetime, timezone
 from typing import Optional
-from math import ceil
 from pathlib import Path
 import os
 from app.services.file_upload import save_image
-from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile, File, Form
+from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile, File, Form, BackgroundTasks
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import and_, select, func
 from app.db.database import get_db
+from app.db.replicas import get_async_read_db
 from app.models.team import TeamMember
 from app.schemas.team import (
+    TeamMemberCreate,
+    TeamMemberUpdate,
     TeamMemberResponse,
     TeamCategory,
     ReorderTeamMemberRequest,
 )
-from app.schemas.pagination import PageInfo, PaginatedResponse
+from app.schemas.pagination import PaginatedResponse
+from app.core.responses import paginated_response
+from app.schemas.bulk import BulkRequest, BulkResponse
+from app.services.bulk import BulkResource, apply_bulk_operations
 from app.services.auth import get_current_admin
-from app.services.reorder import reorder_item
+from app.schemas.ordering import ApplyOrderingRequest
+from app.services.image_catalog import with_image_variants
+from app.services.reorder import add_ordered_item, apply_ordering, reorder_item, with_order_position
 from app.core.config import settings
 from app.services.image_upload import upload_image
 router = APIRouter()
 
+TEAM_BULK = BulkResource(
+    model=TeamMember,
+    create_schema=TeamMemberCreate,
+    update_schema=TeamMemberUpdate,
+    none_defaults={"description": "", "hyperlink": ""}
+)
+
+
+@router.post("/bulk", response_model=BulkResponse)
+async def bulk_team(
+    payload: BulkRequest,
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_admin)
+):
+    """
+    Apply create / update / delete operations to many team members (admin only).
+    """
+    return await run_in_threadpool(apply_bulk_operations, db, TEAM_BULK, payload.operations)
+
+@router.put("/reorder")
+async def apply_team_ordering(
+    payload: ApplyOrderingRequest,
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_admin)
+):
+    """
+    Set the order of all team members at once from the full list of ids (admin only).
+    """
+    await run_in_threadpool(apply_ordering, db, TeamMember, payload.ids)
+    await run_in_threadpool(db.commit)
+    return {"message": "Team members reordered successfully"}
+
+@router.put("/reorder/{team_member_id}")
+async def reorder_team_member(
+    team_member_id: int,
+    request: ReorderTeamMemberRequest,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_admin)
+):
+    """
+    Move a team member to a new position (admin only).
+    """
+    reorder_item(db, TeamMember, team_member_id, request.order, background_tasks)
+    db.commit()
+    return {"message": "Team member reordered successfully"}
 
 @router.post("/add_team_member")
 async def add_team_member(
+    background_tasks: BackgroundTasks,
     name: str = Form(..., min_length=1, max_length=50),
     category: str = Form(...),
     role: str = Form(..., min_length=1, max_length=50),
     designation: str = Form(..., min_length=1, max_length=50),
     description: Optional[str] = Form(None, min_length=1),
     hyperlink: Optional[str] = Form(None, max_length=255),
-    order: int = Form(1),
+    order: Optional[int] = Form(None),
     image_url: Optional[str] = Form(None),
     db: Session = Depends(get_db),
     current_user = Depends(get_current_admin)
 ):
     """
-    Add a new team member with optional image upload
+    Add a new team member with optional image upload.
     """
     # Validate category
     try:
@@ -47,7 +103,7 @@ async def add_team_member(
             detail=f"Invalid category. Must be one of: {[c.value for c in TeamCategory]}"
         )
 
-    if order < 1:
+    if order is not None and order < 1:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Order must be greater than 0"
@@ -60,11 +116,10 @@ async def add_team_member(
         designation=designation,
         description=description or "",
         image_url=image_url if image_url else None,
-        hyperlink=hyperlink or "",
-        order=order
+        hyperlink=hyperlink or ""
     )
-        
-    db.add(team_member)
+
+    add_ordered_item(db, TeamMember, team_member, order, background_tasks)
     db.commit()
     db.refresh(team_member)
 
@@ -75,6 +130,7 @@ async def add_team_member(
 @router.put("/{team_member_id}/update")
 async def update_team_member(
     team_member_id: int,
+    background_tasks: BackgroundTasks,
     name: Optional[str] = Form(None, max_length=50),
     category: Optional[str] = Form(None),
     role: Optional[str] = Form(None, max_length=50),
@@ -154,7 +210,7 @@ async def update_team_member(
         team_member.image_url = ""
 
     if order is not None:
-        team_member.order = order
+        reorder_item(db, TeamMember, team_member_id, order, background_tasks)
     
     team_member.updated_at = datetime.now(timezone.utc)
     db.commit()
@@ -167,15 +223,17 @@ async def update_team_member(
 @router.get("/{team_member_id}/get", response_model=TeamMemberResponse)
 async def get_team_member(
     team_member_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     """
     Get a team member by ID
     """
-    team_member = db.query(TeamMember).filter(
-        TeamMember.id == team_member_id,
-        TeamMember.is_deleted == False
-        ).first()
+    team_member = await db.scalar(
+        select(TeamMember).where(
+            TeamMember.id == team_member_id,
+            TeamMember.is_deleted == False
+        ).options(with_order_position(TeamMember), with_image_variants(TeamMember))
+    )
     if not team_member:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, 
         detail="Team member not found"
@@ -187,39 +245,32 @@ async def list_team_members(
     page: int = Query(1, description="Number of items to skip"),
     size: int = Query(10, description="Max number of items to return"),
     search: Optional[str] = Query(None, description="Search by name"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     """
     List all team members with pagination
     """
-    query = db.query(TeamMember).filter(
+    query = select(TeamMember).where(
         TeamMember.is_deleted == False
         )
     
     if search:
-        query = query.filter(
+        query = query.where(
             TeamMember.name.ilike(f"%{search}%")
         )
     
+    # Get total count before pagination
+    total_items = await db.scalar(select(func.count()).select_from(query.subquery()))
+    
     # Order by order field
     query = query.order_by(TeamMember.order.asc(), TeamMember.created_at.desc())
     
-    # Get total count before pagination
-    total_items = query.count()
-    total_pages = ceil(total_items / size)
-    
     # Apply pagination
-    items = query.offset((page - 1) * size).limit(size).all()
-
-    page_info = PageInfo(
-        total=total_items,
-        page=page,
-        size=size,
-        total_pages=total_pages,
-        has_next=page < total_pages,
-        has_previous=page > 1
-    )
-    return PaginatedResponse(items=items, page_info=page_info)
+    items = (await db.scalars(
+        query.options(with_order_position(TeamMember), with_image_variants(TeamMember)).offset((page - 1) * size).limit(size)
+    )).all()
+
+    return paginated_response(TeamMemberResponse, items, total_items, page, size)
 
 @router.delete("/{team_member_id}/delete")
 async def delete_team_member(
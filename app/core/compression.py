@@ -0,0 +1,147 @@
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import GZipResponder, IdentityResponder
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Already compressed or streamed-event payloads that are not worth compressing again
+EXCLUDED_CONTENT_TYPES = (
+    "text/event-stream",
+    "image/",
+    "video/",
+    "audio/",
+    "application/pdf",
+    "application/zip",
+    "application/gzip",
+)
+
+
+def parse_accept_encoding(header: str) -> set[str]:
+    """
+    Return the content codings a client accepts, ignoring the ones sent with q=0.
+    """
+    accepted = set()
+    for part in header.split(","):
+        coding, _, params = part.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        if quality > 0:
+            accepted.add(coding)
+    return accepted
+
+
+def _merge_vary_headers(message: Message) -> None:
+    """
+    Collapse repeated Vary values, e.g. when both a static file response and the
+    compression responder add Accept-Encoding.
+    """
+    values = []
+    headers = []
+    for name, value in message["headers"]:
+        if name.lower() == b"vary":
+            for item in value.decode("latin-1").split(","):
+                item = item.strip()
+                if item and item.lower() not in (v.lower() for v in values):
+                    values.append(item)
+        else:
+            headers.append((name, value))
+    if values:
+        headers.append((b"vary", ", ".join(values).encode("latin-1")))
+    message["headers"] = headers
+
+
+class _ExcludedContentTypesMixin:
+    """
+    Widen Starlette's content-type exclusion list (it only skips text/event-stream), never
+    compress partial (206) responses and keep the outgoing Vary header free of duplicates.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        async def send_with_merged_vary(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                _merge_vary_headers(message)
+            await send(message)
+
+        await super().__call__(scope, receive, send_with_merged_vary)
+
+    async def send_with_compression(self, message: Message) -> None:
+        await super().send_with_compression(message)
+        if message["type"] == "http.response.start":
+            headers = Headers(raw=message["headers"])
+            content_type = headers.get("content-type", "")
+            # Byte ranges refer to the identity file; compressing them would corrupt the download
+            self.content_type_is_excluded = (
+                content_type.startswith(EXCLUDED_CONTENT_TYPES)
+                or message["status"] == 206
+                or "content-range" in headers
+            )
+
+
+class _IdentityResponder(_ExcludedContentTypesMixin, IdentityResponder):
+    pass
+
+
+class _GZipResponder(_ExcludedContentTypesMixin, GZipResponder):
+    pass
+
+
+class _BrotliResponder(_ExcludedContentTypesMixin, IdentityResponder):
+    content_encoding = "br"
+
+    def __init__(self, app: ASGIApp, minimum_size: int, quality: int = 4) -> None:
+        super().__init__(app, minimum_size)
+        self.compressor = brotli.Compressor(quality=quality)
+
+    def apply_compression(self, body: bytes, *, more_body: bool) -> bytes:
+        if more_body:
+            # Flush every chunk so streamed responses keep streaming
+            return self.compressor.process(body) + self.compressor.flush()
+        return self.compressor.process(body) + self.compressor.finish()
+
+
+class CompressionMiddleware:
+    """
+    Negotiate brotli or gzip for responses of at least `minimum_size` bytes.
+
+    Streaming responses are compressed chunk by chunk. Responses that already carry a
+    Content-Encoding (e.g. precompressed static files) are passed through untouched.
+    Brotli is only offered when the optional `brotli` package is installed.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        accepted = parse_accept_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if brotli is not None and "br" in accepted:
+            responder = _BrotliResponder(self.app, self.minimum_size, quality=self.brotli_quality)
+        elif "gzip" in accepted:
+            responder = _GZipResponder(self.app, self.minimum_size, compresslevel=self.gzip_level)
+        else:
+            responder = _IdentityResponder(self.app, self.minimum_size)
+
+        await responder(scope, receive, send)
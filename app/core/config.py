@@ -3,9 +3,21 @@ from pathlib import Path
 
 class Settings(BaseSettings):
     DATABASE_URL: str #= "sqlite:///./sql_app.db"
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: int = 30  # seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = 1800  # seconds, keep below MySQL wait_timeout
+    DB_POOL_PRE_PING: bool = True
+    ASYNC_DATABASE_URL: str = ""  # Derived from DATABASE_URL (aiomysql / aiosqlite) when empty
+    DATABASE_REPLICA_URLS: str = ""  # Optional: comma separated read replica URLs for public GET endpoints
+    DB_REPLICA_RETRY_SECONDS: int = 30  # How long a failed replica is skipped
     SECRET_KEY: str
     ALGORITHM: str
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 10080
+    AUTH_PRINCIPAL_CACHE_TTL_SECONDS: int = 30  # 0 disables the authenticated user cache
+    AUTH_PRINCIPAL_CACHE_MAX_ENTRIES: int = 1024
+    PASSWORD_HASH_MAX_CONCURRENCY: int = 2  # bcrypt hashes / verifications running at once per worker
+    PASSWORD_HASH_QUEUE_TIMEOUT_SECONDS: float = 5.0  # waiting longer than this for a slot returns 503
     SMTP_SERVER: str
     SMTP_PORT: int
     SMTP_USERNAME: str
@@ -24,6 +36,66 @@ class Settings(BaseSettings):
     CV_UPLOAD_DIR: Path = Path("cv_uploads")
     CV_MAX_FILE_SIZE: int = 5 * 1024 * 1024  # 5 MB
     ALLOWED_CV_EXTENSIONS: set = {".pdf", ".doc", ".docx"}
+    CV_DOWNLOAD_LINK_TTL_SECONDS: int = 15 * 60  # signed CV links in admin API responses
+    CV_DOWNLOAD_EMAIL_LINK_TTL_SECONDS: int = 24 * 3600  # signed CV link in the notification email; tokens end up in access logs
+    CV_DOWNLOAD_OFFLOAD_MIN_SIZE: int = 1024 * 1024  # larger CVs go through STATIC_FILES_OFFLOAD when set
+
+    # Upload Streaming Settings
+    UPLOAD_CHUNK_SIZE: int = 1024 * 1024  # bytes copied per read / write
+    UPLOAD_MAX_REQUEST_SIZE: int = 6 * 1024 * 1024  # multipart bodies over this get a 413 before being read
+
+    # Image Variant Settings
+    IMAGE_VARIANTS_ENABLED: bool = True
+    IMAGE_VARIANTS_DIR: Path = Path("images") / "variants"  # served under /images/variants
+    IMAGE_VARIANT_WIDTHS: list = [320, 640, 1024, 1600]  # only widths smaller than the original are made
+    IMAGE_VARIANT_FORMATS: list = ["webp", "jpeg"]
+    IMAGE_VARIANT_QUALITY: int = 80
+    IMAGE_PLACEHOLDER_WIDTH: int = 16  # inlined as a data URI, stretched and blurred by the client
+    IMAGE_VARIANT_WORKERS: int = 2  # processes resizing images
+    IMAGE_VARIANT_TIMEOUT_SECONDS: float = 30.0  # uploads are kept without variants past this
+
+    # Static File Settings
+    STATIC_FILES_OFFLOAD: str = ""  # "x-accel-redirect" (nginx) or "x-sendfile" to let the front proxy send files
+    STATIC_FILES_ACCEL_PREFIX: str = "/_protected"  # internal nginx location; /images is offloaded to <prefix>/images, CVs to <prefix>/cv_uploads
+
+    # Homepage Settings
+    HOMEPAGE_SECTIONS: list = ["news", "feature_publication", "team", "lab_gallery"]
+    HOMEPAGE_SECTION_LIMIT: int = 6
+    HOMEPAGE_CACHE_TTL_SECONDS: int = 30  # 0 disables the section cache
+
+    # Response Compression Settings
+    COMPRESSION_MINIMUM_SIZE: int = 1024  # bytes
+    GZIP_COMPRESS_LEVEL: int = 6
+    BROTLI_QUALITY: int = 4
+
+    # SQL Instrumentation Settings
+    SQL_INSTRUMENTATION_ENABLED: bool = True
+    SQL_QUERY_COUNT_THRESHOLD: int = 20  # flag requests issuing more statements than this
+    SQL_SLOW_QUERY_MS: int = 200  # flag any statement slower than this
+    SQL_LOG_ALL_REQUESTS: bool = False  # log the query summary of every request
+
+    # Bulk Write Settings
+    BULK_MAX_OPERATIONS: int = 500  # operations accepted per bulk request
+
+    # Archive Settings
+    ARCHIVE_AFTER_DAYS: int = 30  # soft-deleted rows older than this move to <table>_archive
+    ARCHIVE_BATCH_SIZE: int = 500  # rows moved per transaction
+
+    # Data Migration Settings (app/db/migration_helpers.py)
+    MIGRATION_BATCH_SIZE: int = 1000  # rows updated per backfill batch
+    MIGRATION_BATCH_PAUSE_SECONDS: float = 0.05  # sleep between batches so live traffic and replicas keep up
+    MIGRATION_MAX_BATCH_SECONDS: float = 1.0  # a slower batch halves the batch size
+
+    # Rate Limit Settings (public write endpoints)
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_BACKEND: str = "memory"  # "memory" (per worker) or "sqlite" (shared by the workers on a host)
+    RATE_LIMIT_SQLITE_PATH: str = "rate_limits.db"
+    RATE_LIMIT_TRUSTED_PROXIES: list = ["127.0.0.1", "::1"]  # peers whose X-Forwarded-For is believed
+    # route -> {"ip": limits, "email": limits}, limits like "5/minute, 30/hour"
+    RATE_LIMITS: dict = {
+        "contact_submit": {"ip": "5/minute, 30/hour", "email": "3/hour, 10/day"},
+        "job_apply": {"ip": "3/minute, 20/hour", "email": "5/hour, 10/day"},
+    }
 
 
     model_config = SettingsConfigDict(env_file=".env")
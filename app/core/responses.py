@@ -0,0 +1,65 @@
+from functools import lru_cache
+from math import ceil
+from typing import Any, Iterable, Optional, Type
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel, TypeAdapter
+from app.schemas.pagination import PageInfo, PaginatedResponse
+
+try:
+    import orjson
+    from fastapi.responses import ORJSONResponse
+except ImportError:
+    orjson = None
+    ORJSONResponse = None
+
+# Used as the application's default_response_class; falls back to the stdlib encoder without orjson
+DefaultJSONResponse = ORJSONResponse if orjson is not None else JSONResponse
+
+
+def build_page_info(total: int, page: int, size: int) -> PageInfo:
+    total_pages = ceil(total / size) if total > 0 else 0
+    return PageInfo(
+        total=total,
+        page=page,
+        size=size,
+        total_pages=total_pages,
+        has_next=page < total_pages,
+        has_previous=page > 1
+    )
+
+
+@lru_cache(maxsize=None)
+def _page_adapter(item_schema: Type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(PaginatedResponse[item_schema])
+
+
+def paginated_response(
+    item_schema: Type[BaseModel],
+    rows: Iterable[Any],
+    total: int,
+    page: int,
+    size: int
+) -> Response:
+    """
+    Build a paginated JSON response from ORM rows in a single validate + serialize pass.
+
+    Returning a Response directly skips the route's response_model handling, so the rows are
+    validated once (in pydantic-core, batched over the whole page) instead of once per row in the
+    endpoint and again by FastAPI. Keep response_model on the route for the OpenAPI schema.
+    """
+    adapter = _page_adapter(item_schema)
+    page_data = adapter.validate_python(
+        {"items": list(rows), "page_info": build_page_info(total, page, size)},
+        from_attributes=True
+    )
+    return Response(content=adapter.dump_json(page_data), media_type="application/json")
+
+
+def model_response(model: BaseModel, exclude: Optional[set] = None) -> Response:
+    """
+    Serialize an already validated model straight to JSON bytes, leaving out `exclude` fields.
+    """
+    return Response(
+        content=model.model_dump_json(exclude=exclude),
+        media_type="application/json"
+    )
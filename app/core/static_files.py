@@ -0,0 +1,208 @@
+import mimetypes
+import os
+import re
+import stat
+from pathlib import PurePosixPath
+from secrets import token_hex
+from typing import Optional
+from urllib.parse import quote
+import anyio
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Scope, Send
+from app.core.compression import parse_accept_encoding
+
+# Sidecar suffixes checked next to a requested file, in order of preference
+PRECOMPRESSED_SUFFIXES = (("br", ".br"), ("gzip", ".gz"))
+
+# `<sha256>.<ext>` and its variants `<sha256>-<width>w.<ext>`: the content behind such a name never changes
+CONTENT_HASHED_NAME = re.compile(r"(?:^|/)[0-9a-f]{64}(?:-\d+w)?\.[A-Za-z0-9]+$")
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+# Front proxy offload modes: nginx (X-Accel-Redirect) or Apache / lighttpd / Caddy (X-Sendfile)
+OFFLOAD_MODES = ("x-accel-redirect", "x-sendfile")
+
+
+class RangeFileResponse(FileResponse):
+    """
+    FileResponse with a well-formed multi-range (multipart/byteranges) reply. Starlette 0.50 puts
+    the multipart media type in Content-Range instead of Content-Type and separates the parts with
+    bare LF, which clients can't parse. Single ranges, If-Range and 416s are Starlette's.
+    """
+
+    async def _handle_multiple_ranges(
+        self,
+        send: Send,
+        ranges: list,
+        file_size: int,
+        send_header_only: bool
+    ) -> None:
+        boundary = token_hex(13)
+        content_type = self.headers["content-type"]
+
+        def part_header(index: int, start: int, end: int) -> bytes:
+            # The CRLF ending the previous part's data belongs to the next delimiter
+            separator = "\r\n" if index else ""
+            return (
+                f"{separator}--{boundary}\r\n"
+                f"Content-Type: {content_type}\r\n"
+                f"Content-Range: bytes {start}-{end - 1}/{file_size}\r\n\r\n"
+            ).encode("latin-1")
+
+        closing = f"\r\n--{boundary}--\r\n".encode("latin-1")
+        content_length = sum(
+            len(part_header(index, start, end)) + end - start for index, (start, end) in enumerate(ranges)
+        ) + len(closing)
+
+        if "content-range" in self.headers:
+            del self.headers["content-range"]
+        self.headers["content-type"] = f"multipart/byteranges; boundary={boundary}"
+        self.headers["content-length"] = str(content_length)
+        await send({"type": "http.response.start", "status": 206, "headers": self.raw_headers})
+        if send_header_only:
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+            return
+        async with await anyio.open_file(self.path, mode="rb") as file:
+            for index, (start, end) in enumerate(ranges):
+                await send({"type": "http.response.body", "body": part_header(index, start, end), "more_body": True})
+                await file.seek(start)
+                while start < end:
+                    chunk = await file.read(min(self.chunk_size, end - start))
+                    if not chunk:
+                        break
+                    start += len(chunk)
+                    await send({"type": "http.response.body", "body": chunk, "more_body": True})
+        await send({"type": "http.response.body", "body": closing, "more_body": False})
+
+
+def offload_file_response(
+    full_path: str,
+    accel_uri: str,
+    mode: str,
+    media_type: Optional[str] = None,
+    headers: Optional[dict] = None
+) -> Response:
+    """
+    An empty response telling the front proxy to send `full_path` itself.
+
+    With X-Accel-Redirect, `accel_uri` must map to the file through an `internal` nginx location;
+    with X-Sendfile the absolute file path is sent. The proxy then handles conditional and Range
+    requests and streams the bytes, so no Python worker is tied up with the transfer. Headers such
+    as Cache-Control and Content-Disposition set here are kept by the proxy.
+    """
+    if mode not in OFFLOAD_MODES:
+        raise ValueError(f"Unknown offload mode '{mode}', expected one of {OFFLOAD_MODES}")
+    headers = dict(headers or {})
+    if mode == "x-accel-redirect":
+        headers["X-Accel-Redirect"] = accel_uri
+    else:
+        headers["X-Sendfile"] = os.path.abspath(full_path)
+    return Response(
+        status_code=200,
+        media_type=media_type or mimetypes.guess_type(full_path)[0] or "application/octet-stream",
+        headers=headers
+    )
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """
+    StaticFiles that serves `<file>.br` / `<file>.gz` sidecars when they exist and the client
+    accepts that encoding, so static assets are never compressed on the fly.
+
+    Files whose path matches `immutable_pattern` (content-addressed names) are sent with a
+    one-year immutable Cache-Control, so browsers and CDNs never revalidate them. Range requests
+    (resumed or seeking downloads) always get the identity file, never a compressed sidecar.
+
+    With `offload` set to "x-accel-redirect" or "x-sendfile", GET / HEAD requests for existing
+    files are answered with an empty response and the front proxy sends the file; for nginx,
+    `offload_prefix` is an internal location aliased to `directory`, e.g.
+
+        location /_protected/images/ { internal; alias /srv/beaconlab/images; }
+    """
+
+    def __init__(
+        self,
+        *args,
+        immutable_pattern: Optional[re.Pattern] = None,
+        offload: Optional[str] = None,
+        offload_prefix: str = "",
+        **kwargs
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        if offload and offload not in OFFLOAD_MODES:
+            raise ValueError(f"Unknown offload mode '{offload}', expected one of {OFFLOAD_MODES}")
+        self.immutable_pattern = immutable_pattern
+        self.offload = offload or None
+        self.offload_prefix = offload_prefix.rstrip("/")
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        if self.offload and scope["method"] in ("GET", "HEAD"):
+            response = await self._offload_response(path, scope)
+        else:
+            response = await self._get_response(path, scope)
+        if (
+            self.immutable_pattern is not None
+            and response.status_code in (200, 206, 304)
+            and self.immutable_pattern.search(path)
+        ):
+            response.headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+        return response
+
+    async def _offload_response(self, path: str, scope: Scope) -> Response:
+        full_path, stat_result = await anyio.to_thread.run_sync(self.lookup_path, path)
+        if stat_result is None or not stat.S_ISREG(stat_result.st_mode):
+            # Directories / missing files: the usual 404 (or html index) handling
+            return await self._get_response(path, scope)
+        accel_uri = f"{self.offload_prefix}/{quote(str(PurePosixPath(*path.split(os.sep))))}"
+        return offload_file_response(full_path, accel_uri, self.offload)
+
+    async def _get_response(self, path: str, scope: Scope) -> Response:
+        request_headers = Headers(scope=scope)
+        if scope["method"] in ("GET", "HEAD") and "range" not in request_headers:
+            accepted = parse_accept_encoding(request_headers.get("accept-encoding", ""))
+            for encoding, suffix in PRECOMPRESSED_SUFFIXES:
+                if encoding not in accepted:
+                    continue
+                full_path, stat_result = await anyio.to_thread.run_sync(self.lookup_path, path + suffix)
+                if stat_result is None or not stat.S_ISREG(stat_result.st_mode):
+                    continue
+                # Only use the sidecar while the original file is still there
+                _, original_stat = await anyio.to_thread.run_sync(self.lookup_path, path)
+                if original_stat is not None and stat.S_ISREG(original_stat.st_mode):
+                    return self.encoded_file_response(path, full_path, stat_result, scope, encoding)
+
+        response = await super().get_response(path, scope)
+        MutableHeaders(raw=response.raw_headers).add_vary_header("Accept-Encoding")
+        return response
+
+    def file_response(
+        self,
+        full_path,
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200
+    ) -> Response:
+        response = RangeFileResponse(full_path, status_code=status_code, stat_result=stat_result)
+        if self.is_not_modified(response.headers, Headers(scope=scope)):
+            return NotModifiedResponse(response.headers)
+        return response
+
+    def encoded_file_response(
+        self,
+        path: str,
+        full_path: str,
+        stat_result,
+        scope: Scope,
+        encoding: str
+    ) -> Response:
+        media_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+        response = RangeFileResponse(
+            full_path,
+            stat_result=stat_result,
+            media_type=media_type,
+            headers={"Content-Encoding": encoding, "Vary": "Accept-Encoding"}
+        )
+        if self.is_not_modified(response.headers, Headers(scope=scope)):
+            return NotModifiedResponse(response.headers)
+        return response
@@ -0,0 +1,227 @@
+"""
+Helpers for data migrations on large tables (papers, contact_inquiries, ...).
+
+Use them from an Alembic revision inside an autocommit block, so each batch commits on its own
+and row locks are only held for one batch at a time:
+
+    from app.db.migration_helpers import batched_backfill, create_index_online
+
+    def upgrade() -> None:
+        op.add_column("papers", sa.Column("is_open_access", sa.Boolean(), nullable=True))
+        with op.get_context().autocommit_block():
+            batched_backfill(
+                op.get_bind(), "papers",
+                values={"is_open_access": sa.column("is_open")},
+                where=sa.column("is_open_access").is_(None),
+                checkpoint="papers_is_open_access",
+            )
+            create_index_online(op.get_bind(), "ix_papers_is_open_access", "papers", ["is_open_access"])
+
+Backfills must be idempotent: after a crash the last batch may run again. Guard schema changes
+with an inspector check (as the existing revisions do), since on MySQL DDL is committed
+immediately and a failed revision is retried from the top.
+"""
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+import sqlalchemy as sa
+from sqlalchemy.engine import Connection
+from app.core.config import settings
+
+logger = logging.getLogger("fastapi")
+
+CHECKPOINT_TABLE_NAME = "migration_checkpoints"
+
+# Kept out of Base.metadata: it is created on first use and ignored by autogenerate (see alembic/env.py)
+checkpoint_metadata = sa.MetaData()
+checkpoints = sa.Table(
+    CHECKPOINT_TABLE_NAME,
+    checkpoint_metadata,
+    sa.Column("name", sa.String(191), primary_key=True),
+    sa.Column("last_key", sa.BigInteger, nullable=True),
+    sa.Column("rows_done", sa.BigInteger, nullable=False, default=0),
+    sa.Column("completed", sa.Boolean, nullable=False, default=False),
+    sa.Column("updated_at", sa.DateTime, nullable=False),
+)
+
+# Batches never shrink below this when they run slower than max_batch_seconds
+MIN_BATCH_SIZE = 100
+
+
+def utc_now():
+    return datetime.now(timezone.utc)
+
+
+def _load_checkpoint(connection: Connection, name: str) -> Optional[dict]:
+    checkpoints.create(connection, checkfirst=True)
+    row = connection.execute(
+        sa.select(checkpoints).where(checkpoints.c.name == name)
+    ).mappings().first()
+    return dict(row) if row else None
+
+
+def _save_checkpoint(connection: Connection, name: str, last_key, rows_done: int, completed: bool, exists: bool) -> None:
+    values = {"last_key": last_key, "rows_done": rows_done, "completed": completed, "updated_at": utc_now()}
+    if exists:
+        connection.execute(sa.update(checkpoints).where(checkpoints.c.name == name).values(**values))
+    else:
+        connection.execute(sa.insert(checkpoints).values(name=name, **values))
+
+
+def reset_checkpoint(connection: Connection, name: str) -> None:
+    """
+    Forget a checkpoint so the next backfill under that name starts from the first row.
+    """
+    checkpoints.create(connection, checkfirst=True)
+    connection.execute(sa.delete(checkpoints).where(checkpoints.c.name == name))
+
+
+def batched_backfill(
+    connection: Connection,
+    table_name: str,
+    values: Dict[str, Any],
+    where: Optional[sa.ColumnElement] = None,
+    key: str = "id",
+    checkpoint: Optional[str] = None,
+    batch_size: Optional[int] = None,
+    pause_seconds: Optional[float] = None,
+    max_batch_seconds: Optional[float] = None,
+) -> int:
+    """
+    UPDATE `table_name` SET `values` in keyset-ordered chunks of `batch_size` rows.
+
+    Each batch selects the next `batch_size` keys after the last one processed and updates the
+    key range `last < key <= upto` (an index range scan on the primary key, no large IN list).
+    `values` and `where` may reference the table's columns with `sa.column(name)`.
+
+    With `checkpoint`, the last processed key is stored in migration_checkpoints after every batch
+    and a rerun resumes from there; a completed checkpoint makes the call a no-op. The connection
+    should be in autocommit mode (`op.get_context().autocommit_block()`), otherwise everything is
+    still one transaction. `pause_seconds` sleeps between batches to leave room for live traffic and
+    replication; a batch slower than `max_batch_seconds` halves the batch size.
+
+    Returns the number of rows updated by this call.
+    """
+    batch_size = batch_size or settings.MIGRATION_BATCH_SIZE
+    pause_seconds = settings.MIGRATION_BATCH_PAUSE_SECONDS if pause_seconds is None else pause_seconds
+    max_batch_seconds = settings.MIGRATION_MAX_BATCH_SECONDS if max_batch_seconds is None else max_batch_seconds
+
+    table = sa.table(table_name, sa.column(key), *(sa.column(name) for name in values if name != key))
+    key_column = table.c[key]
+
+    state = _load_checkpoint(connection, checkpoint) if checkpoint else None
+    if state and state["completed"]:
+        logger.info(f"Backfill {checkpoint} already completed ({state['rows_done']} rows), skipping")
+        return 0
+    last_key = state["last_key"] if state else None
+    rows_done = state["rows_done"] if state else 0
+    has_row = state is not None
+
+    updated = 0
+    while True:
+        started = time.perf_counter()
+        keys = sa.select(key_column).order_by(key_column).limit(batch_size)
+        if last_key is not None:
+            keys = keys.where(key_column > last_key)
+        if where is not None:
+            keys = keys.where(where)
+        batch = connection.execute(keys).scalars().all()
+        if not batch:
+            break
+
+        upto = batch[-1]
+        statement = sa.update(table).where(key_column <= upto).values(**values)
+        if last_key is not None:
+            statement = statement.where(key_column > last_key)
+        if where is not None:
+            statement = statement.where(where)
+        count = connection.execute(statement).rowcount
+        if count is not None and count >= 0:
+            updated += count
+            rows_done += count
+
+        if checkpoint:
+            _save_checkpoint(connection, checkpoint, upto, rows_done, False, exists=has_row)
+            has_row = True
+        last_key = upto
+
+        elapsed = time.perf_counter() - started
+        logger.info(f"Backfill {checkpoint or table_name}: {rows_done} rows, up to {key} {upto} ({elapsed:.2f}s)")
+        if len(batch) < batch_size:
+            break
+        if max_batch_seconds and elapsed > max_batch_seconds and batch_size > MIN_BATCH_SIZE:
+            batch_size = max(batch_size // 2, MIN_BATCH_SIZE)
+        if pause_seconds:
+            time.sleep(pause_seconds)
+
+    if checkpoint:
+        _save_checkpoint(connection, checkpoint, last_key, rows_done, True, exists=has_row)
+    return updated
+
+
+def _index_exists(connection: Connection, table_name: str, index_name: str) -> bool:
+    return any(index["name"] == index_name for index in sa.inspect(connection).get_indexes(table_name))
+
+
+def _index_columns(connection: Connection, columns: List[str]) -> str:
+    quote = connection.dialect.identifier_preparer.quote
+    rendered = []
+    for column in columns:
+        name, _, direction = column.partition(" ")
+        rendered.append(f"{quote(name)} {direction}".strip())
+    return ", ".join(rendered)
+
+
+def create_index_online(
+    connection: Connection,
+    index_name: str,
+    table_name: str,
+    columns: List[str],
+    unique: bool = False,
+) -> bool:
+    """
+    Create an index without blocking writes where the database supports it.
+
+    MySQL uses `ALTER TABLE ... ADD INDEX ..., ALGORITHM=INPLACE, LOCK=NONE` (the statement fails
+    rather than silently falling back to a locking copy), PostgreSQL `CREATE INDEX CONCURRENTLY`
+    (needs the autocommit block) and anything else a plain CREATE INDEX. Columns take an optional
+    direction, e.g. "created_at DESC". Returns False if the index already exists.
+    """
+    if _index_exists(connection, table_name, index_name):
+        return False
+    quote = connection.dialect.identifier_preparer.quote
+    columns_sql = _index_columns(connection, columns)
+    kind = "UNIQUE INDEX" if unique else "INDEX"
+    dialect = connection.dialect.name
+    if dialect == "mysql":
+        statement = (
+            f"ALTER TABLE {quote(table_name)} ADD {kind} {quote(index_name)} ({columns_sql}), "
+            f"ALGORITHM=INPLACE, LOCK=NONE"
+        )
+    elif dialect == "postgresql":
+        statement = f"CREATE {kind} CONCURRENTLY {quote(index_name)} ON {quote(table_name)} ({columns_sql})"
+    else:
+        statement = f"CREATE {kind} {quote(index_name)} ON {quote(table_name)} ({columns_sql})"
+    started = time.perf_counter()
+    connection.execute(sa.text(statement))
+    logger.info(f"Created index {index_name} on {table_name} in {time.perf_counter() - started:.1f}s")
+    return True
+
+
+def drop_index_online(connection: Connection, index_name: str, table_name: str) -> bool:
+    """
+    Drop an index without blocking writes where supported. Returns False if it does not exist.
+    """
+    if not _index_exists(connection, table_name, index_name):
+        return False
+    quote = connection.dialect.identifier_preparer.quote
+    dialect = connection.dialect.name
+    if dialect == "mysql":
+        statement = f"ALTER TABLE {quote(table_name)} DROP INDEX {quote(index_name)}, ALGORITHM=INPLACE, LOCK=NONE"
+    elif dialect == "postgresql":
+        statement = f"DROP INDEX CONCURRENTLY {quote(index_name)}"
+    else:
+        statement = f"DROP INDEX {quote(index_name)}"
+    connection.execute(sa.text(statement))
+    return True
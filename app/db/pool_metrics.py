@@ -0,0 +1,103 @@
+import logging
+import time
+from threading import Lock
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+logger = logging.getLogger("fastapi")
+
+
+class PoolMetrics:
+    """
+    Thread-safe counters for connection checkouts from one pool.
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self.checkouts = 0
+        self.checkout_time_total = 0.0
+        self.checkout_time_max = 0.0
+        self.overflow_checkouts = 0
+        self.timeouts = 0
+
+    def record_checkout(self, seconds: float, overflowed: bool) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.checkout_time_total += seconds
+            self.checkout_time_max = max(self.checkout_time_max, seconds)
+            if overflowed:
+                self.overflow_checkouts += 1
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self.timeouts += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            average = self.checkout_time_total / self.checkouts if self.checkouts else 0.0
+            return {
+                "checkouts": self.checkouts,
+                "checkout_ms_avg": round(average * 1000, 3),
+                "checkout_ms_max": round(self.checkout_time_max * 1000, 3),
+                "overflow_checkouts": self.overflow_checkouts,
+                "timeouts": self.timeouts,
+            }
+
+
+class CheckoutTimingMixin:
+    """
+    Pool mixin that times every checkout, including the wait for a free connection,
+    opening overflow connections and pre-ping.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def recreate(self):
+        # Keep the counters when the engine replaces its pool (e.g. after dispose())
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+    def connect(self):
+        start = time.perf_counter()
+        overflow_before = self.overflow()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self.metrics.record_timeout()
+            logger.warning(f"Database pool checkout timed out: {self.status()}")
+            raise
+        self.metrics.record_checkout(
+            time.perf_counter() - start,
+            overflowed=self.overflow() > max(overflow_before, 0)
+        )
+        return connection
+
+
+class InstrumentedQueuePool(CheckoutTimingMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(CheckoutTimingMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def get_pool_stats(engine) -> dict:
+    """
+    Current pool occupancy plus the cumulative checkout metrics, if the engine's pool is instrumented.
+    """
+    pool = engine.pool  # AsyncEngine.pool proxies the underlying sync pool
+    stats = {"pool_class": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        stats.update({
+            "size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "in_use": pool.checkedout(),
+            "overflow": max(pool.overflow(), 0),
+        })
+    metrics = getattr(pool, "metrics", None)
+    if metrics is not None:
+        stats.update(metrics.snapshot())
+    return stats
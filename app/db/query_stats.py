@@ -0,0 +1,136 @@
+import logging
+import time
+from contextvars import ContextVar
+from threading import Lock
+from typing import Optional
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.core.config import settings
+
+logger = logging.getLogger("fastapi")
+
+# Stats of the request currently being handled. Worker threads (run_in_threadpool) and
+# async driver greenlets inherit the context, so every statement lands on the same object.
+_current_stats: ContextVar[Optional["RequestQueryStats"]] = ContextVar("request_query_stats", default=None)
+
+# Number of slowest statements kept per request
+SLOWEST_STATEMENTS = 3
+
+
+class RequestQueryStats:
+    def __init__(self):
+        self._lock = Lock()
+        self.count = 0
+        self.total_seconds = 0.0
+        self.slowest: list[tuple[float, str]] = []
+        self.statement_counts: dict[str, int] = {}
+
+    def record(self, statement: str, seconds: float) -> None:
+        with self._lock:
+            self.count += 1
+            self.total_seconds += seconds
+            self.statement_counts[statement] = self.statement_counts.get(statement, 0) + 1
+            self.slowest.append((seconds, statement))
+            self.slowest.sort(key=lambda item: item[0], reverse=True)
+            del self.slowest[SLOWEST_STATEMENTS:]
+
+    @property
+    def total_ms(self) -> float:
+        return self.total_seconds * 1000
+
+    def most_repeated(self) -> tuple[int, str]:
+        with self._lock:
+            if not self.statement_counts:
+                return 0, ""
+            statement, count = max(self.statement_counts.items(), key=lambda item: item[1])
+            return count, statement
+
+    def server_timing(self) -> str:
+        return f'db;dur={self.total_ms:.1f};desc="{self.count} queries"'
+
+
+def _shorten(statement: str, limit: int = 300) -> str:
+    statement = " ".join(statement.split())
+    return statement if len(statement) <= limit else statement[:limit] + "..."
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info.get("query_start_time")
+    if not started:
+        return
+    elapsed = time.perf_counter() - started.pop()
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.record(statement, elapsed)
+
+
+def _handle_error(exception_context):
+    connection = exception_context.connection
+    if connection is not None and connection.info.get("query_start_time"):
+        connection.info["query_start_time"].pop()
+
+
+def install_query_listeners() -> None:
+    """
+    Listen on the Engine class so the primary, async and replica engines are all covered.
+    """
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(Engine, "handle_error", _handle_error)
+
+
+class QueryStatsMiddleware:
+    """
+    Collect per-request query count and DB time, expose them in a Server-Timing header and
+    log requests that look like N+1 patterns or run slow statements.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        install_query_listeners()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestQueryStats()
+        token = _current_stats.set(stats)
+
+        async def send_with_server_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).append("Server-Timing", stats.server_timing())
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_server_timing)
+        finally:
+            _current_stats.reset(token)
+            self.log_request(scope, stats)
+
+    def log_request(self, scope: Scope, stats: RequestQueryStats) -> None:
+        route = f"{scope['method']} {scope['path']}"
+        summary = f"{route} issued {stats.count} queries in {stats.total_ms:.1f}ms"
+
+        if stats.count > settings.SQL_QUERY_COUNT_THRESHOLD:
+            repeated, statement = stats.most_repeated()
+            logger.warning(
+                f"Possible N+1: {summary} (threshold {settings.SQL_QUERY_COUNT_THRESHOLD}); "
+                f"most repeated statement ran {repeated}x: {_shorten(statement)}"
+            )
+        elif settings.SQL_LOG_ALL_REQUESTS:
+            logger.info(summary)
+
+        for seconds, statement in stats.slowest:
+            if seconds * 1000 > settings.SQL_SLOW_QUERY_MS:
+                logger.warning(
+                    f"Slow query in {route}: {seconds * 1000:.1f}ms "
+                    f"(threshold {settings.SQL_SLOW_QUERY_MS}ms): {_shorten(statement)}"
+                )
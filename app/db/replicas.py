@@ -0,0 +1,169 @@
+import itertools
+import logging
+import time
+from contextlib import contextmanager
+from threading import Lock
+from typing import Optional
+from fastapi import Request
+from sqlalchemy import create_engine, event, exc
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.db.database import SessionLocal, async_database_url, engine, engine_options, get_async_db, get_async_engine
+
+logger = logging.getLogger("fastapi")
+
+# Requests carrying this header (or an Authorization header) always read from the primary
+READ_PRIMARY_HEADER = "x-read-primary"
+
+
+class Replica:
+    """
+    One read replica. Engines are created on first use; a replica that fails to hand out a
+    connection is skipped until `unhealthy_until`.
+    """
+
+    def __init__(self, url: str):
+        self.url = url
+        self.unhealthy_until = 0.0
+        self._engine = None
+        self._async_engine = None
+        self._lock = Lock()
+
+    @property
+    def engine(self):
+        with self._lock:
+            if self._engine is None:
+                self._engine = create_engine(self.url, **engine_options(self.url))
+            return self._engine
+
+    @property
+    def async_engine(self):
+        with self._lock:
+            if self._async_engine is None:
+                url = async_database_url(self.url)
+                self._async_engine = create_async_engine(url, **engine_options(url, is_async=True))
+            return self._async_engine
+
+    def engines(self) -> dict:
+        return {"sync": self._engine, "async": self._async_engine}
+
+
+class ReplicaRouter:
+    """
+    Round-robin over the healthy replicas, with a cool-down for replicas that failed.
+    """
+
+    def __init__(self, urls: list[str], retry_seconds: int):
+        self.replicas = [Replica(url) for url in urls]
+        self.retry_seconds = retry_seconds
+        self._counter = itertools.count()
+
+    def candidates(self) -> list[Replica]:
+        """
+        Healthy replicas, rotated so consecutive requests start from a different one.
+        """
+        now = time.monotonic()
+        healthy = [replica for replica in self.replicas if replica.unhealthy_until <= now]
+        if not healthy:
+            return []
+        start = next(self._counter) % len(healthy)
+        return healthy[start:] + healthy[:start]
+
+    def mark_failed(self, replica: Replica, error: Exception) -> None:
+        replica.unhealthy_until = time.monotonic() + self.retry_seconds
+        logger.warning(
+            f"Read replica unavailable, skipping it for {self.retry_seconds}s: {error}"
+        )
+
+
+def _replica_urls() -> list[str]:
+    return [url.strip() for url in settings.DATABASE_REPLICA_URLS.split(",") if url.strip()]
+
+
+replica_router = ReplicaRouter(_replica_urls(), settings.DB_REPLICA_RETRY_SECONDS)
+
+
+def wants_primary(request: Optional[Request]) -> bool:
+    """
+    Authenticated requests come from the admin panel, which reads back what it just wrote,
+    so they stay on the primary to avoid replication lag.
+    """
+    if request is None:
+        return False
+    return "authorization" in request.headers or READ_PRIMARY_HEADER in request.headers
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _fail_over_to_primary(orm_execute_state):
+    """
+    Retry a read once on the primary when the replica a session is bound to fails mid-query
+    (connection dropped, replica restarting); the rest of the session then uses the primary.
+    """
+    session = orm_execute_state.session
+    replica = session.info.get("replica")
+    if replica is None or not orm_execute_state.is_select:
+        return None
+    try:
+        return orm_execute_state.invoke_statement()
+    except exc.OperationalError as e:
+        replica_router.mark_failed(replica, e)
+        del session.info["replica"]
+        session.bind = session.info.pop("primary_bind")
+        return orm_execute_state.invoke_statement(bind_arguments={"bind": session.bind})
+
+
+@contextmanager
+def read_session(request: Optional[Request] = None):
+    """
+    Sync session bound to a healthy replica, falling back to the primary when none can be
+    reached or the replica fails mid-query.
+    """
+    if not wants_primary(request):
+        for replica in replica_router.candidates():
+            try:
+                connection = replica.engine.connect()
+            except exc.DBAPIError as e:
+                replica_router.mark_failed(replica, e)
+                continue
+            db = Session(bind=connection, autoflush=False, info={"replica": replica, "primary_bind": engine})
+            try:
+                yield db
+            finally:
+                db.close()
+                connection.close()
+            return
+
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+async def get_async_read_db(request: Request):
+    """
+    Async session for the public read endpoints, with the same replica routing and failover
+    as read_session.
+    """
+    if not wants_primary(request):
+        for replica in replica_router.candidates():
+            try:
+                connection = await replica.async_engine.connect()
+            except exc.DBAPIError as e:
+                replica_router.mark_failed(replica, e)
+                continue
+            try:
+                async with AsyncSession(
+                    bind=connection,
+                    autoflush=False,
+                    expire_on_commit=False,
+                    info={"replica": replica, "primary_bind": get_async_engine().sync_engine}
+                ) as db:
+                    yield db
+            finally:
+                await connection.close()
+            return
+
+    async for db in get_async_db():
+        yield db
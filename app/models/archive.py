@@ -0,0 +1,57 @@
+from sqlalchemy import Column, DateTime, Index, MetaData, Table
+from app.db.database import Base
+from app.models.contact import ContactInquiry
+from app.models.feature_publication import FeaturePublication
+from app.models.job_applicants import JobApplicant
+from app.models.jobs import Job
+from app.models.lab_gallery import LabGallery
+from app.models.news import News
+from app.models.papers import Paper
+from app.models.team import TeamMember
+
+# Soft-deleting models whose dead rows are moved out of the hot table, keyed by the name used
+# in the archive API and script. Children come before their parents so a single archival run
+# can move applicants and then the jobs they pointed at.
+ARCHIVED_MODELS = {
+    "contact_inquiries": ContactInquiry,
+    "job_applicants": JobApplicant,
+    "jobs": Job,
+    "news": News,
+    "team": TeamMember,
+    "lab_gallery": LabGallery,
+    "papers": Paper,
+    "feature_publication": FeaturePublication,
+}
+
+
+def build_archive_table(table: Table, metadata: MetaData) -> Table:
+    """
+    Create `<table>_archive` with the same columns as `table` plus `archived_at`.
+
+    Only the primary key is kept: no defaults, foreign keys or secondary indexes, so archiving
+    is a plain copy and archived rows never constrain the hot tables.
+    """
+    columns = [
+        Column(
+            column.name,
+            column.type.copy(),
+            primary_key=column.primary_key,
+            autoincrement=False,
+            nullable=column.nullable,
+        )
+        for column in table.columns
+    ]
+    archive = Table(
+        f"{table.name}_archive",
+        metadata,
+        *columns,
+        Column("archived_at", DateTime, nullable=False),
+    )
+    Index(f"ix_{table.name}_archive_archived_at", archive.c.archived_at)
+    return archive
+
+
+ARCHIVE_TABLES = {
+    name: build_archive_table(model.__table__, Base.metadata)
+    for name, model in ARCHIVED_MODELS.items()
+}
@@ -1,4 +1,4 @@
-from sqlalchemy import Boolean, Column, Integer, String, Text, DateTime
+from sqlalchemy import Boolean, Column, Integer, String, Text, DateTime, Index
 from app.db.database import Base
 from datetime import datetime, timezone
 
@@ -19,3 +19,7 @@ class ContactInquiry(Base):
     created_at = Column(DateTime, default=utc_now)
     updated_at = Column(DateTime, default=utc_now, onupdate=utc_now)
 
+    __table_args__ = (
+        Index("ix_contact_inquiries_list_order", is_deleted, created_at.desc()),
+        Index("ix_contact_inquiries_subject_list_order", is_deleted, subject, created_at.desc()),
+    )
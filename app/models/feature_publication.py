@@ -1,4 +1,5 @@
-from sqlalchemy import Boolean, Column, Integer, String, DateTime, Enum, Text
+from sqlalchemy import Boolean, Column, Integer, String, DateTime, Enum, Text, Index
+from sqlalchemy.orm import query_expression
 from app.db.database import Base
 from datetime import datetime, timezone
 
@@ -20,8 +21,14 @@ class FeaturePublication(Base):
     nct_number = Column(String(50), default="",index=True)
     doi = Column(String(100), default="", index=True)
     is_presentation = Column(Boolean, default=False,index=True)
-    order = Column(Integer, nullable=False, default=1, index=True)
+    order = Column(Integer, nullable=False, default=1, index=True)  # sparse sort key, see app/services/reorder.py
+    position = query_expression()  # 1-based display position, loaded with with_order_position
+    image_variants = query_expression()  # image_assets.variants, loaded with with_image_variants
     is_open=Column(Boolean, default=False, index=True)
     created_at = Column(DateTime, default=utc_now)
     updated_at = Column(DateTime, default=utc_now, onupdate=utc_now)
-    is_deleted = Column(Boolean, default=False, nullable=False, index=True)
\ No newline at end of file
+    is_deleted = Column(Boolean, default=False, nullable=False, index=True)
+
+    __table_args__ = (
+        Index("ix_feature_publication_list_order", is_deleted, order, created_at.desc()),
+    )
@@ -0,0 +1,35 @@
+from sqlalchemy import Column, Integer, String, DateTime, Index, JSON
+from app.db.database import Base
+from datetime import datetime, timezone
+
+
+def utc_now():
+    return datetime.now(timezone.utc)
+
+class ImageAsset(Base):
+    """
+    One stored image file, named after the sha256 of its content. Identical uploads share the
+    row and the file; `ref_count` counts the uploads not yet deleted or replaced, and the file
+    is removed when it drops to zero.
+
+    The table is also the image library catalog (list_all_images), kept in sync by the upload and
+    delete paths and by scripts/reconcile_images.py for files added or removed out of band.
+    Response models read `variants` through the with_image_variants query option.
+    """
+    __tablename__ = "image_assets"
+
+    id = Column(Integer, primary_key=True, autoincrement=True, index=True)
+    # NULL for a legacy file whose content is already registered under another name
+    sha256 = Column(String(64), unique=True, index=True, nullable=True)
+    filename = Column(String(255), unique=True, nullable=False)
+    stage = Column(String(50), nullable=True)  # stage of the first upload
+    size = Column(Integer, nullable=False)
+    ref_count = Column(Integer, nullable=False, default=1)
+    # Variant manifest (see app/services/image_variants.py), NULL when the image has none
+    variants = Column(JSON(none_as_null=True), nullable=True)
+    created_at = Column(DateTime, default=utc_now, nullable=False)
+    updated_at = Column(DateTime, default=utc_now, onupdate=utc_now, nullable=False)
+
+    __table_args__ = (
+        Index("ix_image_assets_list_order", created_at.desc(), id.desc()),
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, ForeignKey, Integer, String, Text, DateTime, Boolean
+from sqlalchemy import Column, ForeignKey, Integer, String, Text, DateTime, Boolean, Index
 from sqlalchemy.orm import relationship
 from app.db.database import Base
 from datetime import datetime, timezone
@@ -18,4 +18,9 @@ class JobApplicant(Base):
     cv_file_path = Column(String(500), nullable=False)
     created_at = Column(DateTime, default=utc_now, nullable=False)
     updated_at = Column(DateTime, default=utc_now, onupdate=utc_now, nullable=False)
-    is_deleted = Column(Boolean, default=False, nullable=False, index=True)
\ No newline at end of file
+    is_deleted = Column(Boolean, default=False, nullable=False, index=True)
+
+    __table_args__ = (
+        Index("ix_job_applicants_job_created_at", job_id, created_at.desc()),
+        Index("ix_job_applicants_created_at", created_at.desc()),
+    )
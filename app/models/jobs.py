@@ -1,4 +1,5 @@
-from sqlalchemy import Boolean, Column, Integer, String, Text, DateTime, Enum as SQLEnum
+from sqlalchemy import Boolean, Column, Integer, String, Text, DateTime, Enum as SQLEnum, Index
+from sqlalchemy.orm import query_expression
 from app.db.database import Base
 from datetime import datetime, timezone
 from app.schemas.jobs import JobTypeEnum, JobStatusEnum
@@ -20,8 +21,15 @@ class Job(Base):
     job_tenure= Column(String(255), nullable=True)
     required_qualifications = Column(Text, nullable=True)
     preferred_qualifications = Column(Text, nullable=True)
-    order = Column(Integer, nullable=False, default=1, index=True)
+    order = Column(Integer, nullable=False, default=1, index=True)  # sparse sort key, see app/services/reorder.py
+    position = query_expression()  # 1-based display position, loaded with with_order_position
     created_at = Column(DateTime, default=utc_now, nullable=False)
     updated_at = Column(DateTime, default=utc_now, onupdate=utc_now, nullable=False)
     is_deleted = Column(Boolean, default=False, nullable=False, index=True)
     
+
+    __table_args__ = (
+        # status last, so `status IN (...)` lists are read in index order without a filesort
+        Index("ix_jobs_list_order", is_deleted, order, created_at.desc(), status),
+        Index("ix_jobs_status_list_order", is_deleted, status, order, created_at.desc()),
+    )
@@ -1,4 +1,5 @@
-from sqlalchemy import Boolean, Column, Integer, String, Text, DateTime
+from sqlalchemy import Boolean, Column, Integer, String, Text, DateTime, Index
+from sqlalchemy.orm import query_expression
 from app.db.database import Base
 from datetime import datetime, timezone
 
@@ -13,7 +14,9 @@ class LabGallery(Base):
     title = Column(String(255), nullable=False,default="")
     content = Column(Text, nullable=False,default="")
     image_url = Column(String(255), nullable=True,default="")
-    order = Column(Integer, nullable=False, default=1, index=True)
+    order = Column(Integer, nullable=False, default=1, index=True)  # sparse sort key, see app/services/reorder.py
+    position = query_expression()  # 1-based display position, loaded with with_order_position
+    image_variants = query_expression()  # image_assets.variants, loaded with with_image_variants
     category = Column(String(100), nullable=False, default="")
     date = Column(String(100), nullable=False, default="")
     location = Column(String(255), nullable=False, default="")
@@ -22,3 +25,7 @@ class LabGallery(Base):
     created_at = Column(DateTime, default=utc_now, nullable=False)
     updated_at = Column(DateTime, default=utc_now, onupdate=utc_now, nullable=False)
     is_deleted = Column(Boolean, default=False, nullable=False, index=True)
+
+    __table_args__ = (
+        Index("ix_lab_gallery_list_order", is_deleted, order, created_at.desc()),
+    )
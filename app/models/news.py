@@ -1,4 +1,5 @@
-from sqlalchemy import Boolean, Column, Integer, String, Text, DateTime, Enum as SQLEnum
+from sqlalchemy import Boolean, Column, Integer, String, Text, DateTime, Enum as SQLEnum, Index
+from sqlalchemy.orm import query_expression
 from app.db.database import Base
 from datetime import datetime, timezone
 
@@ -15,9 +16,14 @@ class News(Base):
     image_url = Column(String(255), nullable=True,default="")
     hyperlink = Column(String(255), nullable=True,default="")
     publish_date = Column(DateTime, default=utc_now, nullable=False)
-    order = Column(Integer, nullable=False, default=1, index=True)
+    order = Column(Integer, nullable=False, default=1, index=True)  # sparse sort key, see app/services/reorder.py
+    position = query_expression()  # 1-based display position, loaded with with_order_position
+    image_variants = query_expression()  # image_assets.variants, loaded with with_image_variants
     is_open = Column(Boolean, default=False, index=True)
     created_at = Column(DateTime, default=utc_now, nullable=False)
     updated_at = Column(DateTime, default=utc_now, onupdate=utc_now, nullable=False)
     is_deleted = Column(Boolean, default=False, nullable=False, index=True)
 
+    __table_args__ = (
+        Index("ix_news_list_order", is_deleted, order, created_at.desc()),
+    )
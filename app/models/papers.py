@@ -1,5 +1,6 @@
 
 from sqlalchemy import ARRAY, JSON, Column, Integer, String, DateTime, Boolean, Text,Index
+from sqlalchemy.orm import query_expression
 from app.db.database import Base
 from datetime import datetime, timezone
 
@@ -21,7 +22,8 @@ class Paper(Base):
     tags = Column(JSON, default = lambda: {"tag": []})
     doi = Column(String(100), default="", index=True)
     category = Column(JSON, default = lambda:[])
-    order = Column(Integer, nullable=False, default=1, index=True)
+    order = Column(Integer, nullable=False, default=1, index=True)  # sparse sort key, see app/services/reorder.py
+    position = query_expression()  # 1-based display position, loaded with with_order_position
     is_presentation = Column(Boolean, default=False,index=True)
     is_open = Column(Boolean, default=False, index=True)
     created_at = Column(DateTime, default=utc_now)
@@ -33,6 +35,7 @@ class Paper(Base):
         Index('ix_papers_title', 'title', mysql_length=191),
         Index('ix_papers_abstract', 'abstract', mysql_length=191),
         Index('ix_papers_authers', 'authers', mysql_length=191),
+        Index('ix_papers_list_order', is_deleted, order, created_at.desc()),
     )
 
     @classmethod
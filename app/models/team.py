@@ -1,4 +1,5 @@
-from sqlalchemy import Boolean, Column, Integer, String, Text, DateTime
+from sqlalchemy import Boolean, Column, Integer, String, Text, DateTime, Index
+from sqlalchemy.orm import query_expression
 from app.db.database import Base
 from datetime import datetime, timezone
 
@@ -16,10 +17,13 @@ class TeamMember(Base):
     description = Column(Text, nullable=False,default="")
     image_url = Column(String(255), nullable=True,default=None)
     hyperlink = Column(String(255), nullable=False,default="")
-    order = Column(Integer, nullable=False, default=1, index=True)
+    order = Column(Integer, nullable=False, default=1, index=True)  # sparse sort key, see app/services/reorder.py
+    position = query_expression()  # 1-based display position, loaded with with_order_position
+    image_variants = query_expression()  # image_assets.variants, loaded with with_image_variants
     is_deleted = Column(Boolean, default=False, nullable=False, index=True)
     created_at = Column(DateTime, default=utc_now)
     updated_at = Column(DateTime, default=utc_now, onupdate=utc_now)
 
-
-
+    __table_args__ = (
+        Index("ix_team_members_list_order", is_deleted, order, created_at.desc()),
+    )
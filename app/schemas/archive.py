@@ -0,0 +1,18 @@
+from enum import Enum
+from typing import Dict
+from pydantic import BaseModel
+
+
+class ArchiveTable(str, Enum):
+    CONTACT_INQUIRIES = "contact_inquiries"
+    JOB_APPLICANTS = "job_applicants"
+    JOBS = "jobs"
+    NEWS = "news"
+    TEAM = "team"
+    LAB_GALLERY = "lab_gallery"
+    PAPERS = "papers"
+    FEATURE_PUBLICATION = "feature_publication"
+
+
+class ArchiveRunResponse(BaseModel):
+    archived: Dict[str, int]
@@ -0,0 +1,37 @@
+from enum import Enum
+from typing import Any, Dict, List, Optional
+from pydantic import BaseModel, Field
+
+
+class BulkAction(str, Enum):
+    CREATE = "create"
+    UPDATE = "update"
+    DELETE = "delete"
+
+
+class BulkOperation(BaseModel):
+    action: BulkAction
+    id: Optional[int] = Field(None, description="Required for update and delete")
+    data: Optional[Dict[str, Any]] = Field(
+        None,
+        description="Create or update fields, validated against the resource's create/update schema"
+    )
+
+
+class BulkRequest(BaseModel):
+    operations: List[BulkOperation] = Field(..., min_length=1)
+
+
+class BulkItemResult(BaseModel):
+    index: int
+    action: BulkAction
+    id: Optional[int] = None
+    success: bool
+    detail: Optional[str] = None
+
+
+class BulkResponse(BaseModel):
+    created: int
+    updated: int
+    deleted: int
+    results: List[BulkItemResult]
@@ -1,12 +1,16 @@
 from pydantic import BaseModel, Field
 from typing import Optional
 from datetime import datetime
+from app.schemas.images import ImageVariantsMixin
+
+class ReorderFeaturePublicationRequest(BaseModel):
+    order: int
 
 class DOIFeaturePublicationCreate(BaseModel):
     doi: str
     nct_number: Optional[str] = None
     is_presentation: bool= False
-    order: int = 1
+    order: Optional[int] = None
     is_open: bool = False
     image_url: Optional[str] = None
 
@@ -14,7 +18,7 @@ class PubmedFeaturePublicationCreate(BaseModel):
     pm_id: str 
     nct_number: Optional[str] = None
     is_presentation: bool= False
-    order: int = 1
+    order: Optional[int] = None
     is_open: bool = False
     image_url: Optional[str] = None
 class ManualFeaturePublicationCreate(BaseModel):
@@ -27,7 +31,7 @@ class ManualFeaturePublicationCreate(BaseModel):
     nct_number: Optional[str] 
     doi: Optional[str] 
     is_presentation: bool= False
-    order: int = 1
+    order: Optional[int] = None
     is_open: bool = False
     image_url: Optional[str] = None
 class FeaturePublicationUpdate(BaseModel):
@@ -44,7 +48,7 @@ class FeaturePublicationUpdate(BaseModel):
     is_open: Optional[bool] = None  
     image_url: Optional[str] = None 
 # Response Schema
-class FeaturePublicationResponse(BaseModel):
+class FeaturePublicationResponse(ImageVariantsMixin):
     id: int
     title: str
     abstract: str
@@ -55,7 +59,7 @@ class FeaturePublicationResponse(BaseModel):
     nct_number: str
     doi: str
     is_presentation: bool
-    order: int
+    order: int = Field(validation_alias="position")
     is_open: bool
     created_at: datetime
     updated_at: datetime
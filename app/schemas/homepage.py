@@ -0,0 +1,21 @@
+from enum import Enum
+from typing import List, Optional
+from pydantic import BaseModel
+from app.schemas.news import NewsResponse
+from app.schemas.feature_publication import FeaturePublicationResponse
+from app.schemas.team import TeamMemberResponse
+from app.schemas.lab_gallery import LabGalleryResponse
+
+
+class HomepageSection(str, Enum):
+    NEWS = "news"
+    FEATURE_PUBLICATION = "feature_publication"
+    TEAM = "team"
+    LAB_GALLERY = "lab_gallery"
+
+
+class HomepageResponse(BaseModel):
+    news: Optional[List[NewsResponse]] = None
+    feature_publication: Optional[List[FeaturePublicationResponse]] = None
+    team: Optional[List[TeamMemberResponse]] = None
+    lab_gallery: Optional[List[LabGalleryResponse]] = None
@@ -0,0 +1,27 @@
+from typing import List, Optional
+from pydantic import BaseModel
+
+
+class ImageVariant(BaseModel):
+    url: str
+    width: int
+    height: int
+    format: str
+    size: int
+
+
+class ImageVariants(BaseModel):
+    width: int
+    height: int
+    placeholder: Optional[str] = None  # tiny WebP data URI to show (blurred) while loading
+    variants: List[ImageVariant]
+
+
+class ImageVariantsMixin(BaseModel):
+    """
+    Adds `image_variants` (resized copies of `image_url` for srcset, plus a blur placeholder)
+    to a response model. Read from the row's `image_variants`, which queries load with
+    with_image_variants; None for external or unregistered images.
+    """
+
+    image_variants: Optional[ImageVariants] = None
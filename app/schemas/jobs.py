@@ -32,7 +32,7 @@ class JobCreate(BaseModel):
     job_tenure: Optional[str] = Field(None, max_length=255)
     required_qualifications: Optional[str] = None
     preferred_qualifications: Optional[str] = None
-    order: int = 1
+    order: Optional[int] = None
 
 
 class JobUpdate(BaseModel):
@@ -60,7 +60,7 @@ class JobResponse(BaseModel):
     job_tenure: Optional[str]
     required_qualifications: Optional[str]
     preferred_qualifications: Optional[str]
-    order: int
+    order: int = Field(validation_alias="position")
     class Config:
         from_attributes = True
 
@@ -81,6 +81,7 @@ class JobApplicationResponse(BaseModel):
     phone: Optional[str]
     cover_letter: Optional[str]
     cv_file_path: str
+    cv_download_url: Optional[str] = None  # signed, expiring link, filled in by the endpoint
 
     class Config:
         from_attributes = True
\ No newline at end of file
@@ -2,6 +2,11 @@ from enum import Enum
 from pydantic import BaseModel, Field
 from typing import Optional
 from datetime import datetime
+from app.schemas.images import ImageVariantsMixin
+
+
+class ReorderLabGalleryRequest(BaseModel):
+    order: int
 
 
 class LabGalleryCategory(str, Enum):
@@ -25,7 +30,7 @@ class LabGalleryCreate(BaseModel):
     title: str = Field(..., min_length=1, max_length=255)
     content: str = Field(..., min_length=1)
     image_url: Optional[str] = None
-    order: int = 1
+    order: Optional[int] = None
     category: LabGalleryCategory
     date: str = Field(..., min_length=1, max_length=100)
     location: str = Field(..., min_length=1, max_length=255)
@@ -45,12 +50,12 @@ class LabGalleryUpdate(BaseModel):
     status: Optional[LabGalleryStatus] = None
 
 
-class LabGalleryResponse(BaseModel):
+class LabGalleryResponse(ImageVariantsMixin):
     id: int
     title: str
     content: str
     image_url: Optional[str] = None
-    order: int
+    order: int = Field(validation_alias="position")
     category: LabGalleryCategory
     date: str
     location: str
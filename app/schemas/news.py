@@ -1,15 +1,38 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from datetime import datetime
 from typing import Optional
+from app.schemas.images import ImageVariantsMixin
 
-class NewsResponse(BaseModel):
+class ReorderNewsRequest(BaseModel):
+    order: int
+
+class NewsResponse(ImageVariantsMixin):
     id: int
     title: str
     content: str
     image_url: Optional[str] = None
     hyperlink: Optional[str] = None
     publish_date: datetime
-    order: int
+    order: int = Field(validation_alias="position")
     is_open: bool
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+class NewsCreate(BaseModel):
+    title: str = Field(..., min_length=1, max_length=255)
+    content: str = Field(..., min_length=1)
+    hyperlink: Optional[str] = Field(None, max_length=255)
+    publish_date: datetime
+    image_url: Optional[str] = None
+    order: Optional[int] = None
+    is_open: bool = False
+
+
+class NewsUpdate(BaseModel):
+    title: Optional[str] = Field(None, min_length=1, max_length=255)
+    content: Optional[str] = Field(None, min_length=1)
+    hyperlink: Optional[str] = Field(None, max_length=255)
+    publish_date: Optional[datetime] = None
+    image_url: Optional[str] = None
+    order: Optional[int] = None
+    is_open: Optional[bool] = None
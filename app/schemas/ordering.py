@@ -0,0 +1,6 @@
+from typing import List
+from pydantic import BaseModel, Field
+
+
+class ApplyOrderingRequest(BaseModel):
+    ids: List[int] = Field(..., min_length=1, description="Every non-deleted item id, in the desired order")
@@ -1,6 +1,6 @@
 from typing import List, Optional
 from enum import Enum
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 class ReorderPaperRequest(BaseModel):
     order: int
@@ -17,14 +17,14 @@ class DOIPaperCreate(BaseModel):
     nct_number: Optional[str] = None
     category: Optional[List[Category]] = None
     is_presentation: Optional[bool] = False
-    order: int = 1
+    order: Optional[int] = None
     is_open: bool = False
 class PubmedPaperCreate(BaseModel):
     pm_id: str 
     nct_number: Optional[str] = None
     category: Optional[List[Category]] = None
     is_presentation: Optional[bool] = False
-    order: int = 1
+    order: Optional[int] = None
     is_open: bool = False
 
 class ManualPaperCreate(BaseModel):
@@ -38,7 +38,7 @@ class ManualPaperCreate(BaseModel):
     doi: Optional[str] = None
     category: Optional[List[Category]] = None
     is_presentation: Optional[bool] = False
-    order: int = 1
+    order: Optional[int] = None
     is_open: bool = False
 class PaperUpdate(BaseModel):
     title: Optional[str] = None
@@ -65,7 +65,7 @@ class PaperResponse(BaseModel):
     tags: dict
     doi: str
     category: Optional[List[Category]] = None
-    order: int
+    order: int = Field(validation_alias="position")
     is_presentation: bool
     is_open: bool
     class Config:
@@ -3,6 +3,7 @@ from datetime import datetime
 from typing import Optional
 from enum import Enum
 from app.schemas.pagination import PaginatedResponse, PageInfo
+from app.schemas.images import ImageVariantsMixin
 
 class ReorderTeamMemberRequest(BaseModel):
     order: int
@@ -19,7 +20,27 @@ class TeamCategory(str, Enum):
     RESEARCH_TRAINEES = "research trainees"
     RESEARCH_FELLOWS_AND_ASSOCIATES = "research fellows and associates"
 
-class TeamMemberResponse(BaseModel):
+class TeamMemberCreate(BaseModel):
+    name: str = Field(..., min_length=1, max_length=50)
+    category: TeamCategory
+    role: str = Field(..., min_length=1, max_length=50)
+    designation: str = Field(..., min_length=1, max_length=50)
+    description: Optional[str] = None
+    hyperlink: Optional[str] = Field(None, max_length=255)
+    order: Optional[int] = None
+    image_url: Optional[str] = None
+
+class TeamMemberUpdate(BaseModel):
+    name: Optional[str] = Field(None, max_length=50)
+    category: Optional[TeamCategory] = None
+    role: Optional[str] = Field(None, max_length=50)
+    designation: Optional[str] = Field(None, max_length=50)
+    description: Optional[str] = None
+    hyperlink: Optional[str] = Field(None, max_length=255)
+    order: Optional[int] = None
+    image_url: Optional[str] = None
+
+class TeamMemberResponse(ImageVariantsMixin):
     id: int
     name: str
     category: TeamCategory
@@ -28,7 +49,7 @@ class TeamMemberResponse(BaseModel):
     description: str
     image_url: Optional[str] = None
     hyperlink: Optional[str] = None
-    order: int
+    order: int = Field(validation_alias="position")
 
     class Config:
         from_attributes = True
@@ -0,0 +1,152 @@
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
+from fastapi import HTTPException, status
+from sqlalchemy import DateTime, delete, exists, func, insert, literal, select
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.models.archive import ARCHIVE_TABLES, ARCHIVED_MODELS
+
+logger = logging.getLogger("fastapi")
+
+
+def utc_now():
+    return datetime.now(timezone.utc)
+
+
+def _live_children(name: str):
+    """
+    Foreign key columns of other hot tables pointing at this model. A parent row is only
+    archived once no hot row references it, so archiving never breaks a foreign key.
+    """
+    table = ARCHIVED_MODELS[name].__table__
+    for model in ARCHIVED_MODELS.values():
+        for fk in model.__table__.foreign_keys:
+            if fk.column.table is table:
+                yield fk.parent, fk.column
+
+
+def _archivable_ids(db: Session, name: str, cutoff: datetime, batch_size: int) -> List[int]:
+    model = ARCHIVED_MODELS[name]
+    query = select(model.id).where(model.is_deleted == True, model.updated_at < cutoff)
+    for child_column, parent_column in _live_children(name):
+        query = query.where(~exists().where(child_column == parent_column))
+    query = query.order_by(model.id).limit(batch_size).with_for_update(skip_locked=True)
+    return list(db.scalars(query).all())
+
+
+def archive_batch(db: Session, name: str, cutoff: datetime, batch_size: int) -> int:
+    """
+    Move one batch of rows soft-deleted before `cutoff` into the archive table.
+
+    Copy and delete happen in one short transaction per batch, so locks on the hot table are
+    held only for `batch_size` rows at a time.
+    """
+    table = ARCHIVED_MODELS[name].__table__
+    archive = ARCHIVE_TABLES[name]
+    ids = _archivable_ids(db, name, cutoff, batch_size)
+    if not ids:
+        db.rollback()
+        return 0
+
+    columns = [column.name for column in table.columns]
+    db.execute(
+        insert(archive).from_select(
+            columns + ["archived_at"],
+            select(*table.columns, literal(utc_now(), DateTime)).where(table.c.id.in_(ids))
+        )
+    )
+    db.execute(delete(table).where(table.c.id.in_(ids)))
+    db.commit()
+    return len(ids)
+
+
+def archive_soft_deleted(
+    db: Session,
+    older_than_days: Optional[int] = None,
+    batch_size: Optional[int] = None,
+    names: Optional[Iterable[str]] = None
+) -> Dict[str, int]:
+    """
+    Archive every row soft-deleted (by updated_at) more than `older_than_days` ago.
+
+    Returns the number of rows moved per table.
+    """
+    older_than_days = settings.ARCHIVE_AFTER_DAYS if older_than_days is None else older_than_days
+    batch_size = batch_size or settings.ARCHIVE_BATCH_SIZE
+    cutoff = utc_now() - timedelta(days=older_than_days)
+    selected = set(names) if names else set(ARCHIVED_MODELS)
+
+    moved = {}
+    # ARCHIVED_MODELS lists children first, so applicants leave before their jobs are checked
+    for name in ARCHIVED_MODELS:
+        if name not in selected:
+            continue
+        total = 0
+        while True:
+            count = archive_batch(db, name, cutoff, batch_size)
+            total += count
+            if count < batch_size:
+                break
+        moved[name] = total
+        if total:
+            logger.info(f"Archived {total} soft-deleted rows from {ARCHIVED_MODELS[name].__tablename__}")
+    return moved
+
+
+def list_archived(db: Session, name: str, page: int, size: int) -> Tuple[List[dict], int]:
+    """
+    Page through archived rows, most recently archived first.
+    """
+    archive = ARCHIVE_TABLES[name]
+    total = db.scalar(select(func.count()).select_from(archive))
+    rows = db.execute(
+        select(archive).order_by(archive.c.archived_at.desc(), archive.c.id.desc())
+        .offset((page - 1) * size).limit(size)
+    ).mappings().all()
+    return [dict(row) for row in rows], total
+
+
+def restore_item(db: Session, name: str, item_id: int) -> None:
+    """
+    Undelete an item, moving it back from the archive table if it has already been archived.
+
+    Raises:
+        HTTPException: If the item does not exist, is not deleted, or references an archived parent
+    """
+    model = ARCHIVED_MODELS[name]
+    item = db.get(model, item_id)
+    if item is not None:
+        if not item.is_deleted:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"{model.__name__} is not deleted"
+            )
+        item.is_deleted = False
+        item.updated_at = utc_now()
+        db.commit()
+        return
+
+    archive = ARCHIVE_TABLES[name]
+    row = db.execute(
+        select(archive).where(archive.c.id == item_id).with_for_update()
+    ).mappings().first()
+    if row is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"{model.__name__} not found"
+        )
+
+    for fk in model.__table__.foreign_keys:
+        value = row[fk.parent.name]
+        if value is not None and not db.scalar(select(exists().where(fk.column == value))):
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Restore {fk.column.table.name} {value} before this {model.__name__}"
+            )
+
+    values = {key: value for key, value in row.items() if key != "archived_at"}
+    values.update(is_deleted=False, updated_at=utc_now())
+    db.execute(insert(model.__table__).values(**values))
+    db.execute(delete(archive).where(archive.c.id == item_id))
+    db.commit()
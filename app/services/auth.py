@@ -1,7 +1,13 @@
+import asyncio
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from threading import Lock
+from typing import Callable, Optional
 from jose import JWTError, jwt
 from passlib.context import CryptContext
+from sqlalchemy import event, inspect
 from sqlalchemy.orm import Session
 from app.db.database import get_db
 from app.models.user import User
@@ -23,6 +29,54 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
+# bcrypt is deliberately slow (~250 ms of CPU). Async endpoints run it on a small dedicated pool
+# instead of the event loop, so logins can't stall every other request in the worker, and the
+# pool is kept small so a login storm can't take all the CPU either.
+_password_executor: Optional[ThreadPoolExecutor] = None
+_password_executor_lock = Lock()
+# One semaphore per event loop (asyncio primitives can't be shared between loops)
+_password_slots: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+
+
+def _get_password_executor() -> ThreadPoolExecutor:
+    global _password_executor
+    with _password_executor_lock:
+        if _password_executor is None:
+            _password_executor = ThreadPoolExecutor(
+                max_workers=settings.PASSWORD_HASH_MAX_CONCURRENCY,
+                thread_name_prefix="password-hash"
+            )
+        return _password_executor
+
+
+async def _run_password_hashing(func: Callable, *args):
+    loop = asyncio.get_running_loop()
+    slots = _password_slots.get(loop)
+    if slots is None:
+        slots = _password_slots[loop] = asyncio.Semaphore(settings.PASSWORD_HASH_MAX_CONCURRENCY)
+    try:
+        await asyncio.wait_for(slots.acquire(), timeout=settings.PASSWORD_HASH_QUEUE_TIMEOUT_SECONDS)
+    except asyncio.TimeoutError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many login attempts in progress. Please try again shortly.",
+            headers={"Retry-After": "1"}
+        )
+    future = loop.run_in_executor(_get_password_executor(), func, *args)
+    # The slot is freed when the hash actually finishes, even if the request is cancelled first
+    future.add_done_callback(lambda _: slots.release())
+    return await asyncio.shield(future)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    verify_password on the bounded password executor.
+
+    Raises:
+        HTTPException: 503 if no slot frees up within PASSWORD_HASH_QUEUE_TIMEOUT_SECONDS
+    """
+    return await _run_password_hashing(verify_password, plain_password, hashed_password)
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     to_encode = data.copy()
     if expires_delta:
@@ -33,6 +87,78 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
 
+# Authenticated principals by token subject (primary_email) -> (expires_at, column values).
+# Per process: other workers see a role change or deletion after at most the TTL, this one at once.
+_principal_cache: dict = {}
+_principal_cache_lock = Lock()
+
+# Not kept in memory; nothing downstream of get_current_user needs it
+_UNCACHED_COLUMNS = {"hashed_password"}
+
+
+def _get_cached_principal(email: str) -> Optional[User]:
+    with _principal_cache_lock:
+        entry = _principal_cache.get(email)
+        if entry is None:
+            return None
+        expires_at, values = entry
+        if expires_at < time.monotonic():
+            del _principal_cache[email]
+            return None
+    # A transient copy: never attached to the request's session, so it can't be flushed back
+    return User(**values)
+
+
+def _set_cached_principal(user: User) -> None:
+    if settings.AUTH_PRINCIPAL_CACHE_TTL_SECONDS <= 0:
+        return
+    values = {
+        column.key: getattr(user, column.key)
+        for column in User.__table__.columns
+        if column.key not in _UNCACHED_COLUMNS
+    }
+    with _principal_cache_lock:
+        if len(_principal_cache) >= settings.AUTH_PRINCIPAL_CACHE_MAX_ENTRIES:
+            now = time.monotonic()
+            for key in [key for key, (expires_at, _) in _principal_cache.items() if expires_at < now]:
+                del _principal_cache[key]
+            while len(_principal_cache) >= settings.AUTH_PRINCIPAL_CACHE_MAX_ENTRIES:
+                del _principal_cache[next(iter(_principal_cache))]
+        _principal_cache[user.primary_email] = (time.monotonic() + settings.AUTH_PRINCIPAL_CACHE_TTL_SECONDS, values)
+
+
+def invalidate_principal_cache(email: Optional[str] = None) -> None:
+    """
+    Drop one cached principal, or all of them when `email` is None.
+    Needed after bulk UPDATE / DELETE statements on users, which skip the ORM events below.
+    """
+    with _principal_cache_lock:
+        if email is None:
+            _principal_cache.clear()
+        else:
+            _principal_cache.pop(email, None)
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_changed_user(mapper, connection, target) -> None:
+    # Covers role changes, soft / hard deletion and email changes (old and new address)
+    history = inspect(target).attrs.primary_email.history
+    emails = {target.primary_email, *history.deleted}
+    for email in emails:
+        invalidate_principal_cache(email)
+    # Again after commit, in case a concurrent request cached the old row in between
+    session = Session.object_session(target)
+    if session is not None:
+        session.info.setdefault("changed_principals", set()).update(emails)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_users(session) -> None:
+    for email in session.info.pop("changed_principals", ()):
+        invalidate_principal_cache(email)
+
+
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
     db: Session = Depends(get_db)
@@ -58,11 +184,16 @@ async def get_current_user(
         
     except JWTError:
         raise credentials_exception
- 
+
+    user = _get_cached_principal(email)
+    if user is not None:
+        return user
+
     user = db.query(User).filter(User.primary_email == email).first()
     if user is None:
         raise credentials_exception
-    
+
+    _set_cached_principal(user)
     return user
 
 async def get_current_active_user(
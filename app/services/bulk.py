@@ -0,0 +1,178 @@
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional, Type
+from fastapi import HTTPException, status
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import Enum as SQLEnum, select, update
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.schemas.bulk import BulkAction, BulkItemResult, BulkOperation, BulkResponse
+from app.services.reorder import ORDER_KEY_GAP, next_order_key, reorder_item
+
+
+@dataclass
+class BulkResource:
+    """
+    How bulk operations map onto one model.
+
+    `create_schema` / `update_schema` validate each operation's data, `none_defaults` replaces
+    None on create for columns the single-row endpoints store as "" and `validate_create` runs any
+    extra per-item checks (returning an error message or None).
+    """
+    model: Type
+    create_schema: Type[BaseModel]
+    update_schema: Type[BaseModel]
+    none_defaults: Dict[str, Any] = field(default_factory=dict)
+    validate_create: Optional[Callable[[BaseModel], Optional[str]]] = None
+
+
+def _column_value(column, value):
+    # Enum-typed columns take the enum itself, plain string / JSON columns store its value
+    if isinstance(column.type, SQLEnum):
+        return value
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, list):
+        return [item.value if isinstance(item, Enum) else item for item in value]
+    return value
+
+
+def _to_values(resource: BulkResource, data: BaseModel, exclude_none: bool) -> Dict[str, Any]:
+    columns = resource.model.__table__.columns
+    values = {}
+    for key, value in data.model_dump(exclude_unset=exclude_none, exclude_none=exclude_none).items():
+        if value is None and key in resource.none_defaults:
+            value = resource.none_defaults[key]
+        values[key] = _column_value(columns[key], value)
+    return values
+
+
+def _error_message(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in item['loc']) or 'data'}: {item['msg']}"
+        for item in error.errors()
+    )
+
+
+def apply_bulk_operations(
+    db: Session,
+    resource: BulkResource,
+    operations: List[BulkOperation]
+) -> BulkResponse:
+    """
+    Validate and apply a batch of create / update / delete operations in one transaction.
+
+    Every operation is validated (schema, order, id present and not deleted) before anything is
+    written; if any fails, nothing is applied and a 422 carries the per-item results. Otherwise
+    creates are flushed together, updates run as one executemany UPDATE by primary key and deletes
+    as a single soft-delete UPDATE ... WHERE id IN (...).
+
+    `order` is a 1-based position, as on the single-item endpoints: creates are appended after the
+    last item, then every create or update carrying an `order` is moved there with reorder_item,
+    in operation order, once the creates and deletes are applied.
+
+    Raises:
+        HTTPException: If the batch is too large or any operation is invalid
+    """
+    model = resource.model
+    if len(operations) > settings.BULK_MAX_OPERATIONS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {settings.BULK_MAX_OPERATIONS} operations per request"
+        )
+
+    # One query for every id that is updated or deleted
+    target_ids = {op.id for op in operations if op.action != BulkAction.CREATE and op.id is not None}
+    live_ids = set()
+    if target_ids:
+        live_ids = set(db.scalars(
+            select(model.id).where(model.id.in_(target_ids), model.is_deleted == False)
+        ).all())
+
+    results: List[BulkItemResult] = []
+    creates, updates, deletes = [], [], []
+    # (id, or the create's result before it has one, 1-based position)
+    moves = []
+    for index, op in enumerate(operations):
+        result = BulkItemResult(index=index, action=op.action, id=op.id, success=True)
+        results.append(result)
+        try:
+            if op.action == BulkAction.CREATE:
+                data = resource.create_schema.model_validate(op.data or {})
+                error = resource.validate_create(data) if resource.validate_create else None
+                if error is None and data.order is not None and data.order < 1:
+                    error = "Order must be greater than 0"
+                if error is None:
+                    values = _to_values(resource, data, exclude_none=False)
+                    position = values.pop("order", None)
+                    creates.append((result, values))
+                    if position is not None:
+                        moves.append((result, position))
+            elif op.id is None:
+                error = "id is required"
+            elif op.id not in live_ids:
+                error = f"{model.__name__} not found"
+            elif op.action == BulkAction.UPDATE:
+                data = resource.update_schema.model_validate(op.data or {})
+                values = _to_values(resource, data, exclude_none=True)
+                position = values.pop("order", None)
+                error = "Order must be greater than 0" if position is not None and position < 1 else None
+                if error is None:
+                    updates.append({"id": op.id, **values})
+                    if position is not None:
+                        moves.append((op.id, position))
+            else:
+                error = None
+                deletes.append(op.id)
+        except ValidationError as e:
+            error = _error_message(e)
+        if error is not None:
+            result.success = False
+            result.detail = error
+
+    if any(not result.success for result in results):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail={
+                "message": "No changes were applied",
+                "results": [result.model_dump(mode="json") for result in results]
+            }
+        )
+
+    now = datetime.now(timezone.utc)
+    try:
+        if creates:
+            first_key = next_order_key(db, model)
+            items = [
+                model(**values, order=first_key + index * ORDER_KEY_GAP)
+                for index, (_, values) in enumerate(creates)
+            ]
+            db.add_all(items)
+            db.flush()
+            for (result, _), item in zip(creates, items):
+                result.id = item.id
+        if updates:
+            # ORM bulk UPDATE by primary key: grouped into executemany batches per set of columns
+            db.execute(update(model), [{**values, "updated_at": now} for values in updates])
+        if deletes:
+            db.execute(
+                update(model)
+                .where(model.id.in_(deletes))
+                .values(is_deleted=True, updated_at=now)
+                .execution_options(synchronize_session=False)
+            )
+        for target, position in moves:
+            item_id = target.id if isinstance(target, BulkItemResult) else target
+            reorder_item(db, model, item_id, position)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+    return BulkResponse(
+        created=len(creates),
+        updated=len(updates),
+        deleted=len(set(deletes)),
+        results=results
+    )
@@ -0,0 +1,106 @@
+import os
+import re
+from datetime import datetime, timedelta, timezone
+from pathlib import Path, PurePosixPath
+from typing import Optional
+from urllib.parse import quote
+from fastapi import HTTPException, status
+from jose import ExpiredSignatureError, JWTError, jwt
+from starlette.responses import Response
+from app.core.config import settings
+from app.core.static_files import RangeFileResponse, offload_file_response
+from app.models.job_applicants import JobApplicant
+
+# Claim distinguishing download tokens from access tokens signed with the same key
+CV_DOWNLOAD_TOKEN_TYPE = "cv_download"
+CV_DOWNLOAD_PATH = "/api/v1/jobs/applications/{application_id}/cv"
+CV_CACHE_CONTROL = "private, no-store"
+
+
+def create_cv_download_token(application_id: int, expires_in: Optional[int] = None) -> str:
+    """A signed token allowing the download of one applicant's CV for `expires_in` seconds."""
+    ttl = settings.CV_DOWNLOAD_LINK_TTL_SECONDS if expires_in is None else expires_in
+    expire = datetime.now(timezone.utc) + timedelta(seconds=ttl)
+    claims = {"typ": CV_DOWNLOAD_TOKEN_TYPE, "aid": application_id, "exp": expire}
+    return jwt.encode(claims, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+
+
+def cv_download_url(application_id: int, expires_in: Optional[int] = None) -> str:
+    """
+    Signed, expiring download URL for an applicant's CV, absolute when BASE_URL is set.
+
+    The token travels in the query string, so it is written to access and proxy logs; that is why
+    links are short-lived (CV_DOWNLOAD_LINK_TTL_SECONDS, or CV_DOWNLOAD_EMAIL_LINK_TTL_SECONDS for
+    the notification email) and only ever grant one applicant's CV.
+    """
+    base_url = (settings.BASE_URL or "").rstrip("/")
+    token = create_cv_download_token(application_id, expires_in)
+    return f"{base_url}{CV_DOWNLOAD_PATH.format(application_id=application_id)}?token={token}"
+
+
+def verify_cv_download_token(token: str, application_id: int) -> None:
+    """Raise 403 unless `token` is an unexpired download token for this application."""
+    try:
+        claims = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+    except ExpiredSignatureError:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Download link has expired"
+        )
+    except JWTError:
+        claims = None
+    if not claims or claims.get("typ") != CV_DOWNLOAD_TOKEN_TYPE or claims.get("aid") != application_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Invalid download link"
+        )
+
+
+def cv_path(application: JobApplicant) -> Optional[Path]:
+    """
+    Location of an applicant's CV, `CV_UPLOAD_DIR/<job_id>/<file>`. Only the file name of
+    `cv_file_path` is used, so both stored forms (`/cv_uploads/...` URLs and relative paths) work
+    and nothing outside the upload directory can be reached.
+    """
+    name = PurePosixPath(application.cv_file_path or "").name
+    if name in ("", ".", ".."):
+        return None
+    return settings.CV_UPLOAD_DIR / str(application.job_id) / name
+
+
+def _download_name(application: JobApplicant, path: Path) -> str:
+    name = re.sub(r"[^\w\- ]+", "", application.full_name or "").strip()
+    return f"CV - {name}{path.suffix}" if name else path.name
+
+
+def cv_file_response(application: JobApplicant) -> Response:
+    """
+    Send an applicant's CV as an attachment.
+
+    The file is streamed in chunks with Range / If-Range support, so memory stays flat whatever
+    its size. Files of CV_DOWNLOAD_OFFLOAD_MIN_SIZE bytes or more are handed to the front proxy
+    when STATIC_FILES_OFFLOAD is set; with nginx the accel prefix must be an internal location, e.g.
+
+        location /_protected/cv_uploads/ { internal; alias /srv/beaconlab/cv_uploads/; }
+    """
+    path = cv_path(application)
+    try:
+        stat_result = os.stat(path) if path is not None else None
+    except OSError:
+        stat_result = None
+    if stat_result is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="CV file not found"
+        )
+
+    headers = {
+        "Content-Disposition": f"attachment; filename*=utf-8''{quote(_download_name(application, path))}",
+        "Cache-Control": CV_CACHE_CONTROL,
+        "X-Content-Type-Options": "nosniff",
+    }
+    if settings.STATIC_FILES_OFFLOAD and stat_result.st_size >= settings.CV_DOWNLOAD_OFFLOAD_MIN_SIZE:
+        relative = PurePosixPath(str(application.job_id), path.name)
+        accel_uri = f"{settings.STATIC_FILES_ACCEL_PREFIX.rstrip('/')}/cv_uploads/{quote(str(relative))}"
+        return offload_file_response(str(path), accel_uri, settings.STATIC_FILES_OFFLOAD, headers=headers)
+    return RangeFileResponse(path, stat_result=stat_result, headers=headers)
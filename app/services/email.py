@@ -4,6 +4,7 @@ from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from app.core.config import settings
 from app.core.logging_config import setup_logging
+from app.services.cv_downloads import cv_download_url
 from app.services.email_client import SMTPClient
 
 logger = setup_logging()
@@ -292,7 +293,7 @@ def send_contact_inquiry_notification(
 
 
 def send_job_application_notification(
-    job_id: int,
+    application_id: int,
     job_title: str,
     full_name: str,
     email: str,
@@ -310,8 +311,8 @@ def send_job_application_notification(
         )
         return False
 
-    base_url = (settings.BASE_URL or "").rstrip("/")
-    cv_download_url = f"{base_url}/cv_uploads/{job_id}/{cv_filename}" if base_url else ""
+    # Signed, expiring link: CVs are not publicly served
+    cv_link = cv_download_url(application_id, settings.CV_DOWNLOAD_EMAIL_LINK_TTL_SECONDS) if settings.BASE_URL else ""
 
     phone_display = phone or "Not provided"
     cover_display = (cover_letter or "Not provided").strip()
@@ -404,7 +405,7 @@ def send_job_application_notification(
               <tr>
                 <td style="padding:10px 0; color:#6b7280;">CV file</td>
                 <td>
-                  {('<a href="' + html.escape(cv_download_url) + '" style="color:#2563eb; text-decoration:none;">Download CV</a>' if cv_download_url else html.escape(cv_filename))}
+                  {('<a href="' + html.escape(cv_link) + '" style="color:#2563eb; text-decoration:none;">Download CV</a>' if cv_link else html.escape(cv_filename))}
                 </td>
               </tr>
             </table>
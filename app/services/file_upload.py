@@ -1,10 +1,14 @@
-from datetime import datetime
-import os
+import logging
 from typing import Optional
 import uuid
 from pathlib import Path
 from fastapi import UploadFile, HTTPException, status
+from sqlalchemy.orm import Session
 from app.core.config import settings
+from app.services.image_upload import release_image, upload_image
+from app.services.uploads import stream_upload_to_path, validate_extension
+
+logger = logging.getLogger("fastapi")
 
 
 async def save_cv_file(
@@ -13,7 +17,7 @@ async def save_cv_file(
 ) -> str:
     """
     Save CV file to disk with UUID-based filename.
-    Validates file type and size before saving.
+    Validates file type, then streams it to disk enforcing the size limit.
     
     Args:
         file: UploadFile object from FastAPI
@@ -26,45 +30,33 @@ async def save_cv_file(
         HTTPException: If file validation fails
     """
     # Validate file extension
-    file_ext = Path(file.filename).suffix.lower()
-    if file_ext not in settings.ALLOWED_CV_EXTENSIONS:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid file type. Allowed types: {', '.join(settings.ALLOWED_CV_EXTENSIONS)}"
-        )
-    
-    # Read file content to check size
-    contents = await file.read()
-    
-    # Validate file size
-    if len(contents) > settings.CV_MAX_FILE_SIZE:
-        raise HTTPException(
-            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-            detail=f"File size exceeds maximum allowed size of {settings.CV_MAX_FILE_SIZE / (1024 * 1024):.1f} MB"
-        )
+    file_ext = validate_extension(
+        file.filename,
+        settings.ALLOWED_CV_EXTENSIONS,
+        f"Invalid file type. Allowed types: {', '.join(settings.ALLOWED_CV_EXTENSIONS)}"
+    )
     
     # Generate UUID-based filename
     unique_filename = f"{uuid.uuid4()}{file_ext}"
     
-    # Create job-specific directory
-    job_dir = settings.CV_UPLOAD_DIR / str(job_id)
-    job_dir.mkdir(parents=True, exist_ok=True)
-    
-    # Save file
-    file_path = job_dir / unique_filename
+    # Save file into the job-specific directory, validating size while it streams
+    file_path = settings.CV_UPLOAD_DIR / str(job_id) / unique_filename
     
     try:
-        with open(file_path, "wb") as f:
-            f.write(contents)
+        await stream_upload_to_path(
+            file,
+            file_path,
+            settings.CV_MAX_FILE_SIZE,
+            too_large_detail=f"File size exceeds maximum allowed size of {settings.CV_MAX_FILE_SIZE / (1024 * 1024):.1f} MB"
+        )
         
         # Return relative path for database storage
         # This makes it easier to migrate to S3 later
         return str(file_path)
     
+    except HTTPException:
+        raise
     except Exception as e:
-        # Clean up if file was partially written
-        if file_path.exists():
-            file_path.unlink()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to save file: {str(e)}"
@@ -93,54 +85,29 @@ def delete_cv_file(file_path: str) -> bool:
 async def save_image(
     file: UploadFile,
     path_prefix: str,
+    db: Session,
     old_image_path: Optional[Path] = None
 ) -> str:
     """
-    Save an image to disk with UUID-based filename.
-    Validates file type and size before saving."""
+    Save an image under its content hash (see upload_image) and return its URL.
+    Validates file type and size before saving, then generates its resized variants."""
 
-    file_path = None
-    
     if file and file.filename:
-        file_ext = os.path.splitext(file.filename)[1].lower()
-        if file_ext not in settings.ALLOWED_IMAGE_EXTENSIONS:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Only images are allowed"
-            )
-        
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{path_prefix}_{timestamp}{file_ext}"
-        file_path = settings.IMAGES_UPLOAD_DIR / filename
-        
         try:
-            contents = await file.read()
+            new_url, _ = await upload_image(file, path_prefix, db)
             
-            if len(contents) > settings.IMAGE_MAX_FILE_SIZE:
-                raise HTTPException(
-                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-                    detail="File is too large to upload."
-                )
-            
-            with open(file_path, "wb") as f:
-                f.write(contents)
-            
-            new_url = f"/images/{filename}"
-            
-            if old_image_path and old_image_path.exists():
+            if old_image_path:
                 try:
-                    old_image_path.unlink()
-                except Exception as e:
-                    pass
+                    release_image(db, old_image_path)
+                except Exception:
+                    logger.exception(f"Failed to release replaced image {old_image_path}")
             
             return new_url
         
         except HTTPException:
             raise
         except Exception as e:
-            if file_path and file_path.exists():
-                file_path.unlink()
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Error uploading image: {str(e)}"
-            )
\ No newline at end of file
+            )
@@ -0,0 +1,141 @@
+import asyncio
+import time
+from functools import lru_cache
+from threading import Lock
+from typing import List
+from fastapi.concurrency import run_in_threadpool
+from pydantic import TypeAdapter
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.db.replicas import read_session
+from app.models.news import News
+from app.models.feature_publication import FeaturePublication
+from app.models.team import TeamMember
+from app.models.lab_gallery import LabGallery
+from app.schemas.homepage import HomepageSection
+from app.schemas.news import NewsResponse
+from app.schemas.feature_publication import FeaturePublicationResponse
+from app.schemas.team import TeamMemberResponse
+from app.schemas.lab_gallery import LabGalleryResponse
+from app.services.image_catalog import with_image_variants
+from app.services.reorder import with_order_position
+
+# Model and response schema backing each homepage section
+SECTION_SOURCES = {
+    HomepageSection.NEWS: (News, NewsResponse),
+    HomepageSection.FEATURE_PUBLICATION: (FeaturePublication, FeaturePublicationResponse),
+    HomepageSection.TEAM: (TeamMember, TeamMemberResponse),
+    HomepageSection.LAB_GALLERY: (LabGallery, LabGalleryResponse),
+}
+
+# (section, limit) -> (expires_at, items)
+_section_cache: dict = {}
+_section_cache_lock = Lock()
+
+
+def _get_cached_section(key):
+    with _section_cache_lock:
+        entry = _section_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, items = entry
+        if expires_at < time.monotonic():
+            del _section_cache[key]
+            return None
+        return items
+
+
+def _set_cached_section(key, items) -> None:
+    if settings.HOMEPAGE_CACHE_TTL_SECONDS <= 0:
+        return
+    with _section_cache_lock:
+        _section_cache[key] = (time.monotonic() + settings.HOMEPAGE_CACHE_TTL_SECONDS, items)
+
+
+def clear_homepage_cache() -> None:
+    """
+    Drop every cached section. Called after any commit that wrote a section model (see the
+    session events below); other workers keep their copy until HOMEPAGE_CACHE_TTL_SECONDS.
+    """
+    with _section_cache_lock:
+        _section_cache.clear()
+
+
+_SECTION_MODELS = tuple(model for model, _ in SECTION_SOURCES.values())
+
+
+@event.listens_for(Session, "after_flush")
+def _track_flushed_sections(session, flush_context) -> None:
+    if any(isinstance(obj, _SECTION_MODELS) for obj in (*session.new, *session.dirty, *session.deleted)):
+        session.info["homepage_changed"] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _track_bulk_section_writes(orm_execute_state) -> None:
+    # Reordering, bulk and archive paths use UPDATE / DELETE statements, which skip the flush
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete or orm_execute_state.is_insert):
+        return
+    mapper = orm_execute_state.bind_mapper
+    if mapper is not None and issubclass(mapper.class_, _SECTION_MODELS):
+        orm_execute_state.session.info["homepage_changed"] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _clear_committed_sections(session) -> None:
+    if session.info.pop("homepage_changed", False):
+        clear_homepage_cache()
+
+
+@lru_cache(maxsize=None)
+def _section_adapter(schema) -> TypeAdapter:
+    return TypeAdapter(List[schema])
+
+
+def _fetch_section(section: HomepageSection, limit: int) -> list:
+    """
+    Load the first `limit` live items of a section, in the same order as its list endpoint.
+    Runs in a worker thread with its own (replica) session so sections can be fetched in parallel.
+    """
+    model, schema = SECTION_SOURCES[section]
+    with read_session() as db:
+        rows = (
+            db.query(model)
+            .filter(model.is_deleted == False)
+            .order_by(model.order.asc(), model.created_at.desc())
+            .options(with_order_position(model), with_image_variants(model))
+            .limit(limit)
+            .all()
+        )
+        return _section_adapter(schema).validate_python(rows, from_attributes=True)
+
+
+async def get_homepage_sections(limits: dict[HomepageSection, int]) -> dict[str, list]:
+    """
+    Fetch every requested section concurrently, serving from the in-process cache when possible.
+
+    Args:
+        limits: Mapping of section to the number of items to return for it
+
+    Returns:
+        dict: Section name to list of validated response models
+    """
+    results = {}
+    pending = []
+
+    for section, limit in limits.items():
+        cached = _get_cached_section((section, limit))
+        if cached is not None:
+            results[section.value] = cached
+        else:
+            pending.append((section, limit))
+
+    fetched = await asyncio.gather(
+        *(run_in_threadpool(_fetch_section, section, limit) for section, limit in pending)
+    )
+
+    for (section, limit), items in zip(pending, fetched):
+        _set_cached_section((section, limit), items)
+        results[section.value] = items
+
+    return results
@@ -0,0 +1,177 @@
+import hashlib
+import logging
+import os
+import re
+from datetime import datetime, timezone
+from pathlib import PurePosixPath
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, with_expression
+from app.core.config import settings
+from app.models.image_assets import ImageAsset
+from app.services.image_upload import image_url
+from app.services.image_variants import delete_image_variants, get_image_variants
+
+logger = logging.getLogger("fastapi")
+
+# `<stage>_<YYYYmmdd>_<HHMMSS>`, the names used before content addressing
+LEGACY_IMAGE_NAME = re.compile(r"^(?P<stage>.+)_\d{8}_\d{6}$")
+
+
+def image_variants_expression(model_class):
+    """
+    The variant manifest of a row's `image_url`, from its image_assets row (matched on the
+    unique filename), as a correlated subquery. NULL for external or unregistered images.
+    """
+    prefix = f"/{PurePosixPath(settings.IMAGES_UPLOAD_DIR)}/"
+    return (
+        select(ImageAsset.variants)
+        .where(
+            model_class.image_url.startswith(prefix),
+            ImageAsset.filename == func.substr(model_class.image_url, len(prefix) + 1)
+        )
+        .correlate(model_class)
+        .scalar_subquery()
+    )
+
+
+def with_image_variants(model_class):
+    """
+    Loader option filling `model_class.image_variants` (a query_expression) for ImageVariantsMixin.
+    """
+    return with_expression(model_class.image_variants, image_variants_expression(model_class))
+
+
+def list_images(db: Session, page: int, size: int) -> Tuple[List[str], int]:
+    """
+    One page of the image library, newest first, as URLs, plus the total number of images.
+    Served from image_assets (ix_image_assets_list_order) instead of scanning the directory.
+    """
+    total = db.scalar(select(func.count(ImageAsset.id)))
+    filenames = db.scalars(
+        select(ImageAsset.filename)
+        .order_by(ImageAsset.created_at.desc(), ImageAsset.id.desc())
+        .offset((page - 1) * size)
+        .limit(size)
+    ).all()
+    return [image_url(filename) for filename in filenames], total
+
+
+def _scan_image_files() -> Dict[str, os.stat_result]:
+    allowed = {ext.lower() for ext in settings.ALLOWED_IMAGE_EXTENSIONS}
+    files = {}
+    if not settings.IMAGES_UPLOAD_DIR.exists():
+        return files
+    with os.scandir(settings.IMAGES_UPLOAD_DIR) as entries:
+        for entry in entries:
+            # Dotfiles are in-progress uploads
+            if entry.name.startswith(".") or not entry.is_file():
+                continue
+            if os.path.splitext(entry.name)[1].lower() in allowed:
+                files[entry.name] = entry.stat()
+    return files
+
+
+def _file_sha256(path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(settings.UPLOAD_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _stage_of(filename: str) -> Optional[str]:
+    match = LEGACY_IMAGE_NAME.match(os.path.splitext(filename)[0])
+    return match.group("stage") if match else None
+
+
+def reconcile_image_catalog(db: Session, dry_run: bool = False, batch_size: int = 500) -> Dict[str, int]:
+    """
+    Bring image_assets in line with the files in IMAGES_UPLOAD_DIR.
+
+    Files without a row (copied in by hand, seeded, uploaded before the catalog existed) are
+    registered with one reference and their modification time as upload time; a file whose
+    content is already registered under another name gets a row without a hash. Rows whose file
+    is gone are deleted along with their variants, and rows without a stored variant manifest get
+    the one on disk, if any. With `dry_run` nothing is written.
+
+    Returns the number of rows added, rows removed, duplicates among the added files and rows
+    given their variant manifest.
+    """
+    files = _scan_image_files()
+    known = dict(db.execute(select(ImageAsset.filename, ImageAsset.id)).all())
+    known_hashes = set(db.scalars(select(ImageAsset.sha256).where(ImageAsset.sha256.is_not(None))).all())
+    result = {"added": 0, "removed": 0, "duplicates": 0, "variants": 0}
+
+    pending = 0
+    for filename in sorted(set(files) - set(known)):
+        stat_result = files[filename]
+        try:
+            digest = _file_sha256(settings.IMAGES_UPLOAD_DIR / filename)
+        except OSError as e:
+            logger.warning(f"Skipping image {filename}: {e}")
+            continue
+        if digest in known_hashes:
+            result["duplicates"] += 1
+            digest = None
+        else:
+            known_hashes.add(digest)
+        result["added"] += 1
+        variants = get_image_variants(image_url(filename))
+        result["variants"] += variants is not None
+        if dry_run:
+            continue
+        uploaded_at = datetime.fromtimestamp(stat_result.st_mtime, timezone.utc)
+        db.add(ImageAsset(
+            sha256=digest,
+            filename=filename,
+            stage=_stage_of(filename),
+            size=stat_result.st_size,
+            ref_count=1,
+            variants=variants,
+            created_at=uploaded_at,
+            updated_at=uploaded_at
+        ))
+        pending += 1
+        if pending >= batch_size:
+            db.commit()
+            pending = 0
+
+    for filename in sorted(set(known) - set(files)):
+        result["removed"] += 1
+        if dry_run:
+            continue
+        db.query(ImageAsset).filter(ImageAsset.id == known[filename]).delete(synchronize_session=False)
+        delete_image_variants(image_url(filename))
+        pending += 1
+        if pending >= batch_size:
+            db.commit()
+            pending = 0
+
+    missing_variants = db.execute(
+        select(ImageAsset.id, ImageAsset.filename).where(ImageAsset.variants.is_(None))
+    ).all()
+    for asset_id, filename in missing_variants:
+        if filename not in files:
+            continue
+        variants = get_image_variants(image_url(filename))
+        if variants is None:
+            continue
+        result["variants"] += 1
+        if dry_run:
+            continue
+        db.query(ImageAsset).filter(ImageAsset.id == asset_id).update(
+            {"variants": variants}, synchronize_session=False
+        )
+        pending += 1
+        if pending >= batch_size:
+            db.commit()
+            pending = 0
+
+    if not dry_run:
+        db.commit()
+    logger.info(
+        f"Image catalog reconciled: {result['added']} added ({result['duplicates']} duplicates), "
+        f"{result['removed']} removed, {result['variants']} variant manifests stored"
+    )
+    return result
@@ -1,82 +1,202 @@
-
-
-from datetime import datetime
+import asyncio
+import logging
 import os
-from pathlib import Path
-from typing import Optional
+from pathlib import Path, PurePosixPath
+from typing import Optional, Tuple
 from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile, File
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
 from app.core.config import settings
+from app.models.image_assets import ImageAsset
+from app.services.image_variants import (
+    create_image_variants,
+    delete_image_variants,
+    get_image_variants,
+    uploaded_image_name,
+)
+from app.services.uploads import discard_temp, stream_upload_to_temp, validate_extension
+
+logger = logging.getLogger("fastapi")
+
+
+def _asset_session(db: Session) -> Session:
+    # Reference counts are committed on a connection of their own, never together with
+    # (or instead of) the caller's pending work
+    return Session(bind=db.get_bind())
+
+
+def image_url(filename: str) -> str:
+    return f"/{PurePosixPath(settings.IMAGES_UPLOAD_DIR / filename)}"
+
+
+def _acquire_image_asset(
+    db: Session,
+    digest: str,
+    file_ext: str,
+    size: int,
+    stage: str,
+    temp_path: Path
+) -> Tuple[str, Optional[dict]]:
+    """
+    Take a reference to the asset with this content, creating it on first upload, and move the
+    uploaded file into place as `<sha256><ext>`. Returns the file name and stored variant manifest.
+
+    The asset row stays locked until the commit, and release_image removes files under the same
+    lock, so an upload can't race a release of the same content and lose its file. Runs in its
+    own session and commits it; `db` only provides the connection.
+    """
+    with _asset_session(db) as asset_db:
+        for attempt in range(2):
+            try:
+                asset = asset_db.query(ImageAsset).filter(ImageAsset.sha256 == digest).with_for_update().first()
+                variants = None
+                if asset is not None:
+                    asset.ref_count = ImageAsset.ref_count + 1
+                    filename, variants = asset.filename, asset.variants
+                else:
+                    filename = f"{digest}{file_ext}"
+                    asset_db.add(ImageAsset(sha256=digest, filename=filename, stage=stage, size=size, ref_count=1))
+                asset_db.flush()
+                # Identical content, so replacing an existing copy is harmless (and repairs a missing one)
+                os.replace(temp_path, settings.IMAGES_UPLOAD_DIR / filename)
+                asset_db.commit()
+                return filename, variants
+            except IntegrityError:
+                # The same content was registered concurrently; take a reference to that row instead
+                asset_db.rollback()
+                if attempt:
+                    raise
+            except Exception:
+                asset_db.rollback()
+                raise
+
+
+def _store_image_variants(bind, filename: str, variants: dict) -> None:
+    """
+    Record the variant manifest on the asset row, so responses load it with the row
+    (with_image_variants) instead of reading it from disk.
+    """
+    with Session(bind=bind) as asset_db:
+        try:
+            asset_db.query(ImageAsset).filter(ImageAsset.filename == filename).update(
+                {"variants": variants}, synchronize_session=False
+            )
+            asset_db.commit()
+        except Exception:
+            asset_db.rollback()
+            logger.exception(f"Failed to store the variants of {filename}")
 
 
 async def upload_image(
     file: UploadFile,
     stage: str,
+    db: Session,
     old_image_path: Optional[str] = None
-):
+) -> Tuple[str, Optional[dict]]:
+    """
+    Store an uploaded image under its content hash and return its URL and variant manifest.
 
-    file_ext = os.path.splitext(file.filename)[1].lower()
-    if file_ext not in settings.ALLOWED_IMAGE_EXTENSIONS:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Only images are allowed"
-        )
-    
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"{stage}_{timestamp}{file_ext}"
-    file_path = settings.IMAGES_UPLOAD_DIR / filename
-    
+    Identical uploads share one file (see ImageAsset), so the URL of a given content never
+    changes and can be cached forever. The manifest is stored on the asset row, also when
+    rendering outlasts IMAGE_VARIANT_TIMEOUT_SECONDS. The reference to `old_image_path` is released.
+    """
+
+    file_ext = validate_extension(file.filename, settings.ALLOWED_IMAGE_EXTENSIONS, "Only images are allowed")
+
+    temp_path, size, digest = await stream_upload_to_temp(file, settings.IMAGES_UPLOAD_DIR, settings.IMAGE_MAX_FILE_SIZE)
     try:
-        contents = await file.read()
-        
-        if len(contents) > settings.IMAGE_MAX_FILE_SIZE:
-            raise HTTPException(
-                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-                detail=f"File is too large to upload."
-            )
-        
-        with open(file_path, "wb") as f:
-            f.write(contents)
-        
-        # Delete old image if provided
-        if old_image_path:
-            old_file = Path(old_image_path)
-            if old_file.exists():
-                try:
-                    old_file.unlink()
-                except Exception:
-                    pass
-
-        print(file_path)
-        
-        return file_path
-    
-    except HTTPException:
-        raise
+        # Row lock, rename and commit block, so they stay off the event loop
+        filename, variants = await run_in_threadpool(
+            _acquire_image_asset, db, digest, file_ext, size, stage, temp_path
+        )
     except Exception as e:
-        if file_path.exists():
-            file_path.unlink()
+        discard_temp(temp_path)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=str(e)
         )
 
+    url = image_url(filename)
+    if variants is None:
+        bind = db.get_bind()
+        loop = asyncio.get_running_loop()
+        variants = get_image_variants(url) or await create_image_variants(
+            settings.IMAGES_UPLOAD_DIR / filename,
+            on_late_result=lambda manifest: loop.run_in_executor(
+                None, _store_image_variants, bind, filename, manifest
+            )
+        )
+        if variants is not None:
+            await run_in_threadpool(_store_image_variants, bind, filename, variants)
+
+    # Release old image if provided
+    if old_image_path:
+        try:
+            await run_in_threadpool(release_image, db, old_image_path)
+        except Exception:
+            logger.exception(f"Failed to release replaced image {old_image_path}")
+
+    return url, variants
+
+
+def _remove_image_files(filename: str) -> None:
+    path = settings.IMAGES_UPLOAD_DIR / filename
+    if path.exists():
+        path.unlink()
+    delete_image_variants(image_url(filename))
+
 
-def delete_image(image_path: str) -> None:
+def release_image(db: Session, image) -> bool:
     """
-    Delete an image file. The path must be under IMAGES_UPLOAD_DIR.
-    Accepts the path as returned by list_all_images (relative or absolute).
+    Drop one reference to an uploaded image (URL or path) and delete its file and variants once
+    nothing references it. Images stored before content addressing have no asset row and a single
+    owner, so they are deleted straight away. Returns True if the file was deleted.
+
+    Like an upload, the reference change is committed in its own session, leaving the caller's
+    transaction untouched.
     """
-    path = Path(image_path).resolve()
-    upload_dir = settings.IMAGES_UPLOAD_DIR.resolve()
+    filename = uploaded_image_name(image)
+    if filename is None:
+        return False
 
-    try:
-        path.relative_to(upload_dir)
-    except ValueError:
+    with _asset_session(db) as asset_db:
+        try:
+            asset = asset_db.query(ImageAsset).filter(ImageAsset.filename == filename).with_for_update().first()
+            if asset is None:
+                _remove_image_files(filename)
+                return True
+            if asset.ref_count > 1:
+                asset.ref_count = ImageAsset.ref_count - 1
+                asset_db.commit()
+                return False
+            asset_db.delete(asset)
+            asset_db.flush()
+            # Removed while the row lock is held, so a concurrent upload of the same content waits
+            # and then re-creates both the row and the file
+            _remove_image_files(filename)
+            asset_db.commit()
+            return True
+        except Exception:
+            asset_db.rollback()
+            raise
+
+
+def delete_image(image_path: str, db: Session) -> None:
+    """
+    Delete an image (release its reference). The path must be under IMAGES_UPLOAD_DIR.
+    Accepts the path as returned by list_all_images (URL, relative or absolute path).
+    """
+    filename = uploaded_image_name(image_path)
+
+    if filename is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Image path must be within the upload directory",
         )
 
+    path = settings.IMAGES_UPLOAD_DIR / filename
+
     if not path.exists():
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -90,9 +210,9 @@ def delete_image(image_path: str) -> None:
         )
 
     try:
-        path.unlink()
+        release_image(db, image_url(filename))
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to delete image: {str(e)}",
-        )
\ No newline at end of file
+        )
@@ -0,0 +1,259 @@
+import asyncio
+import base64
+import io
+import json
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from pathlib import Path, PurePosixPath
+from threading import Lock
+from typing import Callable, List, Optional
+from app.core.config import settings
+
+try:
+    from PIL import ExifTags, Image, ImageOps
+except ImportError:
+    ExifTags = None
+    Image = None
+    ImageOps = None
+
+logger = logging.getLogger("fastapi")
+
+# Pillow format name -> file extension and save options
+VARIANT_FORMATS = {
+    "webp": ("webp", {"method": 4}),
+    "jpeg": ("jpg", {"optimize": True, "progressive": True}),
+}
+
+# Resizing is CPU bound and holds the GIL, so it runs in separate processes. "spawn" avoids
+# forking a process that already runs threads (the threadpool, the DB pool).
+_variant_executor: Optional[ProcessPoolExecutor] = None
+_variant_executor_lock = Lock()
+
+
+def _get_variant_executor() -> ProcessPoolExecutor:
+    global _variant_executor
+    with _variant_executor_lock:
+        if _variant_executor is None:
+            _variant_executor = ProcessPoolExecutor(
+                max_workers=settings.IMAGE_VARIANT_WORKERS,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return _variant_executor
+
+
+def _reset_variant_executor() -> None:
+    # A worker that died (e.g. killed while decoding a huge image) breaks the whole pool
+    global _variant_executor
+    with _variant_executor_lock:
+        if _variant_executor is not None:
+            _variant_executor.shutdown(wait=False, cancel_futures=True)
+        _variant_executor = None
+
+
+def _url_for(path: Path) -> str:
+    return f"/{PurePosixPath(path)}"
+
+
+def uploaded_image_name(image) -> Optional[str]:
+    """
+    The file name of an uploaded image given as URL (`/images/<name>`), relative path
+    (`images/<name>`) or absolute path inside IMAGES_UPLOAD_DIR; None for anything else.
+    """
+    relative = PurePosixPath(str(image).lstrip("/"))
+    if relative.parent == PurePosixPath(settings.IMAGES_UPLOAD_DIR):
+        return relative.name
+    path = Path(image)
+    if path.is_absolute() and path.parent == settings.IMAGES_UPLOAD_DIR.resolve():
+        return path.name
+    return None
+
+
+def _manifest_path(image) -> Optional[Path]:
+    name = uploaded_image_name(image)
+    if name is None:
+        return None
+    return settings.IMAGE_VARIANTS_DIR / f"{PurePosixPath(name).stem}.json"
+
+
+def _flatten(image, background=(255, 255, 255)):
+    """An RGB copy for formats without alpha, with transparent areas on white."""
+    if image.mode == "RGB":
+        return image
+    rgba = image.convert("RGBA")
+    flat = Image.new("RGB", rgba.size, background)
+    flat.paste(rgba, mask=rgba.getchannel("A"))
+    return flat
+
+
+def _render_variants(
+    source: str,
+    output_dir: str,
+    widths: List[int],
+    formats: List[str],
+    quality: int,
+    placeholder_width: int
+) -> Optional[dict]:
+    """
+    Write the resized variants of `source` and its manifest; runs in a worker process.
+    Returns the manifest, or None for images that are kept as they are (animations).
+    """
+    output = Path(output_dir)
+    output.mkdir(parents=True, exist_ok=True)
+    stem = Path(source).stem
+    written: List[Path] = []
+    try:
+        with Image.open(source) as opened:
+            if getattr(opened, "is_animated", False):
+                return None
+            # Original size as displayed: EXIF orientations 5-8 swap width and height
+            width, height = opened.size
+            if opened.getexif().get(ExifTags.Base.Orientation, 1) in (5, 6, 7, 8):
+                width, height = height, width
+            targets = sorted({w for w in widths if w < width}) or [width]
+            # JPEG can decode straight at 1/2, 1/4 or 1/8 scale, far cheaper than full size;
+            # the draft size is in the file's own (un-rotated) orientation
+            scale = targets[-1] / width
+            opened.draft("RGB", (max(round(opened.width * scale), 1), max(round(opened.height * scale), 1)))
+            image = ImageOps.exif_transpose(opened)
+            if image.mode not in ("RGB", "RGBA"):
+                has_alpha = image.mode in ("LA", "PA") or "transparency" in image.info
+                image = image.convert("RGBA" if has_alpha else "RGB")
+
+            variants = []
+            for target in targets:
+                size = (target, max(round(height * target / width), 1))
+                resized = image if size == image.size else image.resize(
+                    size, Image.Resampling.LANCZOS, reducing_gap=3.0
+                )
+                for fmt in formats:
+                    extension, options = VARIANT_FORMATS[fmt]
+                    path = output / f"{stem}-{target}w.{extension}"
+                    written.append(path)
+                    frame = resized if fmt == "webp" else _flatten(resized)
+                    frame.save(path, fmt.upper(), quality=quality, **options)
+                    variants.append({
+                        "url": _url_for(path),
+                        "width": size[0],
+                        "height": size[1],
+                        "format": fmt,
+                        "size": path.stat().st_size,
+                    })
+
+            tiny = image.resize(
+                (placeholder_width, max(round(height * placeholder_width / width), 1)),
+                Image.Resampling.BILINEAR,
+                reducing_gap=2.0
+            )
+            buffer = io.BytesIO()
+            tiny.save(buffer, "WEBP", quality=30)
+            placeholder = "data:image/webp;base64," + base64.b64encode(buffer.getvalue()).decode()
+
+        manifest = {"width": width, "height": height, "placeholder": placeholder, "variants": variants}
+        # Written last and renamed into place: a manifest only ever lists files that exist
+        manifest_path = output / f"{stem}.json"
+        temp_path = output / f".{stem}.json.part"
+        temp_path.write_text(json.dumps(manifest))
+        os.replace(temp_path, manifest_path)
+        return manifest
+    except BaseException:
+        for path in written:
+            path.unlink(missing_ok=True)
+        raise
+
+
+def _deliver_late_result(future, on_late_result: Callable[[dict], None]) -> None:
+    if future.cancelled() or future.exception() is not None or future.result() is None:
+        return
+    try:
+        on_late_result(future.result())
+    except Exception:
+        logger.exception("Failed to deliver late image variants")
+
+
+async def create_image_variants(
+    image_path: Path,
+    on_late_result: Optional[Callable[[dict], None]] = None
+) -> Optional[dict]:
+    """
+    Generate the resized WebP / JPEG variants and blur placeholder of an uploaded image in the
+    process pool and return its manifest.
+
+    Variants are an optimisation: if Pillow is missing, the image can't be decoded or resizing
+    takes longer than IMAGE_VARIANT_TIMEOUT_SECONDS, the original is kept on its own and None is
+    returned. A slow job still finishes; its manifest is then passed to `on_late_result`.
+    """
+    if not settings.IMAGE_VARIANTS_ENABLED or Image is None:
+        return None
+
+    loop = asyncio.get_running_loop()
+    future = loop.run_in_executor(
+        _get_variant_executor(),
+        _render_variants,
+        str(image_path),
+        str(settings.IMAGE_VARIANTS_DIR),
+        list(settings.IMAGE_VARIANT_WIDTHS),
+        list(settings.IMAGE_VARIANT_FORMATS),
+        settings.IMAGE_VARIANT_QUALITY,
+        settings.IMAGE_PLACEHOLDER_WIDTH,
+    )
+    try:
+        return await asyncio.wait_for(asyncio.shield(future), timeout=settings.IMAGE_VARIANT_TIMEOUT_SECONDS)
+    except asyncio.TimeoutError:
+        logger.warning(f"Image variants for {image_path} still running after {settings.IMAGE_VARIANT_TIMEOUT_SECONDS}s")
+        if on_late_result is not None:
+            future.add_done_callback(lambda done: _deliver_late_result(done, on_late_result))
+    except BrokenProcessPool:
+        logger.error(f"Image variant worker died while processing {image_path}")
+        _reset_variant_executor()
+    except Exception:
+        logger.exception(f"Failed to generate image variants for {image_path}")
+    return None
+
+
+@lru_cache(maxsize=1024)
+def _read_manifest(path: str, mtime_ns: int) -> Optional[dict]:
+    try:
+        with open(path) as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return None
+
+
+def _load_manifest(manifest_path: Path) -> Optional[dict]:
+    try:
+        mtime_ns = os.stat(manifest_path).st_mtime_ns
+    except OSError:
+        return None
+    return _read_manifest(str(manifest_path), mtime_ns)
+
+
+def get_image_variants(image_url: Optional[str]) -> Optional[dict]:
+    """
+    The variant manifest of an uploaded image URL as written on disk, or None when it has none
+    (external URLs, images uploaded before variants existed). Parsed manifests are cached by
+    modification time. Responses don't call this: they read image_assets.variants.
+    """
+    if not image_url:
+        return None
+    manifest_path = _manifest_path(image_url)
+    return _load_manifest(manifest_path) if manifest_path is not None else None
+
+
+def delete_image_variants(image) -> None:
+    """
+    Remove the variants and manifest of an uploaded image, if it has any.
+    """
+    manifest_path = _manifest_path(image)
+    manifest = _load_manifest(manifest_path) if manifest_path is not None else None
+    if manifest is None:
+        return
+    for variant in manifest.get("variants", []):
+        try:
+            (settings.IMAGE_VARIANTS_DIR / PurePosixPath(variant["url"]).name).unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning(f"Unable to delete image variant {variant['url']}: {e}")
+    manifest_path.unlink(missing_ok=True)
@@ -0,0 +1,282 @@
+import hashlib
+import logging
+import math
+import sqlite3
+import time
+from ipaddress import ip_address, ip_network
+from threading import Lock
+from typing import Dict, List, Optional, Tuple
+from fastapi import HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
+from starlette.responses import JSONResponse
+from starlette.routing import compile_path
+from starlette.types import ASGIApp, Receive, Scope, Send
+from app.core.config import settings
+
+logger = logging.getLogger("fastapi")
+
+PERIODS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400}
+
+# (storage key, limit, window seconds)
+Rule = Tuple[str, int, int]
+
+
+def parse_limits(value: str) -> List[Tuple[int, int]]:
+    """
+    Parse "5/minute, 30/hour" (also "10/30s") into [(limit, window_seconds), ...].
+    """
+    limits = []
+    for part in value.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        count, _, period = part.partition("/")
+        period = period.strip().lower()
+        if period in PERIODS:
+            window = PERIODS[period]
+        elif period.endswith("s") and period[:-1].isdigit():
+            window = int(period[:-1])
+        else:
+            raise ValueError(f"Invalid rate limit '{part}'")
+        limits.append((int(count), window))
+    return limits
+
+
+def _estimate(previous: int, current: int, elapsed: float, window: int) -> float:
+    # Sliding window counter: the previous fixed window counts in proportion to how much of it
+    # still overlaps the last `window` seconds
+    return previous * (1 - elapsed / window) + current
+
+
+def _retry_after(previous: int, current: int, elapsed: float, limit: int, window: int) -> float:
+    """Seconds until the estimate drops below `limit` again."""
+    if current >= limit or previous == 0:
+        return window - elapsed
+    # previous * (1 - t / window) + current < limit  =>  t > window * (1 - (limit - current) / previous)
+    return max(window * (1 - (limit - current) / previous) - elapsed, 0) or 1
+
+
+class MemoryRateLimitBackend:
+    """Counters in this process only; each uvicorn worker limits on its own."""
+
+    def __init__(self):
+        self._counters: Dict[Tuple[str, int], Tuple[int, int, int]] = {}
+        self._lock = Lock()
+        self._next_cleanup = 0.0
+
+    def hit(self, rules: List[Rule], now: float) -> Optional[float]:
+        with self._lock:
+            if now >= self._next_cleanup:
+                self._cleanup(now)
+            states = []
+            for key, limit, window in rules:
+                bucket, elapsed = divmod(now, window)
+                stored_bucket, previous, current = self._counters.get((key, window), (bucket, 0, 0))
+                if stored_bucket != bucket:
+                    previous, current = (current if stored_bucket == bucket - 1 else 0), 0
+                if _estimate(previous, current, elapsed, window) + 1 > limit:
+                    return _retry_after(previous, current, elapsed, limit, window)
+                states.append(((key, window), bucket, previous, current))
+            for counter_key, bucket, previous, current in states:
+                self._counters[counter_key] = (bucket, previous, current + 1)
+        return None
+
+    def _cleanup(self, now: float) -> None:
+        # Counters untouched for two windows can't affect a decision any more
+        self._counters = {
+            (key, window): state
+            for (key, window), state in self._counters.items()
+            if state[0] >= now // window - 1
+        }
+        self._next_cleanup = now + 60
+
+    def clear(self) -> None:
+        with self._lock:
+            self._counters.clear()
+
+
+class SQLiteRateLimitBackend:
+    """
+    Counters in a local SQLite file shared by every worker on the host. Each decision is one
+    BEGIN IMMEDIATE transaction, so concurrent workers can't both take the last slot.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._local = None
+        self._lock = Lock()
+        with self._connect() as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS rate_limit_counters ("
+                "key TEXT NOT NULL, window INTEGER NOT NULL, bucket INTEGER NOT NULL, "
+                "previous INTEGER NOT NULL, current INTEGER NOT NULL, PRIMARY KEY (key, window))"
+            )
+        self._next_cleanup = 0.0
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=5, isolation_level=None, check_same_thread=False)
+
+    def hit(self, rules: List[Rule], now: float) -> Optional[float]:
+        with self._lock:
+            if self._local is None:
+                self._local = self._connect()
+            connection = self._local
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                states = []
+                for key, limit, window in rules:
+                    bucket = int(now // window)
+                    elapsed = now - bucket * window
+                    row = connection.execute(
+                        "SELECT bucket, previous, current FROM rate_limit_counters WHERE key = ? AND window = ?",
+                        (key, window)
+                    ).fetchone()
+                    stored_bucket, previous, current = row if row else (bucket, 0, 0)
+                    if stored_bucket != bucket:
+                        previous, current = (current if stored_bucket == bucket - 1 else 0), 0
+                    if _estimate(previous, current, elapsed, window) + 1 > limit:
+                        connection.execute("ROLLBACK")
+                        return _retry_after(previous, current, elapsed, limit, window)
+                    states.append((key, window, bucket, previous, current + 1))
+                connection.executemany(
+                    "INSERT OR REPLACE INTO rate_limit_counters (key, window, bucket, previous, current) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    states
+                )
+                if now >= self._next_cleanup:
+                    connection.execute(
+                        "DELETE FROM rate_limit_counters WHERE bucket < CAST(? / window AS INTEGER) - 1", (now,)
+                    )
+                    self._next_cleanup = now + 60
+                connection.execute("COMMIT")
+            except Exception:
+                connection.execute("ROLLBACK")
+                raise
+        return None
+
+    def clear(self) -> None:
+        with self._lock, self._connect() as connection:
+            connection.execute("DELETE FROM rate_limit_counters")
+
+
+_backend = None
+_backend_lock = Lock()
+
+
+def get_rate_limit_backend():
+    global _backend
+    with _backend_lock:
+        if _backend is None:
+            if settings.RATE_LIMIT_BACKEND == "sqlite":
+                _backend = SQLiteRateLimitBackend(settings.RATE_LIMIT_SQLITE_PATH)
+            else:
+                _backend = MemoryRateLimitBackend()
+        return _backend
+
+
+def get_client_ip(request: Request) -> str:
+    """
+    The client address, taken from X-Forwarded-For when the direct peer is a trusted proxy
+    (the right-most address not belonging to a trusted proxy, which the client can't forge).
+    """
+    peer = request.client.host if request.client else ""
+    trusted = [ip_network(network, strict=False) for network in settings.RATE_LIMIT_TRUSTED_PROXIES]
+
+    def is_trusted(address: str) -> bool:
+        try:
+            return any(ip_address(address) in network for network in trusted)
+        except ValueError:
+            return False
+
+    if not is_trusted(peer):
+        return peer
+    forwarded = [part.strip() for part in request.headers.get("x-forwarded-for", "").split(",") if part.strip()]
+    for address in reversed(forwarded):
+        if not is_trusted(address):
+            return address
+    return forwarded[0] if forwarded else peer
+
+
+def _storage_key(route: str, scope: str, value: str) -> str:
+    # Emails / addresses are hashed so the shared store holds no personal data
+    digest = hashlib.sha256(value.strip().lower().encode()).hexdigest()[:32]
+    return f"{route}:{scope}:{digest}"
+
+
+async def enforce_rate_limit(
+    request: Request,
+    route: str,
+    email: Optional[str] = None,
+    by_ip: bool = True
+) -> None:
+    """
+    Count one request to `route` against the client IP (unless `by_ip` is False, for routes whose
+    IP limit RateLimitMiddleware already applies) and, when given, the submitted email, using the
+    limits configured in RATE_LIMITS[route]. Requests that are turned away don't count. The SQLite
+    backend blocks on its file lock, so it runs in the threadpool.
+
+    Raises:
+        HTTPException: 429 with Retry-After when any limit is exceeded
+    """
+    config = settings.RATE_LIMITS.get(route)
+    if not settings.RATE_LIMIT_ENABLED or not config:
+        return
+
+    rules: List[Rule] = []
+    subjects = {"ip": get_client_ip(request), "email": email}
+    for scope, value in subjects.items():
+        if scope == "ip" and not by_ip:
+            continue
+        if value and config.get(scope):
+            key = _storage_key(route, scope, value)
+            rules.extend((key, limit, window) for limit, window in parse_limits(config[scope]))
+    if not rules:
+        return
+
+    backend = get_rate_limit_backend()
+    if isinstance(backend, SQLiteRateLimitBackend):
+        retry_after = await run_in_threadpool(backend.hit, rules, time.time())
+    else:
+        retry_after = backend.hit(rules, time.time())
+    if retry_after is not None:
+        logger.warning(f"Rate limit exceeded on {route} for {subjects['ip']}")
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many requests. Please try again later.",
+            headers={"Retry-After": str(max(math.ceil(retry_after), 1))}
+        )
+
+
+class RateLimitMiddleware:
+    """
+    Apply the IP limit of upload routes before their body is read, so a flood of requests is
+    turned away without spooling each multipart body (e.g. a CV) to disk first. FastAPI parses
+    form bodies before running dependencies, hence a middleware. `routes` maps
+    (method, path template) to a RATE_LIMITS key; the endpoint still counts the email itself
+    with `by_ip=False`.
+    """
+
+    def __init__(self, app: ASGIApp, routes: Dict[Tuple[str, str], str]) -> None:
+        self.app = app
+        self.routes = [
+            (method, compile_path(path)[0], route) for (method, path), route in routes.items()
+        ]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            path = scope["path"].removeprefix(scope.get("root_path", ""))
+            for method, path_regex, route in self.routes:
+                if scope["method"] == method and path_regex.match(path):
+                    try:
+                        await enforce_rate_limit(Request(scope), route)
+                    except HTTPException as exc:
+                        response = JSONResponse(
+                            {"detail": exc.detail},
+                            status_code=exc.status_code,
+                            headers=exc.headers
+                        )
+                        await response(scope, receive, send)
+                        return
+                    break
+        await self.app(scope, receive, send)
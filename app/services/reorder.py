@@ -1,88 +1,275 @@
-from sqlalchemy.orm import Session
-from typing import Type, TypeVar
-from fastapi import HTTPException, status
+import logging
+from sqlalchemy import and_, func, literal_column, or_, select, update
+from sqlalchemy.orm import Session, aliased, with_expression
+from typing import Iterable, List, Optional, Tuple, Type, TypeVar
+from fastapi import BackgroundTasks, HTTPException, status
+from app.db.database import SessionLocal
+
+logger = logging.getLogger("fastapi")
 
 # Generic type for models with order field
 ModelType = TypeVar('ModelType')
 
+# Rows rewritten per CASE statement (keeps bound parameters under SQLite's limit)
+ORDERING_CHUNK_SIZE = 500
+
+# `order` holds sparse sort keys: rebalanced rows are ORDER_KEY_GAP apart, so a move can take
+# the midpoint of its new neighbours and touch only itself (about 10 moves into the same gap
+# before it is used up)
+ORDER_KEY_GAP = 1024
+
+# A move leaving less room than this on either side schedules a background rebalance
+ORDER_KEY_REBALANCE_THRESHOLD = 16
+
+
+def _display_order(model_class):
+    return model_class.order.asc(), model_class.created_at.desc()
+
+
+def order_position(model_class):
+    """
+    1-based display position of a row among the non-deleted items, as a correlated subquery.
+    Clients see and send positions; `order` itself is an internal sparse key.
+    """
+    ahead = aliased(model_class)
+    return (
+        select(func.count(ahead.id) + 1)
+        .where(
+            ahead.is_deleted == False,
+            or_(
+                ahead.order < model_class.order,
+                and_(ahead.order == model_class.order, ahead.created_at > model_class.created_at)
+            )
+        )
+        .correlate(model_class)
+        .scalar_subquery()
+    )
+
+
+def with_order_position(model_class):
+    """
+    Loader option filling `model_class.position` (a query_expression) with order_position.
+    """
+    return with_expression(model_class.position, order_position(model_class))
+
+
+def _write_order_keys(db: Session, model_class: Type[ModelType], keys: Iterable[Tuple[int, int]]) -> int:
+    """
+    Write (id, order) pairs with `UPDATE ... SET order = CASE id WHEN ... END`, one statement
+    per ORDERING_CHUNK_SIZE rows. Returns the number of rows written.
+    """
+    keys = list(keys)
+    for start in range(0, len(keys), ORDERING_CHUNK_SIZE):
+        chunk = keys[start:start + ORDERING_CHUNK_SIZE]
+        # ids and keys are ints, so the CASE is rendered inline: binding two parameters per
+        # row costs more than the UPDATE itself on large orderings
+        whens = " ".join(f"WHEN {int(item_id)} THEN {int(key)}" for item_id, key in chunk)
+        db.execute(
+            update(model_class)
+            .where(model_class.id.in_([item_id for item_id, _ in chunk]))
+            .values(order=literal_column(f"CASE id {whens} END"))
+            .execution_options(synchronize_session=False)
+        )
+    return len(keys)
+
+
+def _spaced_keys(current: dict, ids: List[int]) -> List[Tuple[int, int]]:
+    # Only rows whose key actually changes are written
+    return [
+        (item_id, position * ORDER_KEY_GAP)
+        for position, item_id in enumerate(ids, start=1)
+        if current[item_id] != position * ORDER_KEY_GAP
+    ]
+
+
+def rebalance_order_keys(db: Session, model_class: Type[ModelType]) -> int:
+    """
+    Respace the order keys of all non-deleted items ORDER_KEY_GAP apart, keeping the
+    current display order. Returns the number of rows rewritten. The caller commits.
+    """
+    rows = db.execute(
+        select(model_class.id, model_class.order)
+        .where(model_class.is_deleted == False)
+        .order_by(*_display_order(model_class))
+        .with_for_update()
+    ).all()
+    return _write_order_keys(db, model_class, _spaced_keys(dict(rows), [item_id for item_id, _ in rows]))
+
+
+def rebalance_in_background(model_class: Type[ModelType]) -> None:
+    """
+    BackgroundTasks entry point: rebalance in a session of its own.
+    """
+    db = SessionLocal()
+    try:
+        count = rebalance_order_keys(db, model_class)
+        db.commit()
+        logger.info(f"Rebalanced {count} {model_class.__tablename__} order keys")
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Failed to rebalance {model_class.__tablename__} order keys: {str(e)}")
+    finally:
+        db.close()
+
+
 def reorder_item(
     db: Session,
     model_class: Type[ModelType],
     item_id: int,
-    new_order: int
+    new_order: int,
+    background_tasks: Optional[BackgroundTasks] = None
 ) -> None:
     """
     Generic service to reorder items in a collection.
-    
+
     Works with any SQLAlchemy model that has:
     - id field
-    - order field (Integer)
+    - order field (Integer, used as a sparse sort key)
+    - created_at field (tie breaker, newest first)
     - is_deleted field (Boolean, for soft delete filtering)
-    
+
+    The item and its two new neighbours are locked and the item takes the midpoint of
+    their keys, so only the moved row is written. When that gap is nearly used up a
+    rebalance is scheduled on `background_tasks`; when it is fully used up (or the keys
+    are still dense) the collection is respaced in this transaction instead.
+    The caller commits.
+
     Args:
         db: Database session
         model_class: The SQLAlchemy model class
         item_id: ID of the item to reorder
-        new_order: The new order position (1-indexed)
-    
+        new_order: The new position (1-indexed)
+        background_tasks: Where to schedule a rebalance when gaps run low
+
     Raises:
         HTTPException: If item not found or order is invalid
     """
     # Get the item to reorder
-    item = db.query(model_class).filter(
-        model_class.id == item_id,
-        model_class.is_deleted == False
-    ).first()
-    
+    item = db.execute(
+        select(model_class).where(
+            model_class.id == item_id,
+            model_class.is_deleted == False
+        ).with_for_update()
+    ).scalar_one_or_none()
+
     if not item:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"{model_class.__name__} not found"
         )
-    
-    # Get all siblings (all non-deleted items except the current one)
-    siblings = db.query(model_class).filter(
-        model_class.is_deleted == False,
-        model_class.id != item_id
-    ).order_by(model_class.order).all()
-    
-    max_order = len(siblings) + 1
-    
+
+    max_order = db.scalar(
+        select(func.count()).select_from(model_class).where(model_class.is_deleted == False)
+    )
+
     # Validate order range
     if new_order <= 0 or new_order > max_order:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Order must be between 1 and {max_order}"
         )
-    
-    # If order hasn't changed, no need to do anything
-    if new_order == item.order:
+
+    # Lock the rows that end up directly before and after the item
+    neighbours = db.execute(
+        select(model_class.id, model_class.order)
+        .where(model_class.is_deleted == False, model_class.id != item_id)
+        .order_by(*_display_order(model_class))
+        .offset(max(new_order - 2, 0))
+        .limit(2 if new_order > 1 else 1)
+        .with_for_update()
+    ).all()
+    before = neighbours[0] if new_order > 1 else None
+    after = neighbours[-1] if neighbours and (new_order == 1 or len(neighbours) == 2) else None
+
+    low = before.order if before else 0
+    high = after.order if after else low + 2 * ORDER_KEY_GAP
+
+    # Already strictly between its new neighbours: nothing to write
+    if low < item.order < high:
         return
-    
-    # Perform reordering
-    if new_order > item.order:
-        # Moving forward - decrease order of items between old and new position
-        affected_items = db.query(model_class).filter(
-            model_class.is_deleted == False,
-            model_class.id != item_id,
-            model_class.order > item.order,
-            model_class.order <= new_order
-        ).order_by(model_class.order).all()
-        
-        for affected_item in affected_items:
-            affected_item.order -= 1
-    else:
-        # Moving backward - increase order of items between new and old position
-        affected_items = db.query(model_class).filter(
-            model_class.is_deleted == False,
-            model_class.id != item_id,
-            model_class.order >= new_order,
-            model_class.order < item.order
-        ).order_by(model_class.order).all()
-        
-        for affected_item in affected_items:
-            affected_item.order += 1
-    
-    # Update the item's order
-    item.order = new_order
 
+    key = (low + high) // 2
+    if low < key < high:
+        item.order = key
+        # Sessions don't autoflush: later moves in this transaction must see the new key
+        db.flush()
+        if min(key - low, high - key) < ORDER_KEY_REBALANCE_THRESHOLD and background_tasks is not None:
+            background_tasks.add_task(rebalance_in_background, model_class)
+        return
+
+    # Gap used up (or dense legacy keys): respace everything with the item in its new place
+    rows = db.execute(
+        select(model_class.id, model_class.order)
+        .where(model_class.is_deleted == False, model_class.id != item_id)
+        .order_by(*_display_order(model_class))
+        .with_for_update()
+    ).all()
+    current = dict(rows)
+    current[item_id] = item.order
+    ids = [row_id for row_id, _ in rows]
+    ids.insert(new_order - 1, item_id)
+    _write_order_keys(db, model_class, _spaced_keys(current, ids))
+    db.expire(item, ["order"])
+
+
+def next_order_key(db: Session, model_class: Type[ModelType]) -> int:
+    """
+    Key placing a new item after every non-deleted item.
+    """
+    last = db.scalar(select(func.max(model_class.order)).where(model_class.is_deleted == False))
+    return (last or 0) + ORDER_KEY_GAP
+
+
+def add_ordered_item(
+    db: Session,
+    model_class: Type[ModelType],
+    item,
+    position: Optional[int] = None,
+    background_tasks: Optional[BackgroundTasks] = None
+) -> None:
+    """
+    Add a new item after the last one and, when `position` (1-indexed) is given, move it there
+    with reorder_item. The caller commits.
+    """
+    item.order = next_order_key(db, model_class)
+    db.add(item)
+    db.flush()
+    if position is not None:
+        reorder_item(db, model_class, item.id, position, background_tasks)
+
+
+def apply_ordering(
+    db: Session,
+    model_class: Type[ModelType],
+    ids: List[int]
+) -> None:
+    """
+    Rewrite the position of every non-deleted item from a full ordering.
+
+    `ids` must list each non-deleted item exactly once; the first id comes first. Keys are
+    respaced ORDER_KEY_GAP apart and only rows whose key changes are written. The caller commits.
+
+    Raises:
+        HTTPException: If ids contain duplicates or don't match the non-deleted items
+    """
+    if len(set(ids)) != len(ids):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Ordering contains duplicate ids"
+        )
+
+    current = dict(db.execute(
+        select(model_class.id, model_class.order).where(model_class.is_deleted == False).with_for_update()
+    ).all())
+    missing = set(current).difference(ids)
+    unknown = set(ids).difference(current)
+    if missing or unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=(
+                f"Ordering must list every {model_class.__name__} exactly once "
+                f"(missing: {sorted(missing)[:20]}, unknown: {sorted(unknown)[:20]})"
+            )
+        )
+
+    _write_order_keys(db, model_class, _spaced_keys(current, ids))
@@ -0,0 +1,115 @@
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import Iterable, Tuple
+from fastapi import HTTPException, UploadFile, status
+from fastapi.concurrency import run_in_threadpool
+from app.core.config import settings
+
+
+def validate_extension(filename: str, allowed: Iterable[str], detail: str) -> str:
+    """
+    Return the lower-cased extension of `filename`.
+
+    Raises:
+        HTTPException: If the extension is not in `allowed`
+    """
+    file_ext = os.path.splitext(filename or "")[1].lower()
+    if file_ext not in allowed:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=detail
+        )
+    return file_ext
+
+
+def _too_large(detail: str) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=detail
+    )
+
+
+def _open_temp(directory: Path):
+    directory.mkdir(parents=True, exist_ok=True)
+    # Same directory as the destination, so the final os.replace is an atomic rename
+    return tempfile.NamedTemporaryFile(dir=directory, prefix=".upload-", suffix=".part", delete=False)
+
+
+def discard_temp(path: Path) -> None:
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
+def _discard(temp) -> None:
+    temp.close()
+    discard_temp(Path(temp.name))
+
+
+async def stream_upload_to_temp(
+    file: UploadFile,
+    directory: Path,
+    max_size: int,
+    too_large_detail: str = "File is too large to upload."
+) -> Tuple[Path, int, str]:
+    """
+    Copy an upload to a temporary file in `directory` in UPLOAD_CHUNK_SIZE chunks, never holding
+    the whole file in memory, and return its path, size and sha256 hex digest.
+
+    The declared size is checked before anything is copied and a running total while copying, so an
+    oversized file is refused as soon as it crosses `max_size`. Disk I/O runs in the threadpool, off
+    the event loop. The caller renames the file into place or discards it; on failure nothing is
+    left behind.
+
+    Raises:
+        HTTPException: 413 if the file exceeds `max_size`
+    """
+    if file.size is not None and file.size > max_size:
+        raise _too_large(too_large_detail)
+
+    await file.seek(0)
+    temp = await run_in_threadpool(_open_temp, directory)
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        while True:
+            chunk = await file.read(settings.UPLOAD_CHUNK_SIZE)
+            if not chunk:
+                break
+            size += len(chunk)
+            if size > max_size:
+                raise _too_large(too_large_detail)
+            digest.update(chunk)
+            await run_in_threadpool(temp.write, chunk)
+        await run_in_threadpool(temp.close)
+    except BaseException:
+        await run_in_threadpool(_discard, temp)
+        raise
+    return Path(temp.name), size, digest.hexdigest()
+
+
+async def stream_upload_to_path(
+    file: UploadFile,
+    destination: Path,
+    max_size: int,
+    too_large_detail: str = "File is too large to upload."
+) -> int:
+    """
+    Stream an upload to `destination` (see stream_upload_to_temp) and return its size.
+
+    The temporary file sits next to `destination` and is renamed into place only once complete:
+    readers never see a partial file and a failed upload leaves nothing behind.
+
+    Raises:
+        HTTPException: 413 if the file exceeds `max_size`
+    """
+    temp_path, size, _ = await stream_upload_to_temp(file, destination.parent, max_size, too_large_detail)
+    try:
+        await run_in_threadpool(os.replace, temp_path, destination)
+    except BaseException:
+        await run_in_threadpool(discard_temp, temp_path)
+        raise
+    return size
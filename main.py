@@ -2,17 +2,18 @@ import os
 from fastapi import FastAPI, Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
-from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.core.logging_config import setup_logging
+from app.core.responses import DefaultJSONResponse
 logger = setup_logging()
 
-from app.api.v1.endpoints import auth, contact, team, jobs, papers, feature_publication, news, upload_image, lab_gallery
+from app.api.v1.endpoints import auth, contact, team, jobs, papers, feature_publication, news, upload_image, lab_gallery, homepage, metrics, archive
 
 app = FastAPI(
     title="Beacon Lab AI Backend",
     root_path="/beaconlabai",
+    default_response_class=DefaultJSONResponse,
     docs_url="/docs",
     openapi_url="/openapi.json",
     swagger_ui_parameters={
@@ -30,6 +31,26 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+from app.core.config import settings
+from app.core.compression import CompressionMiddleware
+from app.core.static_files import CONTENT_HASHED_NAME, PrecompressedStaticFiles
+from app.core.upload_limits import UploadSizeLimitMiddleware
+from app.db.query_stats import QueryStatsMiddleware
+from app.services.rate_limit import RateLimitMiddleware
+
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+    gzip_level=settings.GZIP_COMPRESS_LEVEL,
+    brotli_quality=settings.BROTLI_QUALITY,
+)
+
+if settings.SQL_INSTRUMENTATION_ENABLED:
+    app.add_middleware(QueryStatsMiddleware)
+
+app.add_middleware(UploadSizeLimitMiddleware, max_body_size=settings.UPLOAD_MAX_REQUEST_SIZE)
+app.add_middleware(RateLimitMiddleware, routes={("POST", "/api/v1/jobs/{job_id}/apply"): "job_apply"})
+
 def make_serializable(obj):
     """Recursively convert exception objects to strings for JSON serialization."""
     if isinstance(obj, Exception):
@@ -52,13 +73,20 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
         content={"detail": serializable_errors, "body": exc.body},
     )
 
-from app.core.config import settings
-
 os.makedirs("images", exist_ok=True)
-app.mount("/images", StaticFiles(directory="images"), name="images")
+app.mount(
+    "/images",
+    PrecompressedStaticFiles(
+        directory="images",
+        immutable_pattern=CONTENT_HASHED_NAME,
+        offload=settings.STATIC_FILES_OFFLOAD,
+        offload_prefix=f"{settings.STATIC_FILES_ACCEL_PREFIX}/images"
+    ),
+    name="images"
+)
 
+# CVs are not mounted: they are served by /api/v1/jobs/applications/{id}/cv behind signed links
 os.makedirs("cv_uploads", exist_ok=True)
-app.mount("/cv_uploads", StaticFiles(directory="cv_uploads"), name="cv_uploads")
 
 
 #  Include API Routes
@@ -72,6 +100,9 @@ app.include_router(feature_publication.router, prefix="/api/v1/feature_publicati
 app.include_router(news.router, prefix="/api/v1/news", tags=["News"])
 app.include_router(upload_image.router, prefix="/api/v1/upload_image", tags=["Upload Image"])
 app.include_router(lab_gallery.router, prefix="/api/v1/lab_gallery", tags=["Lab Gallery"])
+app.include_router(homepage.router, prefix="/api/v1/homepage", tags=["Homepage"])
+app.include_router(metrics.router, prefix="/api/v1/metrics", tags=["Metrics"])
+app.include_router(archive.router, prefix="/api/v1/archive", tags=["Archive"])
 
 
 
@@ -0,0 +1,30 @@
+"""
+Move rows soft-deleted longer than ARCHIVE_AFTER_DAYS into their `<table>_archive` tables.
+
+Meant to run from cron, e.g. nightly:
+
+    python -m scripts.archive_soft_deleted [--days 30] [--batch-size 500] [--tables contact_inquiries job_applicants]
+"""
+import argparse
+
+from app.db.database import SessionLocal
+from app.models.archive import ARCHIVED_MODELS
+from app.services.archive import archive_soft_deleted
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--days", type=int, default=None, help="Defaults to ARCHIVE_AFTER_DAYS")
+    parser.add_argument("--batch-size", type=int, default=None, help="Defaults to ARCHIVE_BATCH_SIZE")
+    parser.add_argument("--tables", nargs="+", choices=list(ARCHIVED_MODELS), default=None)
+    args = parser.parse_args()
+
+    with SessionLocal() as db:
+        moved = archive_soft_deleted(db, args.days, args.batch_size, args.tables)
+
+    for name, count in moved.items():
+        print(f"{name}: {count} archived")
+
+
+if __name__ == "__main__":
+    main()
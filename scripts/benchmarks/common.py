@@ -0,0 +1,31 @@
+"""
+Shared helpers for the benchmark scripts.
+
+Benchmarks import the application package, so run them from the repository root as modules
+(e.g. `python -m scripts.benchmarks.serialization`) with the usual .env in place.
+"""
+import statistics
+import time
+
+
+def measure(func, number: int = 10, repeat: int = 5) -> float:
+    """
+    Return the median time of one call to `func` in milliseconds.
+    `func` is called `number` times per round, for `repeat` rounds.
+    """
+    rounds = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        rounds.append((time.perf_counter() - start) / number)
+    return statistics.median(rounds) * 1000
+
+
+def print_table(headers: list[str], rows: list[list]) -> None:
+    widths = [max(len(str(value)) for value in column) for column in zip(headers, *rows)]
+    line = "  ".join(f"{{:<{width}}}" for width in widths)
+    print(line.format(*headers))
+    print(line.format(*("-" * width for width in widths)))
+    for row in rows:
+        print(line.format(*row))
@@ -0,0 +1,130 @@
+"""
+Concurrency of the sync-Session vs AsyncSession paths inside `async def` endpoints.
+
+Two copies of the news list query are mounted on a throwaway app: one using the blocking
+`get_db` session (the old pattern), one using `get_async_db`. Each is hit by N concurrent
+clients while a monitor task measures event loop lag (how late a 5 ms sleep wakes up), which
+is the delay every other request in the worker would see.
+
+Usage:
+    python -m scripts.benchmarks.db_concurrency [--rows 20000] [--concurrency 20] [--requests 200]
+
+Requires httpx and an async driver (aiosqlite for the default SQLite database).
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from datetime import datetime
+
+db_path = os.path.join(tempfile.mkdtemp(), "db_concurrency.db")
+os.environ["DATABASE_URL"] = f"sqlite:///{db_path}"
+os.environ.pop("ASYNC_DATABASE_URL", None)
+
+import httpx
+from fastapi import Depends, FastAPI
+from sqlalchemy import func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.db.database import Base, SessionLocal, engine, get_async_db, get_async_engine, get_db
+from app.models.news import News
+from scripts.benchmarks.common import print_table
+
+SEARCH = "%tumour%"
+
+app = FastAPI()
+
+
+@app.get("/sync")
+async def list_news_sync(db: Session = Depends(get_db)):
+    query = db.query(News).filter(News.is_deleted == False, News.content.ilike(SEARCH))
+    total = query.count()
+    items = query.order_by(News.order.asc(), News.created_at.desc()).limit(10).all()
+    return {"total": total, "items": [item.id for item in items]}
+
+
+@app.get("/async")
+async def list_news_async(db: AsyncSession = Depends(get_async_db)):
+    query = select(News).where(News.is_deleted == False, News.content.ilike(SEARCH))
+    total = await db.scalar(select(func.count()).select_from(query.subquery()))
+    items = (await db.scalars(query.order_by(News.order.asc(), News.created_at.desc()).limit(10))).all()
+    return {"total": total, "items": [item.id for item in items]}
+
+
+def seed(rows: int) -> None:
+    Base.metadata.create_all(engine, tables=[News.__table__])
+    content = "Oncology update on tumour response and treatment outcomes. " * 40
+    with SessionLocal() as db:
+        db.execute(insert(News), [
+            {"title": f"News {i}", "content": content, "publish_date": datetime(2025, 1, 1), "order": i}
+            for i in range(rows)
+        ])
+        db.commit()
+
+
+async def run(path: str, concurrency: int, total_requests: int) -> list:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        queue = asyncio.Queue()
+        for _ in range(total_requests):
+            queue.put_nowait(None)
+        latencies, lags = [], []
+        done = asyncio.Event()
+
+        async def worker():
+            while not queue.empty():
+                queue.get_nowait()
+                start = time.perf_counter()
+                response = await client.get(path)
+                response.raise_for_status()
+                latencies.append(time.perf_counter() - start)
+
+        async def monitor():
+            while not done.is_set():
+                start = time.perf_counter()
+                await asyncio.sleep(0.005)
+                lags.append(time.perf_counter() - start - 0.005)
+
+        monitor_task = asyncio.create_task(monitor())
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+        done.set()
+        await monitor_task
+
+    def pct(values, q):
+        return statistics.quantiles(values, n=100)[q - 1] * 1000 if len(values) > 1 else values[0] * 1000
+
+    return [
+        path.strip("/"),
+        f"{total_requests / elapsed:.1f}",
+        f"{pct(latencies, 50):.1f}",
+        f"{pct(latencies, 95):.1f}",
+        f"{pct(lags, 50):.1f}",
+        f"{max(lags) * 1000:.1f}",
+    ]
+
+
+async def run_all(concurrency: int, total_requests: int) -> list:
+    table = [await run(path, concurrency, total_requests) for path in ("/sync", "/async")]
+    await get_async_engine().dispose()
+    return table
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+
+    seed(args.rows)
+    table = asyncio.run(run_all(args.concurrency, args.requests))
+    print_table(["path", "req/s", "p50 ms", "p95 ms", "loop lag p50 ms", "loop lag max ms"], table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,424 @@
+"""
+HTTP load test: concurrent clients drive realistic traffic mixes against a running API.
+
+By default the app is started with uvicorn against a SQLite database filled by
+scripts.seed_synthetic_data (created in --workdir on first use and reused afterwards); pass --url
+to target a server that is already running and seeded instead. Each client loops over requests
+drawn from the scenario's weighted mix until --duration is up:
+
+    browse   public list / detail pages, homepage and gallery images
+    search   list endpoints with search terms and filters
+    admin    logs in, then admin lists, updates, bulk edits and reorders
+    apply    job applications with a small PDF upload
+    contact  contact form submissions
+    mixed    mostly browsing and searching with a little of everything else
+
+Latency percentiles (p50/p95/p99), throughput and error counts are reported per route template.
+Results can be written as JSON and compared against a stored baseline: the run fails (exit 1) when
+a route's p95 grows or its throughput drops by more than --threshold.
+
+Usage:
+    python -m scripts.benchmarks.load_test [--scenario mixed] [--concurrency 20] [--duration 30]
+        [--scale 0.05] [--output results.json] [--baseline baseline.json] [--save-baseline baseline.json]
+
+Requires httpx and uvicorn. Email notifications are pointed at a closed local port so background
+tasks fail fast instead of reaching a real SMTP server.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from pathlib import Path
+
+import httpx
+
+from scripts.benchmarks.common import print_table
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+API = "/api/v1"
+# Static mounts only answer under the app's root_path
+STATIC_PREFIX = "/beaconlabai"
+SEARCH_TERMS = ["tumour", "cohort", "neural", "survival", "biomarker", "screening", "transformer", "registry"]
+PAPER_CATEGORIES = ["bioinformatics", "artificial intelligence", "evidence synthesis", "oncology", "genomics"]
+# Minimal valid PDF, uploaded as the CV of every application
+CV_PDF = (
+    b"%PDF-1.4\n1 0 obj<</Type/Catalog/Pages 2 0 R>>endobj\n"
+    b"2 0 obj<</Type/Pages/Kids[]/Count 0>>endobj\ntrailer<</Root 1 0 R>>\n%%EOF\n"
+)
+
+
+class Pool:
+    """Ids and image URLs discovered from the list endpoints before the run starts."""
+
+    def __init__(self):
+        self.ids = defaultdict(list)
+        self.images = []
+        self.category_filter = True
+
+    def pick(self, rng: random.Random, name: str):
+        return rng.choice(self.ids[name]) if self.ids[name] else 1
+
+
+async def discover(client: httpx.AsyncClient, pool: Pool, pages: int = 3) -> None:
+    listings = {
+        "news": f"{API}/news/get_all_news",
+        "team": f"{API}/team/list_team_members",
+        "feature_publication": f"{API}/feature_publication/list",
+        "lab_gallery": f"{API}/lab_gallery/list",
+        "papers": f"{API}/papers/list_all_papers",
+        "jobs": f"{API}/jobs",
+    }
+    for name, path in listings.items():
+        for page in range(1, pages + 1):
+            response = await client.get(path, params={"page": page, "size": 100})
+            response.raise_for_status()
+            items = response.json()["items"]
+            pool.ids[name].extend(item["id"] for item in items)
+            pool.images.extend(item["image_url"] for item in items if item.get("image_url"))
+            if len(items) < 100:
+                break
+    response = await client.get(f"{API}/jobs", params={"status_filter": "open", "size": 100})
+    response.raise_for_status()
+    pool.ids["open_jobs"] = [item["id"] for item in response.json()["items"]]
+    pool.images = sorted(set(pool.images))
+    # The paper category filter uses MySQL's JSON_CONTAINS; leave it out against SQLite
+    response = await client.get(f"{API}/papers/list_all_papers", params={"category": PAPER_CATEGORIES[0]})
+    pool.category_filter = response.status_code == 200
+
+
+def browse(rng: random.Random, pool: Pool):
+    """Public pages as a visitor clicks through them: (weight, route, method, url, kwargs)."""
+    page = rng.choice([1, 1, 1, 2, 3])
+    image = rng.choice(pool.images) if pool.images else "images/missing.png"
+    return [
+        (10, "GET /homepage", "GET", f"{API}/homepage", {}),
+        (10, "GET /news/get_all_news", "GET", f"{API}/news/get_all_news", {"params": {"page": page}}),
+        (6, "GET /news/get_news/{id}", "GET", f"{API}/news/get_news/{pool.pick(rng, 'news')}", {}),
+        (8, "GET /papers/list_all_papers", "GET", f"{API}/papers/list_all_papers", {"params": {"page": page}}),
+        (6, "GET /team/list_team_members", "GET", f"{API}/team/list_team_members", {}),
+        (4, "GET /team/{id}/get", "GET", f"{API}/team/{pool.pick(rng, 'team')}/get", {}),
+        (5, "GET /feature_publication/list", "GET", f"{API}/feature_publication/list", {}),
+        (3, "GET /feature_publication/{id}/get", "GET",
+         f"{API}/feature_publication/{pool.pick(rng, 'feature_publication')}/get", {}),
+        (5, "GET /lab_gallery/list", "GET", f"{API}/lab_gallery/list", {"params": {"page": page}}),
+        (5, "GET /jobs", "GET", f"{API}/jobs", {}),
+        (3, "GET /jobs/{id}", "GET", f"{API}/jobs/{pool.pick(rng, 'jobs')}", {}),
+        (2, "GET /contact/info", "GET", f"{API}/contact/info", {}),
+        (12, "GET /images/{name}", "GET", f"{STATIC_PREFIX}/{image.lstrip('/')}", {}),
+    ]
+
+
+def search(rng: random.Random, pool: Pool):
+    term = rng.choice(SEARCH_TERMS)
+    return [
+        (10, "GET /papers/list_all_papers?search", "GET", f"{API}/papers/list_all_papers",
+         {"params": {"search": term}}),
+        (4 if pool.category_filter else 0, "GET /papers/list_all_papers?category", "GET",
+         f"{API}/papers/list_all_papers", {"params": {"category": rng.choice(PAPER_CATEGORIES), "search": term}}),
+        (6, "GET /news/get_all_news?search", "GET", f"{API}/news/get_all_news", {"params": {"search": term}}),
+        (3, "GET /team/list_team_members?search", "GET", f"{API}/team/list_team_members",
+         {"params": {"search": rng.choice(["Chen", "Patel", "Garcia", "Amina", "Omar"])}}),
+        (3, "GET /feature_publication/list?search", "GET", f"{API}/feature_publication/list",
+         {"params": {"search": term}}),
+        (3, "GET /lab_gallery/list?search", "GET", f"{API}/lab_gallery/list", {"params": {"search": term}}),
+    ]
+
+
+def admin(rng: random.Random, pool: Pool):
+    gallery_id = pool.pick(rng, "lab_gallery")
+    news_count = max(len(pool.ids["news"]), 1)
+    return [
+        (8, "GET /contact/inquiries", "GET", f"{API}/contact/inquiries", {"params": {"page": rng.randint(1, 5)}}),
+        (6, "GET /jobs/applications", "GET", f"{API}/jobs/applications", {"params": {"page": rng.randint(1, 5)}}),
+        (4, "GET /jobs?is_public=false", "GET", f"{API}/jobs", {"params": {"is_public": "false"}}),
+        (4, "PUT /news/update_news/{id}", "PUT", f"{API}/news/update_news/{pool.pick(rng, 'news')}",
+         {"data": {"title": f"Updated headline {rng.randint(1, 10**6)}"}}),
+        (4, "PUT /lab_gallery/{id}/update", "PUT", f"{API}/lab_gallery/{gallery_id}/update",
+         {"json": {"participant": f"Group {rng.randint(1, 40)}"}}),
+        (2, "POST /lab_gallery/bulk", "POST", f"{API}/lab_gallery/bulk", {"json": {"operations": [
+            {"action": "update", "id": pool.pick(rng, "lab_gallery"), "data": {"location": "Scottsdale, AZ"}}
+            for _ in range(10)
+        ]}}),
+        (3, "PUT /news/reorder/{id}", "PUT", f"{API}/news/reorder/{pool.pick(rng, 'news')}",
+         {"json": {"order": rng.randint(1, news_count)}}),
+    ]
+
+
+def apply(rng: random.Random, pool: Pool, email_domain: str = "gmail.com"):
+    first, last = rng.choice(["Amina", "Kenji", "Rosa", "Yusuf"]), rng.choice(["Chen", "Okafor", "Silva"])
+    return [
+        (1, "POST /jobs/{id}/apply", "POST", f"{API}/jobs/{pool.pick(rng, 'open_jobs')}/apply", {
+            "data": {
+                "full_name": f"{first} {last}",
+                "email": f"{first.lower()}.{last.lower()}{rng.randint(1, 10**6)}@{email_domain}",
+                "phone": "+1 480 555 0100",
+                "cover_letter": "I would like to join the lab. " * rng.randint(5, 40),
+            },
+            "files": {"cv": ("cv.pdf", CV_PDF, "application/pdf")},
+        }),
+    ]
+
+
+def contact(rng: random.Random, pool: Pool):
+    return [
+        (1, "POST /contact/submit", "POST", f"{API}/contact/submit", {"json": {
+            "first_name": rng.choice(["Dana", "Irfan", "Lena"]),
+            "last_name": rng.choice(["Haddad", "Jensen", "Xu"]),
+            "email": f"visitor{rng.randint(1, 10**6)}@gmail.com",
+            "subject": rng.choice(["General Query", "Contributing", "Join Lab"]),
+            "message": "Hello, I have a question about your research. " * rng.randint(1, 10),
+        }}),
+    ]
+
+
+# Scenario -> [(weight, request generator)]
+SCENARIOS = {
+    "browse": [(1, browse)],
+    "search": [(1, search)],
+    "admin": [(1, admin)],
+    "apply": [(1, apply)],
+    "contact": [(1, contact)],
+    "mixed": [(70, browse), (20, search), (5, admin), (2, apply), (3, contact)],
+}
+
+
+def next_request(rng: random.Random, pool: Pool, scenario: str, email_domain: str):
+    generators = SCENARIOS[scenario]
+    generator = rng.choices([g for _, g in generators], weights=[w for w, _ in generators])[0]
+    requests = generator(rng, pool, email_domain) if generator is apply else generator(rng, pool)
+    return rng.choices(requests, weights=[r[0] for r in requests])[0][1:]
+
+
+async def login(client: httpx.AsyncClient, email: str, password: str) -> dict:
+    response = await client.post(f"{API}/auth/login", data={"username": email, "password": password})
+    response.raise_for_status()
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+async def worker(client, pool, args, seed, deadline, headers, samples, errors):
+    rng = random.Random(seed)
+    while time.perf_counter() < deadline:
+        route, method, url, kwargs = next_request(rng, pool, args.scenario, args.email_domain)
+        start = time.perf_counter()
+        try:
+            response = await client.request(method, url, headers=headers, **kwargs)
+            ok = response.status_code < 400
+        except httpx.HTTPError:
+            ok = False
+        elapsed = (time.perf_counter() - start) * 1000
+        samples[route].append(elapsed)
+        if not ok:
+            errors[route] += 1
+
+
+def percentile(values, q: int) -> float:
+    if len(values) < 2:
+        return values[0] if values else 0.0
+    return statistics.quantiles(values, n=100, method="inclusive")[q - 1]
+
+
+def summarize(samples, errors, elapsed: float) -> dict:
+    routes = {}
+    for route, values in sorted(samples.items()):
+        routes[route] = {
+            "requests": len(values),
+            "errors": errors[route],
+            "throughput": round(len(values) / elapsed, 2),
+            "p50": round(percentile(values, 50), 2),
+            "p95": round(percentile(values, 95), 2),
+            "p99": round(percentile(values, 99), 2),
+        }
+    everything = [value for values in samples.values() for value in values]
+    routes["ALL"] = {
+        "requests": len(everything),
+        "errors": sum(errors.values()),
+        "throughput": round(len(everything) / elapsed, 2),
+        "p50": round(percentile(everything, 50), 2),
+        "p95": round(percentile(everything, 95), 2),
+        "p99": round(percentile(everything, 99), 2),
+    }
+    return routes
+
+
+def compare(routes: dict, baseline: dict, threshold: float) -> list:
+    """Routes whose p95 grew or throughput dropped by more than `threshold` (a fraction)."""
+    regressions = []
+    for route, current in routes.items():
+        previous = baseline.get("routes", {}).get(route)
+        if not previous:
+            continue
+        if previous["p95"] and current["p95"] > previous["p95"] * (1 + threshold):
+            regressions.append(f"{route}: p95 {previous['p95']} -> {current['p95']} ms")
+        if previous["throughput"] and current["throughput"] < previous["throughput"] * (1 - threshold):
+            regressions.append(f"{route}: throughput {previous['throughput']} -> {current['throughput']} req/s")
+    return regressions
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(args) -> tuple:
+    """Seed the work directory's database if needed and start uvicorn on it."""
+    workdir = Path(args.workdir or os.path.join(tempfile.gettempdir(), "beaconlab_load_test")).resolve()
+    workdir.mkdir(parents=True, exist_ok=True)
+    env = {
+        **os.environ,
+        "PYTHONPATH": str(REPO_ROOT),
+        "DATABASE_URL": f"sqlite:///{workdir / 'load_test.db'}",
+        "ASYNC_DATABASE_URL": "",
+        "DATABASE_REPLICA_URLS": "",
+        "SECRET_KEY": os.environ.get("SECRET_KEY", "load-test-secret"),
+        "ALGORITHM": os.environ.get("ALGORITHM", "HS256"),
+        "SMTP_SERVER": "127.0.0.1",
+        "SMTP_PORT": str(free_port()),
+        "SMTP_USERNAME": "load-test",
+        "SMTP_PASSWORD": "load-test",
+    }
+    if not (workdir / "load_test.db").exists():
+        print(f"seeding {workdir} (scale {args.scale})")
+        subprocess.run(
+            [sys.executable, "-m", "scripts.seed_synthetic_data", "--create-tables", "--scale", str(args.scale),
+             "--seed", str(args.seed), "--admin-email", args.admin_email, "--admin-password", args.admin_password],
+            cwd=workdir, env=env, check=True
+        )
+        # WAL lets readers and the single writer overlap; in the default rollback journal every
+        # write stalls concurrent requests behind "database is locked" and measures SQLite, not the app
+        with sqlite3.connect(workdir / "load_test.db") as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+    port = free_port()
+    (workdir / "images").mkdir(exist_ok=True)
+    (workdir / "cv_uploads").mkdir(exist_ok=True)
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--app-dir", str(REPO_ROOT), "--port", str(port),
+         "--workers", str(args.workers), "--log-level", "warning", "--no-access-log"],
+        cwd=workdir, env=env
+    )
+    return server, f"http://127.0.0.1:{port}"
+
+
+async def wait_until_ready(url: str, server, timeout: float = 60) -> None:
+    deadline = time.perf_counter() + timeout
+    async with httpx.AsyncClient(base_url=url) as client:
+        while time.perf_counter() < deadline:
+            if server is not None and server.poll() is not None:
+                raise RuntimeError("server exited during startup")
+            try:
+                if (await client.get("/")).status_code == 200:
+                    return
+            except httpx.TransportError:
+                pass
+            await asyncio.sleep(0.2)
+    raise RuntimeError(f"server at {url} did not become ready")
+
+
+async def run(args, url: str) -> dict:
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=url, limits=limits, timeout=args.timeout) as client:
+        pool = Pool()
+        await discover(client, pool)
+        needs_admin = any(generator is admin for _, generator in SCENARIOS[args.scenario])
+        headers = await login(client, args.admin_email, args.admin_password) if needs_admin else {}
+
+        samples, errors = defaultdict(list), defaultdict(int)
+        started = time.perf_counter()
+        deadline = started + args.duration
+        await asyncio.gather(*(
+            worker(client, pool, args, f"{args.seed}:{index}", deadline, headers, samples, errors)
+            for index in range(args.concurrency)
+        ))
+        elapsed = time.perf_counter() - started
+    return summarize(samples, errors, elapsed)
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scenario", choices=sorted(SCENARIOS), default="mixed")
+    parser.add_argument("--concurrency", type=int, default=20, help="Concurrent clients")
+    parser.add_argument("--duration", type=float, default=30, help="Seconds of traffic")
+    parser.add_argument("--timeout", type=float, default=30, help="Per-request timeout in seconds")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--url", help="Target an already running, seeded server instead of starting one")
+    parser.add_argument("--workdir", help="Where the SQLite database, images and CVs live (reused between runs)")
+    parser.add_argument("--scale", type=float, default=0.05, help="Passed to seed_synthetic_data on first use")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn worker processes")
+    parser.add_argument("--admin-email", default="admin@example.com")
+    parser.add_argument("--admin-password", default="admin")
+    parser.add_argument(
+        "--email-domain", default="gmail.com",
+        help="Applicant email domain; the apply endpoint checks it resolves, so offline runs see 400s"
+    )
+    parser.add_argument("--output", help="Write the results as JSON")
+    parser.add_argument("--baseline", help="Compare against a stored results file")
+    parser.add_argument("--save-baseline", help="Also write the results to this baseline file")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed p95 / throughput change vs baseline")
+    args = parser.parse_args()
+
+    server, url = (None, args.url) if args.url else start_server(args)
+    try:
+        asyncio.run(wait_until_ready(url, server))
+        routes = asyncio.run(run(args, url))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait(timeout=30)
+
+    result = {
+        "meta": {
+            "time": datetime.now(timezone.utc).isoformat(),
+            "git_revision": git_revision(),
+            "scenario": args.scenario,
+            "concurrency": args.concurrency,
+            "duration": args.duration,
+            "workers": args.workers,
+            "url": args.url or "local",
+        },
+        "routes": routes,
+    }
+
+    print(f"{args.scenario}: {args.concurrency} clients for {args.duration:g}s")
+    print_table(
+        ["route", "requests", "errors", "req/s", "p50 ms", "p95 ms", "p99 ms"],
+        [
+            [route, r["requests"], r["errors"], r["throughput"], r["p50"], r["p95"], r["p99"]]
+            for route, r in routes.items()
+        ]
+    )
+    for path in (args.output, args.save_baseline):
+        if path:
+            Path(path).write_text(json.dumps(result, indent=2))
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())
+        regressions = compare(routes, baseline, args.threshold)
+        if regressions:
+            print(f"\nregressions vs {args.baseline} (threshold {args.threshold:.0%}):")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print(f"\nno regressions vs {args.baseline} (threshold {args.threshold:.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Public endpoint latency during a login storm: bcrypt verified inline on the event loop vs on the
+bounded password executor (verify_password_async).
+
+A throwaway app mounts both login variants next to a cheap public endpoint. For each variant,
+--logins concurrent clients log in repeatedly for --duration seconds while one client polls the
+public endpoint; its latency is what every visitor of the worker sees during the storm. Public
+requests are due every 10 ms and timed from when they were due.
+
+Usage:
+    python -m scripts.benchmarks.login_storm [--logins 10] [--duration 5]
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+from fastapi import FastAPI, HTTPException
+
+from app.core.config import settings
+from app.services.auth import get_password_hash, verify_password, verify_password_async
+from scripts.benchmarks.common import print_table
+
+PASSWORD = "correct horse battery staple"
+HASHED = get_password_hash(PASSWORD)
+
+app = FastAPI()
+
+
+@app.post("/login/inline")
+async def login_inline():
+    if not verify_password(PASSWORD, HASHED):
+        raise HTTPException(status_code=401)
+    return {"ok": True}
+
+
+@app.post("/login/executor")
+async def login_executor():
+    if not await verify_password_async(PASSWORD, HASHED):
+        raise HTTPException(status_code=401)
+    return {"ok": True}
+
+
+@app.get("/public")
+async def public():
+    return {"detail": "Health Check"}
+
+
+def pct(values, q):
+    return statistics.quantiles(values, n=100)[q - 1] * 1000 if len(values) > 1 else values[0] * 1000
+
+
+async def storm(path: str, logins: int, duration: float) -> list:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=60) as client:
+        deadline = time.perf_counter() + duration
+        statuses, public_latencies = [], []
+
+        async def login_client():
+            while time.perf_counter() < deadline:
+                statuses.append((await client.post(path)).status_code)
+
+        async def public_client():
+            # One request every 10 ms, timed from when it was due rather than when it could be
+            # sent, so time spent stuck behind a blocked loop counts as latency
+            due = time.perf_counter()
+            while due < deadline:
+                (await client.get("/public")).raise_for_status()
+                public_latencies.append(time.perf_counter() - due)
+                due += 0.01
+                await asyncio.sleep(max(due - time.perf_counter(), 0))
+
+        await asyncio.gather(public_client(), *(login_client() for _ in range(logins)))
+
+    return [
+        path.rsplit("/", 1)[-1],
+        f"{statuses.count(200) / duration:.1f}",
+        statuses.count(503),
+        f"{pct(public_latencies, 50):.1f}",
+        f"{pct(public_latencies, 95):.1f}",
+        f"{max(public_latencies) * 1000:.1f}",
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--logins", type=int, default=10, help="Concurrent login clients")
+    parser.add_argument("--duration", type=float, default=5)
+    args = parser.parse_args()
+
+    table = [asyncio.run(storm(path, args.logins, args.duration)) for path in ("/login/inline", "/login/executor")]
+    print(
+        f"{args.logins} concurrent logins for {args.duration:g}s, "
+        f"PASSWORD_HASH_MAX_CONCURRENCY={settings.PASSWORD_HASH_MAX_CONCURRENCY}"
+    )
+    print_table(
+        ["login", "logins/s", "503s", "public p50 ms", "public p95 ms", "public max ms"],
+        table
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+"""
+Micro-benchmarks for pure-Python hot paths, run against recorded fixtures (no network, no SMTP).
+
+Cases:
+    e_fetch            PubMed efetch XML parsing (fixtures/pubmed_efetch.xml, and the same
+                       articles repeated to a 200-article batch)
+    parse_doi_ws_json  Crossref work parsing incl. the BeautifulSoup abstract strip
+                       (fixtures/crossref_work.json)
+    reorder_item       a single sparse-key move on a 2000-row SQLite table (rolled back)
+    paginated_response building a 10 / 100 item PaperResponse page
+    email              rendering the contact and job application notification HTML
+    make_serializable  the 422 handler's conversion of validation errors
+
+Each case reports the median time of one call in microseconds. --save-baseline stores the results
+as JSON; --baseline compares against such a file and exits 1 when any case is more than
+--threshold slower.
+
+Usage:
+    python -m scripts.benchmarks.micro [--filter e_fetch] [--repeat 7]
+        [--save-baseline micro.json] [--baseline micro.json --threshold 0.25]
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+INVOKED_FROM = Path.cwd()
+
+workdir = tempfile.mkdtemp()
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(workdir, 'micro.db')}"
+os.environ["ADMIN_NOTIFICATION_EMAIL"] = "admin@example.com, second.admin@example.com"
+
+# Settings read .env from the working directory, so load them before leaving it: main.py mounts
+# images/ and cv_uploads/ relative to the working directory, and this runs from a scratch one
+from app.core.config import settings  # noqa: F401
+sys.path.insert(0, str(INVOKED_FROM))
+os.chdir(workdir)
+for directory in ("images", "cv_uploads"):
+    os.makedirs(directory)
+
+from pydantic import BaseModel, Field, ValidationError
+from sqlalchemy import insert
+
+import main as app_main
+from app.core.responses import paginated_response
+from app.db.database import Base, SessionLocal, engine
+from app.models.news import News
+from app.schemas.papers import PaperResponse
+from app.services import email as email_service
+from app.services import papers as papers_service
+from app.services.reorder import ORDER_KEY_GAP, reorder_item
+from scripts.benchmarks.common import measure, print_table
+from scripts.benchmarks.serialization import make_rows
+
+REORDER_ROWS = 2000
+
+
+def efetch_batch(text: str, articles: int) -> str:
+    """Repeat the fixture's articles until the set holds `articles` of them."""
+    body = text[text.index("<PubmedArticle>"):text.rindex("</PubmedArticleSet>")]
+    parts = body.split("</PubmedArticle>")[:-1]
+    repeated = [parts[i % len(parts)] + "</PubmedArticle>" for i in range(articles)]
+    return text[:text.index("<PubmedArticle>")] + "\n".join(repeated) + "\n</PubmedArticleSet>\n"
+
+
+def e_fetch_case(text: str):
+    def run():
+        papers_service._e_fetch = lambda ids, db="pubmed": text
+        assert papers_service.e_fetch(["0"])["result"]["uids"]
+    return run
+
+
+def reorder_case():
+    Base.metadata.create_all(engine, tables=[News.__table__])
+    with SessionLocal() as db:
+        db.execute(insert(News), [
+            {"title": f"News {i}", "content": "", "publish_date": datetime(2025, 1, 1), "order": i * ORDER_KEY_GAP}
+            for i in range(1, REORDER_ROWS + 1)
+        ])
+        db.commit()
+
+    def run():
+        with SessionLocal() as db:
+            reorder_item(db, News, REORDER_ROWS, REORDER_ROWS // 2)
+            db.flush()
+            db.rollback()
+    return run
+
+
+def email_cases():
+    email_service.send_bulk_emails = lambda email_jobs: True
+    cover_letter = "I am applying for the research fellow position.\n\n" + "My background is in <oncology> & NLP. " * 40
+
+    def contact():
+        email_service.send_contact_inquiry_notification(
+            first_name="Dana", last_name="Haddad", email="dana@example.com", phone_number="+1 480 555 0100",
+            subject="Join Lab", message="I would like to learn more about joining the lab. " * 20
+        )
+
+    def application():
+        email_service.send_job_application_notification(
+            application_id=12, job_title="Research Fellow, Evidence Synthesis", full_name="Kenji Tanaka",
+            email="kenji@example.com", phone=None, cover_letter=cover_letter, cv_filename="3f2b9c.pdf"
+        )
+    return contact, application
+
+
+class _Form(BaseModel):
+    title: str = Field(min_length=1)
+    order: int
+    email: str = Field(pattern=r"^[^@]+@[^@]+$")
+
+
+def validation_errors(count: int) -> list:
+    errors = []
+    for i in range(count):
+        try:
+            _Form.model_validate({"title": "", "order": f"x{i}", "email": "nope"})
+        except ValidationError as e:
+            errors.extend(e.errors())
+    # RequestValidationError carries ctx values such as the raised exception
+    errors[0]["ctx"] = {"error": ValueError("Order must be greater than 0")}
+    return errors
+
+
+def build_cases(selected: str) -> list:
+    pubmed = (FIXTURES / "pubmed_efetch.xml").read_text()
+    crossref = json.loads((FIXTURES / "crossref_work.json").read_text())
+    crossref_no_abstract = {**crossref, "message": {k: v for k, v in crossref["message"].items() if k != "abstract"}}
+    rows_10, rows_100 = make_rows(10), make_rows(100)
+    errors = validation_errors(20)
+    contact, application = email_cases()
+
+    cases = [
+        ("e_fetch", "3 articles", e_fetch_case(pubmed), 50),
+        ("e_fetch", "200 articles", e_fetch_case(efetch_batch(pubmed, 200)), 3),
+        ("parse_doi_ws_json", "with JATS abstract", lambda: papers_service.parse_doi_ws_json(crossref), 200),
+        ("parse_doi_ws_json", "no abstract", lambda: papers_service.parse_doi_ws_json(crossref_no_abstract), 2000),
+        ("reorder_item", f"midpoint move, {REORDER_ROWS} rows", None, 20),
+        ("paginated_response", "10 papers", lambda: paginated_response(PaperResponse, rows_10, 1000, 1, 10), 500),
+        ("paginated_response", "100 papers", lambda: paginated_response(PaperResponse, rows_100, 1000, 1, 100), 50),
+        ("email", "contact inquiry", contact, 2000),
+        ("email", "job application", application, 2000),
+        ("make_serializable", f"{len(errors)} validation errors", lambda: app_main.make_serializable(errors), 2000),
+    ]
+    cases = [case for case in cases if not selected or selected in case[0]]
+    # Only build the database when the reorder case actually runs
+    return [
+        (name, variant, func if func is not None else reorder_case(), number)
+        for name, variant, func, number in cases
+    ]
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    regressions = []
+    for key, micros in results.items():
+        previous = baseline.get("results", {}).get(key)
+        if previous and micros > previous * (1 + threshold):
+            regressions.append(f"{key}: {previous:.1f} -> {micros:.1f} us (+{micros / previous - 1:.0%})")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--filter", default="", help="Only run cases whose name contains this")
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--save-baseline", help="Write the results to this JSON file")
+    parser.add_argument("--baseline", help="Compare against a stored results file")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed slowdown vs baseline, as a fraction")
+    args = parser.parse_args()
+
+    results = {}
+    table = []
+    for name, variant, func, number in build_cases(args.filter):
+        func()  # warm up imports and caches
+        micros = measure(func, number=number, repeat=args.repeat) * 1000
+        results[f"{name} [{variant}]"] = round(micros, 2)
+        table.append([name, variant, f"{micros:.1f}"])
+    print_table(["case", "variant", "us"], table)
+    engine.dispose()
+
+    if args.save_baseline:
+        (INVOKED_FROM / args.save_baseline).write_text(json.dumps({"results": results}, indent=2))
+
+    if args.baseline:
+        regressions = compare(results, json.loads((INVOKED_FROM / args.baseline).read_text()), args.threshold)
+        if regressions:
+            print(f"\nregressions vs {args.baseline} (threshold {args.threshold:.0%}):")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print(f"\nno regressions vs {args.baseline} (threshold {args.threshold:.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Reorder cost on a large table: the old row-by-row reorder_item vs the sparse-key one (which writes
+only the moved row), and rewriting a full ordering through ORM objects vs apply_ordering's CASE update.
+
+The table is seeded with keys ORDER_KEY_GAP apart, as after a rebalance. Each measured call runs in
+a transaction that is rolled back, so every round starts from the same table. Moves go from the last
+position to the first, the worst case for a range shift.
+
+Usage:
+    python -m scripts.benchmarks.reorder [--rows 10000] [--repeat 5]
+"""
+import argparse
+import os
+import tempfile
+from datetime import datetime
+
+db_path = os.path.join(tempfile.mkdtemp(), "reorder.db")
+os.environ["DATABASE_URL"] = f"sqlite:///{db_path}"
+
+from sqlalchemy import insert
+
+from app.db.database import Base, SessionLocal, engine
+from app.models.news import News
+from app.services.reorder import ORDER_KEY_GAP, apply_ordering, reorder_item
+from scripts.benchmarks.common import measure, print_table
+
+
+def legacy_reorder_item(db, model_class, item_id, new_order):
+    """The previous implementation: loads siblings and shifts them one ORM object at a time."""
+    item = db.query(model_class).filter(model_class.id == item_id, model_class.is_deleted == False).first()
+    siblings = db.query(model_class).filter(
+        model_class.is_deleted == False,
+        model_class.id != item_id
+    ).order_by(model_class.order).all()
+    max_order = len(siblings) + 1
+    assert 0 < new_order <= max_order
+    if new_order < item.order:
+        affected_items = db.query(model_class).filter(
+            model_class.is_deleted == False,
+            model_class.id != item_id,
+            model_class.order >= new_order,
+            model_class.order < item.order
+        ).order_by(model_class.order).all()
+        for affected_item in affected_items:
+            affected_item.order += 1
+    item.order = new_order
+    db.flush()
+
+
+def legacy_apply_ordering(db, model_class, ids):
+    """Rewrite every position through ORM objects, one UPDATE per row."""
+    items = {item.id: item for item in db.query(model_class).filter(model_class.is_deleted == False)}
+    for position, item_id in enumerate(ids, start=1):
+        items[item_id].order = position * ORDER_KEY_GAP
+    db.flush()
+
+
+def seed(rows: int) -> None:
+    Base.metadata.create_all(engine, tables=[News.__table__])
+    with SessionLocal() as db:
+        db.execute(insert(News), [
+            {"title": f"News {i}", "content": "", "publish_date": datetime(2025, 1, 1), "order": i * ORDER_KEY_GAP}
+            for i in range(1, rows + 1)
+        ])
+        db.commit()
+
+
+def in_rollback(func, *args):
+    def run():
+        with SessionLocal() as db:
+            func(db, *args)
+            db.flush()
+            db.rollback()
+    return run
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    seed(args.rows)
+    reversed_ids = list(range(args.rows, 0, -1))
+    # A typical drag: two neighbouring items swapped, everything else stays in place
+    swapped_ids = [2, 1] + list(range(3, args.rows + 1))
+    cases = [
+        ("move last -> first", "legacy reorder_item", in_rollback(legacy_reorder_item, News, args.rows, 1)),
+        ("move last -> first", "reorder_item", in_rollback(reorder_item, News, args.rows, 1)),
+        ("full ordering (reversed)", "per-row ORM updates", in_rollback(legacy_apply_ordering, News, reversed_ids)),
+        ("full ordering (reversed)", "apply_ordering", in_rollback(apply_ordering, News, reversed_ids)),
+        ("full ordering (two swapped)", "per-row ORM updates", in_rollback(legacy_apply_ordering, News, swapped_ids)),
+        ("full ordering (two swapped)", "apply_ordering", in_rollback(apply_ordering, News, swapped_ids)),
+    ]
+    table = [
+        [operation, implementation, f"{measure(func, number=1, repeat=args.repeat):.1f}"]
+        for operation, implementation, func in cases
+    ]
+    print(f"{args.rows} rows")
+    print_table(["operation", "implementation", "ms"], table)
+
+
+if __name__ == "__main__":
+    main()
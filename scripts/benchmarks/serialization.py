@@ -0,0 +1,91 @@
+"""
+Per-page serialization time of a paginated list response, before and after the single-pass path.
+
+"before" reproduces the old list_all_papers flow: model_validate on every row, then FastAPI
+validating and serializing the response_model again and rendering with the stdlib encoder.
+"after" is app.core.responses.paginated_response.
+
+Usage:
+    python -m scripts.benchmarks.serialization [--sizes 10 100 1000]
+"""
+import argparse
+import asyncio
+from datetime import datetime
+from types import SimpleNamespace
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from app.core.responses import build_page_info, paginated_response
+from app.schemas.pagination import PaginatedResponse
+from app.schemas.papers import PaperResponse
+from scripts.benchmarks.common import measure, print_table
+
+ABSTRACT = (
+    "Background: Large language models are increasingly used for evidence synthesis. "
+    "Methods: We screened citations and extracted outcomes across oncology trials. "
+) * 12
+
+
+def make_rows(count: int) -> list:
+    return [
+        SimpleNamespace(
+            id=i,
+            title=f"Paper title {i} on artificial intelligence in oncology",
+            abstract=ABSTRACT,
+            authers="A. Author, B. Author, C. Author, D. Author",
+            journal="Journal of Clinical Oncology",
+            publish_date="2025-01-01",
+            pubmed_id=str(30000000 + i),
+            nct_number="",
+            tags={"tag": ["ai", "oncology"]},
+            doi=f"10.1000/j.{i}",
+            category=["oncology", "artificial intelligence"],
+            order=(i + 1) * 1024,
+            position=i + 1,
+            is_presentation=False,
+            is_open=True,
+            created_at=datetime(2025, 1, 1),
+        )
+        for i in range(count)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    field = create_model_field(
+        name="Response_list_all_papers",
+        type_=PaginatedResponse[PaperResponse],
+        mode="serialization",
+    )
+    loop = asyncio.new_event_loop()
+
+    table = []
+    for size in args.sizes:
+        rows = make_rows(size)
+        number = max(1, 2000 // size)
+
+        def before():
+            items = [PaperResponse.model_validate(row) for row in rows]
+            content = PaginatedResponse[PaperResponse](items=items, page_info=build_page_info(size, 1, size))
+            data = loop.run_until_complete(serialize_response(field=field, response_content=content))
+            return JSONResponse(data).body
+
+        def after():
+            return paginated_response(PaperResponse, rows, size, 1, size).body
+
+        before_ms = measure(before, number=number, repeat=args.repeat)
+        after_ms = measure(after, number=number, repeat=args.repeat)
+        table.append([size, f"{before_ms:.3f}", f"{after_ms:.3f}", f"{before_ms / after_ms:.1f}x"])
+
+    loop.close()
+    print_table(["rows", "before (ms)", "after (ms)", "speedup"], table)
+
+
+if __name__ == "__main__":
+    main()
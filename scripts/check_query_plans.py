@@ -0,0 +1,117 @@
+"""
+Run EXPLAIN on every list endpoint query and fail if one falls back to a filesort or full table scan.
+
+The queries mirror the default (first page) shape of each list endpoint, including the status
+filter the public jobs list always applies, plus the status / job_id / subject variants. Run against a migrated database:
+
+    python -m scripts.check_query_plans
+
+Supports MySQL (`EXPLAIN`) and SQLite (`EXPLAIN QUERY PLAN`). Exits with status 1 on any bad plan.
+"""
+import sys
+
+from sqlalchemy import select, text
+
+from app.db.database import engine
+from app.models.contact import ContactInquiry
+from app.models.feature_publication import FeaturePublication
+from app.models.job_applicants import JobApplicant
+from app.models.jobs import Job
+from app.models.lab_gallery import LabGallery
+from app.models.news import News
+from app.models.papers import Paper
+from app.models.team import TeamMember
+from app.schemas.jobs import JobStatusEnum
+
+PAGE_SIZE = 10
+
+
+def _ordered(model):
+    return select(model).where(model.is_deleted == False).order_by(model.order.asc(), model.created_at.desc())
+
+
+LIST_QUERIES = {
+    "news": _ordered(News),
+    "team": _ordered(TeamMember),
+    "lab_gallery": _ordered(LabGallery),
+    "papers": _ordered(Paper),
+    "feature_publication": _ordered(FeaturePublication),
+    "jobs": _ordered(Job).where(Job.status.in_([JobStatusEnum.open, JobStatusEnum.closed])),
+    "jobs?is_public=false": _ordered(Job).where(
+        Job.status.in_([JobStatusEnum.open, JobStatusEnum.closed, JobStatusEnum.draft])
+    ),
+    "jobs?status_filter": _ordered(Job)
+    .where(Job.status.in_([JobStatusEnum.open, JobStatusEnum.closed]))
+    .where(Job.status == JobStatusEnum.open),
+    "jobs/applications": select(JobApplicant).order_by(JobApplicant.created_at.desc()),
+    "jobs/applications?job_id": select(JobApplicant)
+    .where(JobApplicant.job_id == 1)
+    .order_by(JobApplicant.created_at.desc()),
+    "contact": select(ContactInquiry)
+    .where(ContactInquiry.is_deleted == False)
+    .order_by(ContactInquiry.created_at.desc()),
+    "contact?subject": select(ContactInquiry)
+    .where(ContactInquiry.is_deleted == False, ContactInquiry.subject == "general")
+    .order_by(ContactInquiry.created_at.desc()),
+}
+
+
+def _mysql_problems(rows):
+    problems = []
+    for row in rows:
+        row = dict(row._mapping)
+        extra = row.get("Extra") or ""
+        if row.get("type") == "ALL":
+            problems.append(f"full scan of {row.get('table')}")
+        if "Using filesort" in extra:
+            problems.append(f"filesort on {row.get('table')}")
+    return problems
+
+
+def _sqlite_problems(rows):
+    problems = []
+    for row in rows:
+        detail = row._mapping["detail"]
+        if detail.startswith("SCAN") and "USING" not in detail:
+            problems.append(detail)
+        if "TEMP B-TREE" in detail:
+            problems.append(detail)
+    return problems
+
+
+def explain(connection, query):
+    """Return (plan lines, problems) for a query on the connected dialect."""
+    dialect = connection.dialect.name
+    sql = str(query.limit(PAGE_SIZE).compile(connection, compile_kwargs={"literal_binds": True}))
+    if dialect == "mysql":
+        rows = connection.execute(text(f"EXPLAIN {sql}")).all()
+        plan = [f"{r._mapping['table']}: type={r._mapping['type']} key={r._mapping['key']} {r._mapping['Extra'] or ''}" for r in rows]
+        return plan, _mysql_problems(rows)
+    if dialect == "sqlite":
+        rows = connection.execute(text(f"EXPLAIN QUERY PLAN {sql}")).all()
+        return [r._mapping["detail"] for r in rows], _sqlite_problems(rows)
+    raise SystemExit(f"Unsupported dialect for plan checks: {dialect}")
+
+
+def main() -> int:
+    failures = 0
+    with engine.connect() as connection:
+        for name, query in LIST_QUERIES.items():
+            plan, problems = explain(connection, query)
+            status = "FAIL" if problems else "ok"
+            print(f"[{status}] {name}")
+            for line in plan:
+                print(f"    {line}")
+            for problem in problems:
+                print(f"    !! {problem}")
+            failures += bool(problems)
+
+    if failures:
+        print(f"{failures} list queries use a filesort or full scan")
+        return 1
+    print("All list queries are index-ordered")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
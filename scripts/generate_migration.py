@@ -4,8 +4,12 @@ import subprocess
 from datetime import datetime
 
 def generate_migration():
-    if len(sys.argv) != 2:
-        print("Usage: python generate_migration.py 'migration message'")
+    # --data: an empty revision for a data migration (see app/db/migration_helpers.py) instead of
+    # an autogenerated schema diff
+    args = [arg for arg in sys.argv[1:] if arg != "--data"]
+    data_migration = len(args) != len(sys.argv) - 1
+    if len(args) != 1:
+        print("Usage: python generate_migration.py 'migration message' [--data]")
         sys.exit(1)
 
     folder_path = "./alembic/versions"
@@ -15,13 +19,19 @@ def generate_migration():
     else:
         print(f"Folder '{folder_path}' already exists.")
 
-    message = sys.argv[1]
+    message = args[0]
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     migration_name = f"{timestamp}_{message.lower().replace(' ', '_')}"
 
     try:
-        subprocess.run(["alembic", "revision", "--autogenerate", "-m", message], check=True)
-        print(f"Successfully generated migration: {migration_name}")
+        if data_migration:
+            subprocess.run(["alembic", "revision", "-m", message], check=True)
+            print(f"Successfully generated data migration: {migration_name}")
+            print("Use batched_backfill / create_index_online from app.db.migration_helpers inside "
+                  "op.get_context().autocommit_block()")
+        else:
+            subprocess.run(["alembic", "revision", "--autogenerate", "-m", message], check=True)
+            print(f"Successfully generated migration: {migration_name}")
     except subprocess.CalledProcessError as e:
         print(f"Error generating migration: {e}")
         sys.exit(1)
@@ -0,0 +1,29 @@
+"""
+Respace the `order` keys of the ordered content tables ORDER_KEY_GAP apart, keeping the current
+display order. Run once after deploying sparse order keys so the first moves don't have to
+rebalance inline; afterwards the API rebalances in the background when gaps run low.
+
+    python -m scripts.rebalance_order_keys
+"""
+from app.db.database import SessionLocal
+from app.models.feature_publication import FeaturePublication
+from app.models.jobs import Job
+from app.models.lab_gallery import LabGallery
+from app.models.news import News
+from app.models.papers import Paper
+from app.models.team import TeamMember
+from app.services.reorder import rebalance_order_keys
+
+ORDERED_MODELS = [News, TeamMember, LabGallery, Paper, FeaturePublication, Job]
+
+
+def main() -> None:
+    with SessionLocal() as db:
+        for model in ORDERED_MODELS:
+            count = rebalance_order_keys(db, model)
+            db.commit()
+            print(f"{model.__tablename__}: {count} rows rewritten")
+
+
+if __name__ == "__main__":
+    main()
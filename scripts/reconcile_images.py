@@ -0,0 +1,32 @@
+"""
+Sync the image library catalog (image_assets) with the files in IMAGES_UPLOAD_DIR.
+
+Registers image files added out of band (copied in by hand, restored from a backup, uploaded
+before the catalog existed) and drops rows whose file has been removed. Safe to rerun, e.g. from
+cron or after a deploy:
+
+    python -m scripts.reconcile_images [--dry-run]
+"""
+import argparse
+
+from app.db.database import SessionLocal
+from app.services.image_catalog import reconcile_image_catalog
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dry-run", action="store_true", help="Only report what would change")
+    parser.add_argument("--batch-size", type=int, default=500, help="Rows written per commit")
+    args = parser.parse_args()
+
+    with SessionLocal() as db:
+        result = reconcile_image_catalog(db, dry_run=args.dry_run, batch_size=args.batch_size)
+
+    prefix = "would be " if args.dry_run else ""
+    print(f"{result['added']} images {prefix}added ({result['duplicates']} duplicate content)")
+    print(f"{result['removed']} missing images {prefix}removed")
+    print(f"{result['variants']} variant manifests {prefix}stored")
+
+
+if __name__ == "__main__":
+    main()
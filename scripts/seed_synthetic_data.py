@@ -0,0 +1,386 @@
+"""
+Fill the database with realistic synthetic data for load testing.
+
+Every table gets a configurable volume of rows built from a fixed vocabulary; the output is fully
+determined by --seed (each table has its own random stream, so changing one volume doesn't change
+the others). Rows are written with batched executemany INSERTs and the script works against any
+DATABASE_URL (SQLite or MySQL). Dummy PNG images are written to IMAGES_UPLOAD_DIR and one small
+PDF per applicant to CV_UPLOAD_DIR/<job_id>/, and rows point at them like real uploads. The images
+are registered in the image library catalog.
+
+Rows are appended; run it against an empty database (e.g. after `alembic upgrade head`, or with
+--create-tables for a throwaway SQLite file).
+
+Usage:
+    python -m scripts.seed_synthetic_data [--seed 42] [--scale 1.0] [--papers 100000] [--inquiries 50000]
+        [--applicants 10000] [--create-tables] ...
+"""
+import argparse
+import random
+import struct
+import time
+import zlib
+from datetime import datetime, timedelta
+
+from sqlalchemy import insert, select
+
+from app.core.config import settings
+from app.db.database import Base, SessionLocal, engine
+from app.models.archive import ARCHIVE_TABLES  # noqa: F401  (registers the archive tables for --create-tables)
+from app.models.contact import ContactInquiry
+from app.models.feature_publication import FeaturePublication
+from app.models.image_assets import ImageAsset  # noqa: F401  (created by --create-tables)
+from app.models.job_applicants import JobApplicant
+from app.models.jobs import Job
+from app.models.lab_gallery import LabGallery
+from app.models.news import News
+from app.models.papers import Paper
+from app.models.role import UserRole
+from app.models.team import TeamMember
+from app.models.user import User
+from app.schemas.contact import ContactSubjectEnum
+from app.schemas.jobs import JobStatusEnum, JobTypeEnum
+from app.schemas.lab_gallery import LabGalleryCategory, LabGalleryStatus
+from app.schemas.papers import Category
+from app.schemas.team import TeamCategory
+from app.services.auth import get_password_hash
+from app.services.image_catalog import reconcile_image_catalog
+from app.services.reorder import ORDER_KEY_GAP
+
+DEFAULT_VOLUMES = {
+    "papers": 100000,
+    "feature_publications": 500,
+    "news": 2000,
+    "team": 300,
+    "gallery": 1000,
+    "jobs": 200,
+    "applicants": 10000,
+    "inquiries": 50000,
+    "users": 20,
+}
+
+# Base timestamp so runs are reproducible regardless of when they happen
+EPOCH = datetime(2025, 6, 1)
+
+WORDS = (
+    "tumour response oncology patients cohort trial randomized outcomes survival genomic sequencing "
+    "variant expression model learning neural network transformer language evidence synthesis "
+    "systematic review meta analysis screening extraction biomarker therapy immunotherapy radiation "
+    "chemotherapy progression hazard ratio confidence interval baseline follow up clinical registry "
+    "validation cohort prediction accuracy sensitivity specificity pathology imaging radiology "
+    "single cell transcriptome mutation burden signature pipeline annotation benchmark dataset "
+    "retrospective prospective multicenter phase enrolment eligibility adverse events toxicity dose"
+).split()
+FIRST_NAMES = (
+    "Amina Ben Carlos Dana Elif Farah Gustavo Hana Irfan Julia Kenji Lena Mateo Nadia Omar Priya "
+    "Quinn Rosa Samir Tara Umar Vera Wei Ximena Yusuf Zara"
+).split()
+LAST_NAMES = (
+    "Ahmed Bianchi Chen Dubois Evans Fischer Garcia Haddad Ito Jensen Kowalski Lopez Murphy Nakamura "
+    "Okafor Patel Quintero Rossi Silva Tanaka Usman Varga Williams Xu Yilmaz Zhang"
+).split()
+JOURNALS = [
+    "Journal of Clinical Oncology", "Nature Medicine", "The Lancet Oncology", "JAMA Oncology",
+    "npj Digital Medicine", "Bioinformatics", "Research Synthesis Methods", "Mayo Clinic Proceedings",
+]
+LOCATIONS = ["Scottsdale, AZ", "Rochester, MN", "Jacksonville, FL", "Remote", "Phoenix, AZ"]
+
+
+def words(rng: random.Random, low: int, high: int) -> str:
+    return " ".join(rng.choices(WORDS, k=rng.randint(low, high)))
+
+
+def sentence(rng: random.Random, low: int = 6, high: int = 14) -> str:
+    return words(rng, low, high).capitalize() + "."
+
+
+def paragraph(rng: random.Random, sentences: int) -> str:
+    return " ".join(sentence(rng) for _ in range(sentences))
+
+
+def person(rng: random.Random) -> tuple:
+    return rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+
+
+def timestamps(rng: random.Random, index: int) -> dict:
+    created_at = EPOCH - timedelta(minutes=index * 7 + rng.randint(0, 6))
+    return {"created_at": created_at, "updated_at": created_at + timedelta(hours=rng.randint(0, 72))}
+
+
+def png_bytes(rng: random.Random, size: int = 96) -> bytes:
+    """A valid RGB PNG of random-ish pixels (incompressible enough to be realistic)."""
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data) & 0xFFFFFFFF)
+
+    rows = b"".join(b"\x00" + bytes(rng.getrandbits(8) for _ in range(size * 3)) for _ in range(size))
+    header = struct.pack(">IIBBBBB", size, size, 8, 2, 0, 0, 0)
+    return b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header) + chunk(b"IDAT", zlib.compress(rows)) + chunk(b"IEND", b"")
+
+
+def pdf_bytes(rng: random.Random, name: str) -> bytes:
+    text = f"Curriculum Vitae - {name}"
+    stream = f"BT /F1 14 Tf 72 720 Td ({text}) Tj ET"
+    body = (
+        "%PDF-1.4\n"
+        "1 0 obj << /Type /Catalog /Pages 2 0 R >> endobj\n"
+        "2 0 obj << /Type /Pages /Kids [3 0 R] /Count 1 >> endobj\n"
+        "3 0 obj << /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents 4 0 R >> endobj\n"
+        f"4 0 obj << /Length {len(stream)} >> stream\n{stream}\nendstream endobj\n"
+    )
+    # Pad with comments so files have a realistic size
+    padding = "".join(f"% {paragraph(rng, 3)}\n" for _ in range(rng.randint(20, 60)))
+    return (body + padding + "trailer << /Root 1 0 R >>\n%%EOF\n").encode("latin-1")
+
+
+def write_images(rng: random.Random, count: int) -> list:
+    settings.IMAGES_UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for i in range(count):
+        path = settings.IMAGES_UPLOAD_DIR / f"synthetic_{i:05d}.png"
+        path.write_bytes(png_bytes(rng))
+        paths.append(str(path))
+    return paths
+
+
+def bulk_insert(db, model, rows, batch_size: int) -> int:
+    """Insert generated rows in executemany batches, committing each batch."""
+    count = 0
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            db.execute(insert(model), batch)
+            db.commit()
+            count += len(batch)
+            batch = []
+    if batch:
+        db.execute(insert(model), batch)
+        db.commit()
+        count += len(batch)
+    return count
+
+
+def gen_papers(rng, count, deleted_fraction):
+    categories = [c.value for c in Category]
+    for i in range(count):
+        authors = ", ".join(" ".join(person(rng)) for _ in range(rng.randint(2, 12)))
+        yield {
+            "title": sentence(rng, 8, 20).rstrip("."),
+            "abstract": paragraph(rng, rng.randint(10, 22)),
+            "authers": authors,
+            "journal": rng.choice(JOURNALS),
+            "publish_date": f"{rng.randint(2005, 2025)}-{rng.randint(1, 12)}-{rng.randint(1, 28)}",
+            "pubmed_id": str(20000000 + i),
+            "nct_number": f"NCT{rng.randint(10000000, 99999999)}" if rng.random() < 0.2 else "",
+            "tags": {"tag": rng.sample(WORDS, rng.randint(1, 5))},
+            "doi": f"10.{rng.randint(1000, 9999)}/synthetic.{i}",
+            "category": rng.sample(categories, rng.randint(0, 3)),
+            "order": (i + 1) * ORDER_KEY_GAP,
+            "is_presentation": rng.random() < 0.1,
+            "is_open": rng.random() < 0.4,
+            "is_deleted": rng.random() < deleted_fraction,
+            **timestamps(rng, i),
+        }
+
+
+def gen_feature_publications(rng, count, deleted_fraction, images):
+    for paper in gen_papers(rng, count, deleted_fraction):
+        paper.pop("tags")
+        paper.pop("category")
+        paper["image_url"] = rng.choice(images) if images else ""
+        yield paper
+
+
+def gen_news(rng, count, deleted_fraction, images):
+    for i in range(count):
+        yield {
+            "title": sentence(rng, 5, 12).rstrip("."),
+            "content": paragraph(rng, rng.randint(4, 15)),
+            "image_url": rng.choice(images) if images and rng.random() < 0.8 else None,
+            "hyperlink": f"https://example.org/news/{i}" if rng.random() < 0.5 else "",
+            "publish_date": EPOCH - timedelta(days=i // 3),
+            "order": (i + 1) * ORDER_KEY_GAP,
+            "is_open": rng.random() < 0.5,
+            "is_deleted": rng.random() < deleted_fraction,
+            **timestamps(rng, i),
+        }
+
+
+def gen_team(rng, count, deleted_fraction, images):
+    categories = [c.value for c in TeamCategory]
+    for i in range(count):
+        first, last = person(rng)
+        yield {
+            "name": f"{first} {last}",
+            "category": rng.choice(categories),
+            "role": words(rng, 1, 3)[:50],
+            "designation": words(rng, 2, 4)[:50],
+            "description": paragraph(rng, rng.randint(2, 6)),
+            "image_url": rng.choice(images) if images else None,
+            "hyperlink": f"https://example.org/people/{i}",
+            "order": (i + 1) * ORDER_KEY_GAP,
+            "is_deleted": rng.random() < deleted_fraction,
+            **timestamps(rng, i),
+        }
+
+
+def gen_gallery(rng, count, deleted_fraction, images):
+    categories = [c.value for c in LabGalleryCategory]
+    statuses = [s.value for s in LabGalleryStatus]
+    for i in range(count):
+        yield {
+            "title": sentence(rng, 3, 8).rstrip("."),
+            "content": paragraph(rng, rng.randint(2, 6)),
+            "image_url": rng.choice(images) if images else "",
+            "order": (i + 1) * ORDER_KEY_GAP,
+            "category": rng.choice(categories),
+            "date": (EPOCH - timedelta(days=i)).strftime("%Y-%m-%d"),
+            "location": rng.choice(LOCATIONS),
+            "participant": " ".join(person(rng)),
+            "status": rng.choice(statuses),
+            "is_deleted": rng.random() < deleted_fraction,
+            **timestamps(rng, i),
+        }
+
+
+def gen_jobs(rng, count, deleted_fraction):
+    for i in range(count):
+        yield {
+            "title": sentence(rng, 2, 5).rstrip("."),
+            "job_type": rng.choice(list(JobTypeEnum)),
+            "location": rng.choice(LOCATIONS),
+            "description": paragraph(rng, rng.randint(6, 14)),
+            "status": rng.choices(list(JobStatusEnum), weights=[6, 3, 1])[0],
+            "funded_by": rng.choice(["NIH", "NCI", "Internal", None]),
+            "visa_type": rng.choice(["J-1", "H-1B", None]),
+            "job_tenure": rng.choice(["1 year", "2 years", "Permanent"]),
+            "required_qualifications": paragraph(rng, 3),
+            "preferred_qualifications": paragraph(rng, 2),
+            "order": (i + 1) * ORDER_KEY_GAP,
+            "is_deleted": rng.random() < deleted_fraction,
+            **timestamps(rng, i),
+        }
+
+
+def gen_applicants(rng, count, deleted_fraction, job_ids):
+    for i in range(count):
+        first, last = person(rng)
+        job_id = rng.choice(job_ids)
+        cv_dir = settings.CV_UPLOAD_DIR / str(job_id)
+        cv_dir.mkdir(parents=True, exist_ok=True)
+        cv_path = cv_dir / f"synthetic_{i:06d}.pdf"
+        cv_path.write_bytes(pdf_bytes(rng, f"{first} {last}"))
+        yield {
+            "job_id": job_id,
+            "full_name": f"{first} {last}",
+            "email": f"{first}.{last}.{i}@example.com".lower(),
+            "phone": f"+1-480-{rng.randint(200, 999)}-{rng.randint(1000, 9999)}",
+            "cover_letter": paragraph(rng, rng.randint(3, 12)),
+            "cv_file_path": str(cv_path),
+            "is_deleted": rng.random() < deleted_fraction,
+            **timestamps(rng, i),
+        }
+
+
+def gen_inquiries(rng, count, deleted_fraction):
+    subjects = [s.value for s in ContactSubjectEnum]
+    for i in range(count):
+        first, last = person(rng)
+        yield {
+            "first_name": first,
+            "last_name": last,
+            "email": f"{first}.{last}.{i}@example.com".lower(),
+            "phone_number": f"480{rng.randint(1000000, 9999999)}",
+            "subject": rng.choice(subjects),
+            "message": paragraph(rng, rng.randint(1, 8)),
+            # Contact forms attract spam, so a larger share is deleted
+            "is_deleted": rng.random() < deleted_fraction * 4,
+            **timestamps(rng, i),
+        }
+
+
+def gen_users(rng, count, password_hash):
+    for i in range(count):
+        first, last = person(rng)
+        yield {
+            "first_name": first,
+            "last_name": last,
+            "primary_email": f"synthetic.user.{i}@example.com",
+            "hashed_password": password_hash,
+            "role": UserRole.USER,
+            "is_deleted": False,
+            **timestamps(rng, i),
+        }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiply every volume, e.g. 0.01 for a quick run")
+    for name, default in DEFAULT_VOLUMES.items():
+        parser.add_argument(f"--{name.replace('_', '-')}", type=int, default=default)
+    parser.add_argument("--images", type=int, default=200, help="Distinct dummy image files to write")
+    parser.add_argument("--deleted-fraction", type=float, default=0.05, help="Share of soft-deleted rows")
+    parser.add_argument("--batch-size", type=int, default=2000)
+    parser.add_argument("--admin-email", default="admin@example.com")
+    parser.add_argument("--admin-password", default="admin")
+    parser.add_argument("--create-tables", action="store_true", help="Run metadata.create_all first (SQLite dev databases)")
+    args = parser.parse_args()
+
+    volumes = {name: int(getattr(args, name) * args.scale) for name in DEFAULT_VOLUMES}
+
+    def stream(name: str) -> random.Random:
+        return random.Random(f"{args.seed}:{name}")
+
+    if args.create_tables:
+        Base.metadata.create_all(engine)
+
+    started = time.perf_counter()
+    images = write_images(stream("images"), args.images)
+    print(f"images: {len(images)} files in {settings.IMAGES_UPLOAD_DIR}")
+
+    password_hash = get_password_hash(args.admin_password)
+    with SessionLocal() as db:
+        reconcile_image_catalog(db)
+
+        if not db.scalar(select(User.id).where(User.primary_email == args.admin_email)):
+            db.add(User(
+                first_name="Synthetic",
+                last_name="Admin",
+                primary_email=args.admin_email,
+                hashed_password=password_hash,
+                role=UserRole.ADMIN
+            ))
+            db.commit()
+
+        plan = [
+            ("users", User, lambda rng, n: gen_users(rng, n, password_hash)),
+            ("papers", Paper, lambda rng, n: gen_papers(rng, n, args.deleted_fraction)),
+            ("feature_publications", FeaturePublication,
+             lambda rng, n: gen_feature_publications(rng, n, args.deleted_fraction, images)),
+            ("news", News, lambda rng, n: gen_news(rng, n, args.deleted_fraction, images)),
+            ("team", TeamMember, lambda rng, n: gen_team(rng, n, args.deleted_fraction, images)),
+            ("gallery", LabGallery, lambda rng, n: gen_gallery(rng, n, args.deleted_fraction, images)),
+            ("jobs", Job, lambda rng, n: gen_jobs(rng, n, args.deleted_fraction)),
+            ("inquiries", ContactInquiry, lambda rng, n: gen_inquiries(rng, n, args.deleted_fraction)),
+        ]
+        for name, model, generate in plan:
+            start = time.perf_counter()
+            count = bulk_insert(db, model, generate(stream(name), volumes[name]), args.batch_size)
+            print(f"{name}: {count} rows in {time.perf_counter() - start:.1f}s")
+
+        job_ids = list(db.scalars(select(Job.id).order_by(Job.id)).all())
+        if job_ids and volumes["applicants"]:
+            start = time.perf_counter()
+            count = bulk_insert(
+                db, JobApplicant,
+                gen_applicants(stream("applicants"), volumes["applicants"], args.deleted_fraction, job_ids),
+                args.batch_size
+            )
+            print(f"applicants: {count} rows (+ CV files in {settings.CV_UPLOAD_DIR}) in {time.perf_counter() - start:.1f}s")
+
+    print(f"done in {time.perf_counter() - started:.1f}s; admin login: {args.admin_email} / {args.admin_password}")
+
+
+if __name__ == "__main__":
+    main()